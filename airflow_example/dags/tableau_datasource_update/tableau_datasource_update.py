@@ -370,8 +370,8 @@ class TableauDatasourceTasks(models.BaseOperator):
                 # Check the column for updates
                 tds_column: Column = tds.columns.get(column.name)
                 column_diffs: dict = self.__get_column_diffs(tds_column, column)
-                tds_folder: Folder = tds.folders_common.get(column.folder_name)
-                not_in_folder: bool = tds_folder is None or tds_folder.folder_item.get(column.name) is None
+                tds_folders: list[Folder] = tds.folders_common.folders_of(column.name)
+                not_in_folder: bool = not any(f.name == column.folder_name for f in tds_folders)
                 if not tds_column:
                     self.__add_task(dsid, action='add_column', action_attrs=column.dict())
                 elif column_diffs or not_in_folder or column_needs_mapping:
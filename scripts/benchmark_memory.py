@@ -0,0 +1,123 @@
+""" Measures the memory used by the file objects of a fully loaded Datasource.
+
+Usage:
+    python scripts/benchmark_memory.py [datasource.tdsx] [--records 20000]
+
+Without a datasource, one is generated from the test datasource,
+with --records metadata records, columns, mapping cols, and folder items.
+Run it before and after a change to the tableau_file_objects, to compare the memory used.
+"""
+import argparse
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+import xml.etree.ElementTree as ET
+from zipfile import ZipFile
+
+from tableau_utilities import Datasource
+
+TEST_DATASOURCE = os.path.join(os.path.dirname(__file__), '..', 'tableau_utilities', 'resources',
+                               'test_data_source.tdsx')
+
+
+def generate_datasource(path, records):
+    """ Writes a copy of the test datasource, with the number of metadata records, columns, etc
+
+    Args:
+        path (str): The path to write the datasource to
+        records (int): The number of metadata records, columns, mapping cols, and folder items to add
+    """
+    with ZipFile(TEST_DATASOURCE) as source, ZipFile(path, 'w') as target:
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename.endswith('.tds'):
+                root = ET.fromstring(data)
+                connections = [root.find('connection'), root.find('extract/connection')]
+                for connection in connections:
+                    metadata_records = connection.find('metadata-records')
+                    cols = connection.find('cols')
+                    if cols is None:
+                        cols = ET.SubElement(connection, 'cols')
+                    for i in range(records):
+                        record = ET.SubElement(metadata_records, 'metadata-record', {'class': 'column'})
+                        for tag, text in [('remote-name', f'COLUMN_{i}'), ('remote-type', '129'),
+                                          ('local-name', f'[COLUMN_{i}]'), ('parent-name', '[Custom SQL Query]'),
+                                          ('remote-alias', f'COLUMN_{i}'), ('ordinal', str(i)),
+                                          ('local-type', 'string'), ('aggregation', 'Count'),
+                                          ('width', '16777216'), ('contains-null', 'true')]:
+                            ET.SubElement(record, tag).text = text
+                        ET.SubElement(cols, 'map', {'key': f'[COLUMN_{i}]', 'value': f'[Custom SQL Query].[COLUMN_{i}]'})
+                folder = root.find('_.fcp.SchemaViewerObjectModel.true...folders-common/folder')
+                position = list(root).index(root.findall('column')[-1]) + 1
+                for i in range(records):
+                    column = ET.Element('column', {
+                        'caption': f'Column {i}', 'datatype': 'string', 'name': f'[COLUMN_{i}]',
+                        'role': 'dimension', 'type': 'nominal'
+                    })
+                    ET.SubElement(column, 'desc')
+                    root.insert(position + i, column)
+                    ET.SubElement(folder, 'folder-item', {'name': f'[COLUMN_{i}]', 'type': 'field'})
+                data = ET.tostring(root, encoding='utf-8', xml_declaration=True)
+            target.writestr(info, data)
+
+
+def instance_size(obj):
+    """ Returns: The size of a FileObject instance in bytes, including its __dict__ if it has one """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the memory used by the file objects of a Datasource')
+    parser.add_argument('file_path', nargs='?', help='A tds or tdsx; generated if not provided')
+    parser.add_argument('--records', type=int, default=20000,
+                        help='The number of metadata records, columns, etc, of a generated datasource')
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        file_path = args.file_path
+        if not file_path:
+            file_path = os.path.join(temp_dir, 'benchmark.tdsx')
+            generate_datasource(file_path, args.records)
+        datasource = Datasource(file_path)
+        # Parse the XML first, so only the file objects are measured
+        datasource._root
+        gc.collect()
+        tracemalloc.start()
+        start, _ = tracemalloc.get_traced_memory()
+        sections = list(datasource.sections())
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f'File objects: {(current - start) / 1024 ** 2:.1f} MB (peak {(peak - start) / 1024 ** 2:.1f} MB)')
+        samples = {
+            'Column': datasource.columns[-1],
+            'MetadataRecord': datasource.connection.metadata_records[-1],
+            'MappingCol': datasource.connection.cols[-1],
+            'FolderItem': datasource.folders_common.folder[0].folder_item[-1],
+        }
+        counts = {
+            'Column': len(datasource.columns),
+            'MetadataRecord': len(datasource.connection.metadata_records) + len(
+                datasource.extract.connection.metadata_records if datasource.extract else []),
+            'MappingCol': len(datasource.connection.cols) + len(
+                datasource.extract.connection.cols if datasource.extract else []),
+            'FolderItem': sum(len(f.folder_item) for f in datasource.folders_common.folder),
+        }
+        for name, obj in samples.items():
+            print(f'  {name}: {counts[name]} x {instance_size(obj)} bytes per instance'
+                  f'{"" if hasattr(obj, "__dict__") else " (slotted)"}')
+        del sections
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -19,6 +19,7 @@ setup(
         'tableau_utilities.general',
         'tableau_utilities.tableau_file',
         'tableau_utilities.tableau_server',
+        'tableau_utilities.tableau_server.aio',
         'tableau_utilities.hyper',
         'tableau_utilities.scripts',
     ],
@@ -31,7 +32,8 @@ setup(
         'pandas>=2.0.0,<3.0.0',
         'tabulate>=0.8.9,<1.0.0',
     ],
-    extras_require={"hyper": ['tableauhyperapi<1.0.0']},
+    extras_require={"hyper": ['tableauhyperapi<1.0.0'], "lxml": ['lxml>=4.9.0'], "arrow": ['pyarrow>=10.0.0'],
+                    "async": ['aiohttp>=3.8']},
     entry_points={
         'console_scripts': [
             'tableau_utilities = tableau_utilities.scripts.cli:main',
@@ -1,6 +1,12 @@
 from .scripts import cli
-from .tableau_file.tableau_file import TableauFileError, Datasource
+from .tableau_file.tableau_file import TableauFileError, TableauFileSummary, Datasource, Workbook
+from .tableau_file.datasource_cache import DatasourceCache
+from .tableau_file.bulk_load import load_datasources, load_frame, LoadResult
+from .tableau_file.workspace import set_workspace_root
+from .tableau_file.compression import CompressionPolicy, set_compression_policy
 from .tableau_file import tableau_file_objects
 from .tableau_server.static import TableauConnectionError
 from .tableau_server.tableau_server import TableauServer
+from .tableau_server.site_catalog import SiteCatalog
+from .tableau_server.aio import AsyncTableauServer
 from .tableau_server import tableau_server_objects
@@ -3,6 +3,11 @@ Generic Python functions
 """
 import re
 from copy import deepcopy
+from datetime import date, datetime
+from functools import lru_cache
+
+# Values that are never changed in-place, so they aren't copied
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None), date, datetime)
 
 
 def convert_to_snake_case(string):
@@ -46,21 +51,34 @@ def flatten_dict(dictionary, final_dict, prior_key=None):
                 raise KeyError(f'Attempted to flatten: {current_key}, already in {dictionary}')
 
 
-def transform_tableau_object(obj):
+@lru_cache(maxsize=4096)
+def _transform_tableau_key(key):
+    """ Transforms a Tableau item key into an attribute name; memoized, as Tableau items reuse a small set of keys
+
+    Args:
+        key (str): The key, i.e. "@someThing-like...this"
+
+    Returns: The attribute name, i.e. "this"
+    """
+    # Update item keys "@someThing-like...this" to "this"
+    key = re.sub(r'.+\.\.\.', '', key)
+    key = key.replace('ns0_', '').replace('_ns0', '')
+    key = convert_to_snake_case(key)
+    return 'class_name' if key == 'class' else key
+
+
+def transform_tableau_object(obj, copy_values=True):
     """ Transform a Tableau item.
 
     Args:
         obj (dict): The dict Tableau object
+        copy_values (bool): False to use the values as they are, rather than deep copies of them;
+         for dicts that are owned by the caller, i.e. created from XML, and not used elsewhere
     """
     # Transform the item dict
     update = dict()
     for key, value in obj.items():
-        # Update item keys "@someThing-like...this" to "this"
-        key = re.sub(r'.+\.\.\.', '', key)
-        key = key.replace('ns0_', '').replace('_ns0', '')
-        key = convert_to_snake_case(key)
-        if key == 'class':
-            update['class_name'] = value
-        else:
-            update[key] = deepcopy(value)
+        if copy_values and not isinstance(value, _IMMUTABLE_TYPES):
+            value = deepcopy(value)
+        update[_transform_tableau_key(key)] = value
     return update
@@ -5,6 +5,7 @@ from time import time
 
 
 from tableau_utilities.tableau_file.tableau_file import Datasource
+from tableau_utilities.tableau_file.datasource_cache import DatasourceCache
 from tableau_utilities.general.cli_styling import Color, Symbol
 from tableau_utilities.general.config_column_persona import personas
 from tableau_utilities.scripts.datasource import add_metadata_records_as_columns, create_column
@@ -24,6 +25,7 @@ class ApplyConfigs:
         column_config: The column config to apply to the datasource.
         calculated_field_config: The calculated field config to apply to the datasource.
         debugging_logs: True to print debugging logs to the console
+        cache: A DatasourceCache to load the datasource from, if it is unchanged
 
     Returns:
         None
@@ -34,12 +36,14 @@ class ApplyConfigs:
                  datasource_path: str,
                  target_column_config: Dict[str, Any],
                  target_calculated_column_config: Dict[str, Any],
-                 debugging_logs: bool) -> None:
+                 debugging_logs: bool,
+                 cache: DatasourceCache = None) -> None:
         self.datasource_name: str = datasource_name
         self.datasource_path: str = datasource_path
         self.target_column_config: Dict[str, Any] = target_column_config
         self.target_calculated_column_config: Dict[str, Any] = target_calculated_column_config
         self.debugging_logs: bool = debugging_logs
+        self.cache: DatasourceCache = cache
 
 
     def select_matching_datasource_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -194,6 +198,7 @@ class ApplyConfigs:
 
         print(f'{COLOR.fg_cyan}...Applying Changes to {self.datasource_name}...{COLOR.reset}')
 
+        columns_to_enforce = []
         for each_column in columns_list:
             if self.debugging_logs:
                 print(f'{COLOR.fg_yellow}column:{COLOR.reset}{each_column}')
@@ -227,7 +232,9 @@ class ApplyConfigs:
             if self.debugging_logs:
                 print(f'{COLOR.fg_yellow}column:{COLOR.reset}{each_column}')
 
-            datasource.enforce_column(column, remote_name=each_column['remote_name'], folder_name=each_column['folder'])
+            columns_to_enforce.append((column, each_column['folder'], each_column['remote_name']))
+
+        datasource.enforce_columns(columns_to_enforce)
 
         start = time()
         print(f'{COLOR.fg_cyan}...Saving datasource changes...{COLOR.reset}')
@@ -242,7 +249,7 @@ class ApplyConfigs:
         Columns are not removed via this function such as calculated fields that you may want to remove.
         """
 
-        datasource = Datasource(self.datasource_path)
+        datasource = Datasource(self.datasource_path, cache=self.cache)
 
         # Run column init on the datasource to make sure columns aren't hiding in Metadata records
         datasource = add_metadata_records_as_columns(datasource, self.debugging_logs)
@@ -275,6 +282,7 @@ def apply_configs(args):
     target_column_config = read_file(args.column_config)
     target_calculated_column_config = read_file(args.calculated_column_config)
 
-    AC = ApplyConfigs(datasource_name, datasource_path, target_column_config, target_calculated_column_config, debugging_logs)
+    AC = ApplyConfigs(datasource_name, datasource_path, target_column_config, target_calculated_column_config, debugging_logs,
+                      getattr(args, 'cache', None))
 
     AC.apply_config_to_datasource()
@@ -0,0 +1,49 @@
+import json
+from time import time
+
+from tableau_utilities.general.cli_styling import Color, Symbol
+from tableau_utilities.tableau_file.bulk_load import load_datasources
+import tableau_utilities.tableau_file.tableau_file_objects as tfo
+
+
+def projection_to_json(value):
+    """ Converts the projection of a Datasource into values that can be written as JSON
+
+    Args:
+        value (tfo.TableauFileObject|tfo.TableauFileObjects): The columns, metadata records, or connection
+
+    Returns: A dict, or list of dicts, of the FileObject(s)
+    """
+    if isinstance(value, tfo.TableauFileObjects):
+        return [item.dict() for item in value]
+    return value.dict()
+
+
+def bulk_load(args):
+    """ Loads many local datasources across a pool of processes,
+        and writes the columns, metadata records, or connection of each to a JSON file
+    """
+    color = Color()
+    symbol = Symbol()
+
+    start = time()
+    print(f'{color.fg_cyan}...Loading datasources...{color.reset}')
+    results = load_datasources(
+        args.paths, projection=args.projection, max_workers=args.max_workers, cache=getattr(args, 'cache', None)
+    )
+    output = list()
+    for result in results:
+        if result.error:
+            print(f'  {symbol.fail} {color.fg_red}{result.file_path}: {result.error}{color.reset}')
+            output.append({'file_path': result.file_path, 'error': result.error})
+        else:
+            print(f'  {symbol.success} {result.file_path}')
+            output.append({'file_path': result.file_path, args.projection: projection_to_json(result.value)})
+
+    with open(args.output_file, 'w') as outfile:
+        json.dump(output, outfile, default=str)
+
+    errors = len([r for r in results if r.error])
+    print(f'{color.fg_green}{symbol.success}  (Done in {round(time() - start)} sec) '
+          f'Loaded {len(results) - errors} of {len(results)} datasources {symbol.arrow_r} '
+          f'{color.fg_yellow}{args.output_file}{color.reset}')
@@ -6,6 +6,8 @@ import yaml
 import importlib.metadata
 
 import tableau_utilities.tableau_server.tableau_server as ts
+from tableau_utilities.tableau_file.datasource_cache import DatasourceCache
+from tableau_utilities.tableau_file.workspace import set_workspace_root
 
 from tableau_utilities.general.config_column_persona import personas
 from tableau_utilities.general.cli_styling import Color, Symbol, color_print
@@ -16,6 +18,9 @@ from tableau_utilities.scripts.server_operate import server_operate
 from tableau_utilities.scripts.datasource import datasource
 from tableau_utilities.scripts.csv_config import csv_config
 from tableau_utilities.scripts.apply_configs import apply_configs
+from tableau_utilities.scripts.bulk_load import bulk_load
+from tableau_utilities.scripts.datasource_diff import datasource_diff
+from tableau_utilities.tableau_file.bulk_load import PROJECTIONS
 
 __version__ = importlib.metadata.version('tableau_utilities')
 
@@ -66,6 +71,18 @@ group_output_dir.add_argument('-o', '--output_dir', default='tmp_tdsx_and_config
                               help='Specifies the folder to write the datasource and configs to')
 group_output_dir.add_argument('-c', '--clean_dir', action='store_true',
                               help='Deletes the directory, and all files within, before running')
+group_output_dir.add_argument('--workspace_root',
+                              help='The directory temp files are written to while a Tableau file is being changed, '
+                                   'i.e. a tmpfs mount. Defaults to the directory of the Tableau file')
+
+# GROUP: Cache
+group_cache = parser.add_argument_group(
+    'cache', 'Cache parsed datasources on disk, so unchanged files are not parsed again on the next run'
+)
+group_cache.add_argument('--cache_dir', help='The directory to cache parsed datasources in; enables the cache')
+group_cache.add_argument('--cache_max_size', type=int, default=1024,
+                         help='The maximum size of the cache directory in MB; '
+                              'the least recently used datasources are removed beyond it. Default 1024')
 
 # GROUP: File Information
 group_file = parser.add_argument_group(
@@ -212,6 +229,32 @@ parser_config_apply.add_argument('-cc', '--column_config', help='The path to the
 parser_config_apply.add_argument('-ccc', '--calculated_column_config', help='The path to the calculated field config file.')
 parser_config_apply.set_defaults(func=apply_configs)
 
+# BULK LOAD
+parser_bulk_load = subparsers.add_parser(
+    'bulk_load', help='Loads many local datasources in parallel, and writes the columns, metadata records, '
+                      'or connection of each to a JSON file. Files that fail to load are reported, not fatal.')
+parser_bulk_load.add_argument('--paths', nargs='+', required=True,
+                              help='The paths of the tds / tdsx files; glob patterns are expanded, '
+                                   'i.e. "downloads/**/*.tdsx"')
+parser_bulk_load.add_argument('--projection', default='columns', choices=[p for p in PROJECTIONS if p != 'datasource'],
+                              help='The part of each datasource to write. Default columns')
+parser_bulk_load.add_argument('--max_workers', type=int,
+                              help='The maximum number of processes to load datasources with. '
+                                   'Defaults to the number of CPUs')
+parser_bulk_load.add_argument('--output_file', default='bulk_load.json',
+                              help='The JSON file to write the loaded datasources to. Default bulk_load.json')
+parser_bulk_load.set_defaults(func=bulk_load)
+
+# DATASOURCE DIFF
+parser_datasource_diff = subparsers.add_parser(
+    'datasource_diff', help='Compares a local datasource (--file_path) with another version of it, '
+                            'and writes the added, removed, and changed items of each section to a JSON file')
+parser_datasource_diff.add_argument('--compare_to', required=True,
+                                    help='The path of the other version of the datasource')
+parser_datasource_diff.add_argument('--output_file', default='datasource_diff.json',
+                                    help='The JSON file to write the differences to. Default datasource_diff.json')
+parser_datasource_diff.set_defaults(func=datasource_diff)
+
 
 def validate_args_server_operate(args):
     """ Validate that combinations of args are present """
@@ -275,6 +318,11 @@ def validate_args_command_merge_config(args):
         parser.error(f'--merge_with {args.merge_with} requires --target_directory')
 
 
+def validate_args_command_datasource_diff(args):
+    if args.file_path is None:
+        parser.error(f'{args.command} requires --file_path for the datasource to compare')
+
+
 def validate_args_command_apply_configs(args):
     if args.file_path is None or args.name is None or args.column_config is None or args.calculated_column_config is None:
         parser.error(f'{args.command} requires --name and --file_path for a datasource and --column_config and --calculated_column_config')
@@ -463,6 +511,15 @@ def main():
     if args.definitions_csv and not os.path.isabs(args.definitions_csv):
         args.definitions_csv = os.path.abspath(args.definitions_csv)
 
+    # Set the datasource cache, if a cache directory was provided
+    args.cache = None
+    if args.cache_dir:
+        args.cache = DatasourceCache(os.path.abspath(args.cache_dir), max_size=args.cache_max_size * 1024 ** 2)
+
+    # Set the directory temp workspaces are created in, if one was provided
+    if args.workspace_root:
+        set_workspace_root(os.path.abspath(args.workspace_root))
+
     # Set absolute path of the target_directory, if it exists and is not already absolute
     if args.command == 'merge_config'  and args.target_directory and not os.path.isabs(args.target_directory):
         args.target_directory = os.path.abspath(args.target_directory)
@@ -487,6 +544,16 @@ def main():
     if args.command == 'apply_configs'  and args.calculated_column_config and not os.path.isabs(args.calculated_column_config):
         args.calculated_column_config = os.path.abspath(args.calculated_column_config)
 
+    # Set absolute paths of the datasources to load, and any glob patterns, if they are not already absolute
+    if args.command == 'bulk_load':
+        args.paths = [os.path.abspath(os.path.expanduser(path)) for path in args.paths]
+
+    # Set absolute paths of the datasources to compare, if they are not already absolute
+    if args.command == 'datasource_diff':
+        args.compare_to = os.path.abspath(args.compare_to)
+        if args.file_path:
+            args.file_path = os.path.abspath(args.file_path)
+
     # Set args from connection group, from settings YAML / Environment Variables, when not provided in the command
     set_datasource_connection_args(args)
 
@@ -503,6 +570,8 @@ def main():
         validate_args_command_merge_config(args)
     if args.command == 'apply_configs':
         validate_args_command_apply_configs(args)
+    if args.command == 'datasource_diff':
+        validate_args_command_datasource_diff(args)
 
     # Set/Reset the directory
     tmp_folder = args.output_dir
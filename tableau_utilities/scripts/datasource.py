@@ -78,14 +78,13 @@ def add_metadata_records_as_columns(ds, debugging_logs=False):
     """
 
     # Create the list of columns to add
-    columns_to_add = [
-        m for m in ds.connection.metadata_records
-        if m.local_name not in [c.name for c in ds.columns]
-    ]
+    column_names = {c.name for c in ds.columns}
+    columns_to_add = [m for m in ds.connection.metadata_records if m.local_name not in column_names]
     print(f'{COLOR.fg_yellow}Adding missing columns from Metadata Records:{COLOR.reset} '
           f'{[m.local_name for m in columns_to_add]}')
 
     # Add the columns making the best guess of the proper persona
+    columns_to_enforce = []
     for m in columns_to_add:
         if debugging_logs:
             print(f'{COLOR.fg_magenta}Metadata Record -> {m.local_name}:{COLOR.reset} {m}')
@@ -99,7 +98,9 @@ def add_metadata_records_as_columns(ds, debugging_logs=False):
 
         if debugging_logs:
             print(f'  - {COLOR.fg_cyan}Creating Column -> {column.name}:{COLOR.reset} {column.dict()}')
-        ds.enforce_column(column, remote_name=m.remote_name)
+        columns_to_enforce.append((column, None, m.remote_name))
+
+    ds.enforce_columns(columns_to_enforce)
 
     return ds
 
@@ -160,7 +161,7 @@ def datasource(args, server=None):
               f'Downloaded Datasource: {COLOR.fg_yellow}{datasource_path}{COLOR.reset}\n')
 
     datasource_file_name = os.path.basename(datasource_path)
-    ds = Datasource(datasource_path)
+    ds = Datasource(datasource_path, cache=getattr(args, 'cache', None))
 
     # Add an empty .hyper file to the Datasource; Useful for publishing without data
     if empty_extract:
@@ -259,7 +260,7 @@ def datasource(args, server=None):
     if delete == 'column':
         ds.columns.delete(column_name)
     if delete == 'folder':
-        ds.folders_common.folder.delete(folder_name)
+        ds.folders_common.delete(folder_name)
 
     # Clean folders
     if clean_folders:
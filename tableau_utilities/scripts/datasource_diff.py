@@ -0,0 +1,33 @@
+import json
+
+from tableau_utilities.general.cli_styling import Color, Symbol
+from tableau_utilities.tableau_file.datasource_diff import FileObjectsDiff
+from tableau_utilities.tableau_file.tableau_file import Datasource
+
+
+def datasource_diff(args):
+    """ Compares two local versions of a datasource, and writes the differences of each section to a JSON file """
+    color = Color()
+    symbol = Symbol()
+
+    datasource = Datasource(args.file_path, cache=getattr(args, 'cache', None))
+    other = Datasource(args.compare_to, cache=getattr(args, 'cache', None))
+    diffs = datasource.diff(other)
+
+    report = {
+        'file_path': datasource.file_path,
+        'compare_to': other.file_path,
+        'sections': {section: diff.dict() for section, diff in diffs.items()},
+    }
+    with open(args.output_file, 'w') as outfile:
+        json.dump(report, outfile, default=str)
+
+    for section, diff in diffs.items():
+        if isinstance(diff, FileObjectsDiff):
+            print(f'  {symbol.arrow_r} {color.fg_yellow}{section}:{color.reset} '
+                  f'{len(diff.added)} added, {len(diff.removed)} removed, {len(diff.changed)} changed')
+        else:
+            print(f'  {symbol.arrow_r} {color.fg_yellow}{section}:{color.reset} '
+                  f'{", ".join(diff.changes)} changed')
+    print(f'{color.fg_green}{symbol.success}  {len(diffs)} section(s) differ {symbol.arrow_r} '
+          f'{color.fg_yellow}{args.output_file}{color.reset}')
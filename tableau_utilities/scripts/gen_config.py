@@ -253,13 +253,8 @@ def build_folder_mapping(folders):
 
     Returns: A dict of column & folder mapping; i.e. {'column1': 'folderA', 'column2': 'folderA'}
     """
-    mappings = dict()
-    for folder in folders:
-        if folder.folder_item:
-            for item in folder.folder_item:
-                field_name = item.name[1:-1]
-                mappings[field_name] = folder.name
-    return mappings
+    # A column in more than one folder is mapped to the last of them
+    return {name[1:-1]: column_folders[-1].name for name, column_folders in folders.column_folders().items()}
 
 
 def build_configs(datasource, datasource_name, debugging_logs=False, definitions_csv_path=None):
@@ -348,7 +343,7 @@ def generate_config(args, server: TableauServer = None):
     print(f'{color.fg_yellow}BUILDING CONFIG {symbol.arrow_r} '
           f'{color.fg_grey}{datasource_name} {symbol.sep} {datasource_path}{color.reset}')
 
-    datasource = Datasource(datasource_path)
+    datasource = Datasource(datasource_path, cache=getattr(args, 'cache', None))
 
     # Run column init on the datasource to make sure columns aren't hiding in Metadata records
     datasource = add_metadata_records_as_columns(datasource, debugging_logs)
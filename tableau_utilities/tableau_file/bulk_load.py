@@ -0,0 +1,139 @@
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+
+import pandas as pd
+
+from tableau_utilities.tableau_file.datasource_frame import FRAME_SECTIONS, arrow_table, section_columns
+from tableau_utilities.tableau_file.tableau_file import Datasource, TableauFileError
+
+
+def _whole_datasource(datasource):
+    """ Returns: The Datasource, with every section built, so the XML doesn't have to be parsed again """
+    list(datasource.sections())
+    return datasource
+
+
+# The parts of a Datasource that load_datasources can return for each file
+PROJECTIONS = {
+    'datasource': _whole_datasource,
+    'columns': lambda datasource: datasource.columns,
+    'metadata_records': lambda datasource: datasource.connection.metadata_records,
+    'connection': lambda datasource: datasource.connection,
+}
+
+
+@dataclass
+class LoadResult:
+    """ The result of loading one file with load_datasources; either the projection of the Datasource, or an error """
+    file_path: str
+    value: object = None
+    error: str = None
+
+
+def expand_paths(paths):
+    """ Expands the glob patterns of the paths, i.e. "downloads/**/*.tdsx"
+
+    Args:
+        paths (str|list[str]): A path or glob pattern, or a list of them
+
+    Returns: The absolute path of each file, in order, without duplicates
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    expanded = dict()
+    for path in paths:
+        path = os.path.expanduser(path)
+        matches = sorted(glob.glob(path, recursive=True)) if any(c in path for c in '*?[') else [path]
+        for match in matches:
+            expanded.setdefault(os.path.abspath(match), None)
+    return list(expanded)
+
+
+def _load(file_path, projection, xml_backend, cache):
+    """ Loads a Datasource, and gets its projection; run in a worker process
+
+    Returns: The LoadResult of the file; errors are returned rather than raised, so they don't abort the batch
+    """
+    try:
+        datasource = Datasource(file_path, xml_backend=xml_backend, cache=cache)
+        project = PROJECTIONS[projection] if isinstance(projection, str) else projection
+        return LoadResult(file_path, value=project(datasource))
+    except Exception as err:
+        return LoadResult(file_path, error=f'{err.__class__.__name__}: {err}')
+
+
+def load_datasources(paths, projection='datasource', max_workers=None, xml_backend='etree', cache=None):
+    """ Loads many Datasources across a pool of processes.
+        Each file is parsed in a worker process, and its projection is pickled back;
+        a Datasource is pickled without its XML, which is only parsed again if it's saved.
+
+    Args:
+        paths (str|list[str]): The paths, or glob patterns, of the tds / tdsx files
+        projection (str|callable): The part of each Datasource to return; one of PROJECTIONS,
+         or a function of a Datasource, defined at the top level of a module so it can be pickled
+        max_workers (int): The maximum number of worker processes; defaults to the number of CPUs.
+         1 loads the files in this process
+        xml_backend (str): The XML library used to parse the files; etree (default) or lxml
+        cache (DatasourceCache|str): A DatasourceCache, or the directory of one, shared by the workers
+
+    Returns: A list of LoadResult, one per file, in the order of the paths
+    """
+    if isinstance(projection, str) and projection not in PROJECTIONS:
+        raise ValueError(f'Projection must be one of {", ".join(PROJECTIONS)}; not {projection}')
+    file_paths = expand_paths(paths)
+    max_workers = min(max_workers or os.cpu_count() or 1, len(file_paths) or 1)
+    if max_workers == 1:
+        return [_load(file_path, projection, xml_backend, cache) for file_path in file_paths]
+
+    results = list()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_load, file_path, projection, xml_backend, cache) for file_path in file_paths]
+        for file_path, future in zip(file_paths, futures):
+            # A result that can't be pickled, or a worker that dies, only fails the files it affects
+            try:
+                results.append(future.result())
+            except Exception as err:
+                results.append(LoadResult(file_path, error=f'{err.__class__.__name__}: {err}'))
+    return results
+
+
+def load_frame(paths, section, max_workers=None, xml_backend='etree', cache=None, arrow=False, errors='raise'):
+    """ Exports a section of many Datasources as one frame, with the file_path of each row as the first column.
+        The files are loaded across a pool of processes, as with load_datasources,
+        and each worker sends back the columns of its file rather than the FileObjects.
+
+    Args:
+        paths (str|list[str]): The paths, or glob patterns, of the tds / tdsx files
+        section (str): The section; one of FRAME_SECTIONS
+        max_workers (int): The maximum number of worker processes; defaults to the number of CPUs
+        xml_backend (str): The XML library used to parse the files; etree (default) or lxml
+        cache (DatasourceCache|str): A DatasourceCache, or the directory of one, shared by the workers
+        arrow (bool): True to return a pyarrow Table, rather than a pandas DataFrame
+        errors (str): raise (default) to raise an error if a file fails to load; ignore to leave its rows out
+
+    Returns: A DataFrame, or Table, with a row per item of the section of each file
+    """
+    if section not in FRAME_SECTIONS:
+        raise ValueError(f'Section must be one of {", ".join(FRAME_SECTIONS)}; not {section}')
+    if errors not in ('raise', 'ignore'):
+        raise ValueError(f'Errors must be raise or ignore; not {errors}')
+    results = load_datasources(
+        paths, projection=partial(section_columns, section=section),
+        max_workers=max_workers, xml_backend=xml_backend, cache=cache
+    )
+    failed = [result for result in results if result.error]
+    if failed and errors == 'raise':
+        raise TableauFileError(f'{len(failed)} file(s) failed to load; {failed[0].file_path}: {failed[0].error}')
+    # The columns of each file are concatenated, then converted once
+    columns = {'file_path': list()}
+    for result in results:
+        if result.error:
+            continue
+        rows = len(next(iter(result.value.values()), ()))
+        columns['file_path'].extend([result.file_path] * rows)
+        for name, values in result.value.items():
+            columns.setdefault(name, list()).extend(values)
+    return arrow_table(columns) if arrow else pd.DataFrame(columns)
@@ -0,0 +1,209 @@
+import copy
+import io
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from zipfile import ZipFile, ZipInfo, ZIP_STORED, ZIP_DEFLATED, ZIP64_LIMIT
+
+# Members larger than this are compressed into a temp file, rather than in memory
+_SPOOL_SIZE = 64 * 1024 * 1024
+# ZipFile has no public API to write a member that's already compressed. Raw members are written with its internals
+# (ZipInfo.FileHeader, and ZipFile.fp, filelist, NameToInfo, start_dir & _didModify) on the Python versions
+# they've been verified with, 3.10 to 3.12; on any other version, members are decompressed and written with the public API
+_RAW_WRITE_VERSIONS = ((3, 10), (3, 13))
+_RAW_WRITE_ATTRIBUTES = ('fp', 'filelist', 'NameToInfo', 'start_dir', '_didModify')
+
+
+@dataclass
+class CompressionPolicy:
+    """
+        How the members of a tdsx / twbx archive are compressed when it's written.
+
+        - compress_type: The compression of members; ZIP_DEFLATED (default), or ZIP_STORED, ZIP_BZIP2, ZIP_LZMA
+        - compresslevel: The level of compression, i.e. 1 (fastest) to 9 (smallest) when deflated; None for the default
+        - stored_extensions: The extensions of members that are already compressed, and are stored as-is;
+          i.e. hyper extracts and images
+        - preserve: True to keep the compression each member already has in the archive;
+          False to recompress members that don't match the policy
+        - max_workers: The maximum number of threads compressing members; 1 compresses them one by one
+    """
+    compress_type: int = ZIP_DEFLATED
+    compresslevel: int = None
+    stored_extensions: tuple = ('hyper', 'tde', 'png', 'jpg', 'jpeg', 'gif', 'zip')
+    preserve: bool = True
+    max_workers: int = None
+
+    def compress_type_of(self, filename, original=None):
+        """ Gets the compression of a member
+
+        Args:
+            filename (str): The name of the member within the archive
+            original (int): The compression the member already has; None for a new member
+
+        Returns: The compress type
+        """
+        if self.preserve and original is not None:
+            return original
+        if filename.split('.')[-1].lower() in self.stored_extensions:
+            return ZIP_STORED
+        return self.compress_type
+
+
+# The policy set with set_compression_policy
+_compression_policy = CompressionPolicy()
+
+
+def set_compression_policy(policy):
+    """ Sets the CompressionPolicy used to write every Tableau archive, that doesn't have a policy of its own
+
+    Args:
+        policy (CompressionPolicy): The policy; None to reset it to the default
+    """
+    global _compression_policy
+    _compression_policy = policy or CompressionPolicy()
+
+
+def compression_policy():
+    """ Returns: The CompressionPolicy used to write Tableau archives """
+    return _compression_policy
+
+
+def compress_member(open_source, info, compress_type, compresslevel=None, directory=None):
+    """ Compresses the contents of a member, ahead of it being written to an archive; so members can be compressed
+        in parallel, by threads, and written in order. zlib, bz2 and lzma release the GIL while compressing.
+        The member is compressed by ZipFile, into a temp archive of its own, and is then written as raw bytes.
+
+    Args:
+        open_source (callable): Opens the uncompressed contents of the member as a binary file
+        info (ZipInfo): The member; its name, date, and attributes are kept
+        compress_type (int): The compression of the member
+        compresslevel (int): The level of compression; None for the default
+        directory (str): The directory of the temp file large members are compressed into
+
+    Returns: A tuple of the ZipInfo of the compressed member, and the file of its compressed contents;
+     the file must be closed once it's written
+    """
+    output = tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE, dir=directory)
+    try:
+        with ZipFile(output, 'w', compression=compress_type, compresslevel=compresslevel) as archive:
+            with open_source() as source, archive.open(info.filename, 'w', force_zip64=True) as f:
+                shutil.copyfileobj(source, f, 1024 * 1024)
+        with ZipFile(output) as archive:
+            compressed = archive.infolist()[0]
+        # Skip past the local file header of the compressed member, to its compressed bytes
+        output.seek(compressed.header_offset + 26)
+        name_length, extra_length = struct.unpack('<HH', output.read(4))
+        output.seek(name_length + extra_length, os.SEEK_CUR)
+    except BaseException:
+        output.close()
+        raise
+    member = copy.copy(info)
+    member.compress_type = compress_type
+    member.extra = strip_zip64_extra(info.extra)
+    # The CRC and sizes are known before the member is written, so no data descriptor is written after the data
+    member.flag_bits = (info.flag_bits & ~0x0A) | (compressed.flag_bits & 0x02)
+    member.CRC = compressed.CRC
+    member.file_size = compressed.file_size
+    member.compress_size = compressed.compress_size
+    return member, output
+
+
+def raw_writes_supported(target=None):
+    """ Checks if members can be written into an archive as bytes that are already compressed; see write_raw_member
+
+    Args:
+        target (ZipFile): The archive opened for writing; None to only check the Python version
+
+    Returns: True if raw members can be written
+    """
+    if not _RAW_WRITE_VERSIONS[0] <= sys.version_info[:2] < _RAW_WRITE_VERSIONS[1]:
+        return False
+    if not callable(getattr(ZipInfo, 'FileHeader', None)):
+        return False
+    return target is None or all(hasattr(target, attr) for attr in _RAW_WRITE_ATTRIBUTES)
+
+
+def write_raw_member(target, member, data):
+    """ Writes a member into an archive, as bytes that are already compressed
+
+    Args:
+        target (ZipFile): The archive opened for writing
+        member (ZipInfo): The member, with its CRC and sizes set
+        data: A binary file positioned at the member's compressed bytes
+    """
+    if not raw_writes_supported(target):
+        raise NotImplementedError(f'Raw members can not be written with Python {sys.version.split()[0]}')
+    member.header_offset = target.fp.tell()
+    zip64 = member.file_size > ZIP64_LIMIT or member.compress_size > ZIP64_LIMIT
+    target.fp.write(member.FileHeader(zip64))
+    remaining = member.compress_size
+    while remaining > 0:
+        chunk = data.read(min(remaining, 1024 * 1024))
+        if not chunk:
+            raise EOFError(f'Unexpected end of data while writing {member.filename}')
+        target.fp.write(chunk)
+        remaining -= len(chunk)
+    # Register the member, so it is written to the central directory when the target is closed
+    target.filelist.append(member)
+    target.NameToInfo[member.filename] = member
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+
+def write_archive(path, files, policy=None, compress_types=None):
+    """ Writes files into a new archive, compressing them in parallel
+
+    Args:
+        path (str): The path of the archive
+        files (list[tuple[str, str]]): The path of each file, and its name within the archive
+        policy (CompressionPolicy): How the files are compressed; defaults to the policy set with set_compression_policy
+        compress_types (dict): The compression each member already had, by its name within the archive;
+         kept when the policy preserves compression
+    """
+    policy = policy or compression_policy()
+    compress_types = compress_types or dict()
+    directory = os.path.dirname(os.path.abspath(path))
+    if not raw_writes_supported():
+        with ZipFile(path, 'w') as target:
+            for file_path, arcname in files:
+                compress_type = policy.compress_type_of(arcname, compress_types.get(arcname))
+                target.write(file_path, arcname, compress_type, policy.compresslevel)
+        return None
+    with ThreadPoolExecutor(max_workers=policy.max_workers) as executor, ZipFile(path, 'w') as target:
+        futures = list()
+        for file_path, arcname in files:
+            info = ZipInfo.from_file(file_path, arcname=arcname)
+            if info.is_dir():
+                futures.append(executor.submit(compress_member, io.BytesIO, info, ZIP_STORED))
+                continue
+            compress_type = policy.compress_type_of(info.filename, compress_types.get(info.filename))
+            futures.append(executor.submit(
+                compress_member, lambda p=file_path: open(p, 'rb'), info, compress_type, policy.compresslevel, directory
+            ))
+        # Members are written in order, as each is compressed
+        for future in futures:
+            member, data = future.result()
+            with data:
+                write_raw_member(target, member, data)
+
+
+def strip_zip64_extra(extra):
+    """ Removes the ZIP64 field from a ZipInfo's extra data; ZipFile adds its own when the member is written
+
+    Args:
+        extra (bytes): The extra data of a ZipInfo
+
+    Returns: The extra data without a ZIP64 field
+    """
+    stripped = b''
+    i = 0
+    while i + 4 <= len(extra):
+        header_id, size = struct.unpack('<HH', extra[i:i + 4])
+        if header_id != 1:
+            stripped += extra[i:i + 4 + size]
+        i += 4 + size
+    return stripped
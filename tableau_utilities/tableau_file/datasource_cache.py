@@ -0,0 +1,154 @@
+import hashlib
+import importlib.metadata
+import os
+import pickle
+import sys
+import tempfile
+from zipfile import ZipFile
+
+# Incremented when the format of cached Datasources changes, so older entries are no longer used
+CACHE_VERSION = 3
+# The default maximum size of a cache directory; 1 GiB
+DEFAULT_MAX_SIZE = 1024 ** 3
+
+
+def _package_version():
+    """ Returns: The installed version of tableau_utilities, which cached FileObjects are only valid for """
+    try:
+        return importlib.metadata.version('tableau_utilities')
+    except importlib.metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+class DatasourceCache:
+    """
+        An on-disk cache of parsed Datasources, so an unchanged file doesn't have to be parsed again.
+        Each section of a Datasource is a separate entry, cached when the section is first built;
+        keyed by the content of the TDS (the CRC and size of the TDS in a TDSX, or a hash of a TDS file) and the section.
+        The least recently used entries are removed once the directory is larger than max_size.
+
+        Entries are pickled; only point the cache at a directory that you trust.
+    """
+    SUFFIX = '.pickle'
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        """
+        Args:
+            directory (str): The directory the cached Datasources are written to; created if it doesn't exist
+            max_size (int): The maximum size of the directory in bytes
+        """
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(file_path):
+        """ Gets the cache key of a Tableau file, from the content of its TDS.
+            For a TDSX, the CRC and size of the archived TDS are read from the archive without decompressing it.
+
+        Args:
+            file_path (str): Path to a Tableau Datasource file; tds or tdsx
+
+        Returns: The cache key
+        """
+        digest = hashlib.sha256(f'{CACHE_VERSION}:{_package_version()}:{sys.version_info[:2]}'.encode())
+        infos = list()
+        if file_path.split('.')[-1] == 'tdsx':
+            with ZipFile(file_path) as zip_file:
+                infos = [z for z in zip_file.filelist if z.filename.split('.')[-1] == 'tds']
+        if infos:
+            # The last TDS in the archive is the one a Datasource is parsed from
+            digest.update(f':{infos[-1].filename}:{infos[-1].CRC}:{infos[-1].file_size}'.encode())
+        else:
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 ** 2), b''):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def section_key(key, section):
+        """ Gets the cache key of a section of a Tableau file
+
+        Args:
+            key (str): The cache key of the file
+            section (str): The attribute name of the section, i.e. columns
+
+        Returns: The cache key
+        """
+        return f'{key}-{section}'
+
+    def __path(self, key):
+        return os.path.join(self.directory, f'{key}{self.SUFFIX}')
+
+    def get(self, key):
+        """ Gets a cached entry, and marks it as recently used
+
+        Args:
+            key (str): The cache key
+
+        Returns: The cached entry, or None if it's not cached
+        """
+        path = self.__path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # An incomplete or incompatible entry is treated as a miss, and removed
+            self.__remove(path)
+            return None
+        # The modified time of an entry is when it was last used
+        os.utime(path)
+        return entry
+
+    def put(self, key, entry):
+        """ Caches an entry, then removes the least recently used entries if the cache is too large
+
+        Args:
+            key (str): The cache key
+            entry: The entry to cache; must be picklable
+        """
+        fd, temp_path = tempfile.mkstemp(prefix='__tmp_', suffix=self.SUFFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Entries are replaced atomically, so a concurrent get never reads a partially written entry
+            os.replace(temp_path, self.__path(key))
+        except BaseException:
+            self.__remove(temp_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """ Removes the least recently used entries, until the cache is no larger than max_size
+
+        Returns: The paths of the removed entries
+        """
+        entries = list()
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SUFFIX) and not entry.name.startswith('__tmp_') and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        removed = list()
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            self.__remove(path)
+            total -= size
+            removed.append(path)
+        return removed
+
+    def clear(self):
+        """ Removes every entry from the cache """
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SUFFIX) and entry.is_file():
+                self.__remove(entry.path)
+
+    @staticmethod
+    def __remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,174 @@
+from dataclasses import dataclass, field, fields
+
+import tableau_utilities.tableau_file.tableau_file_objects as tfo
+
+# FileObject class -> the names of the fields compared between two of its FileObjects
+_COMPARED_FIELDS = dict()
+
+
+def _compared_fields(cls):
+    """ Returns: The names of the fields of a FileObject class that are compared; all fields except the tag """
+    if cls not in _COMPARED_FIELDS:
+        _COMPARED_FIELDS[cls] = tuple(f.name for f in fields(cls) if f.name != 'tag')
+    return _COMPARED_FIELDS[cls]
+
+
+def _plain(value):
+    """ Returns: The value, with any FileObjects within it converted into the dicts they are written to XML as """
+    if isinstance(value, tfo.TableauFileObject):
+        return value.dict()
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    return value
+
+
+def _signature(item):
+    """ Returns: A string that two FileObjects only share if they are written as the same XML """
+    return repr(_plain(item))
+
+
+@dataclass
+class FileObjectDiff:
+    """ The attribute-level differences between two versions of a FileObject.
+        Changes are the (old, new) values of each attribute that differs;
+        or a FileObjectDiff / FileObjectsDiff for attributes that are FileObjects themselves.
+    """
+    changes: dict = field(default_factory=dict)
+
+    def __bool__(self):
+        return bool(self.changes)
+
+    def dict(self):
+        """ Returns: The differences as a dict that can be written as JSON """
+        output = dict()
+        for attr, change in self.changes.items():
+            if isinstance(change, (FileObjectDiff, FileObjectsDiff)):
+                output[attr] = change.dict()
+            else:
+                output[attr] = {'old': _plain(change[0]), 'new': _plain(change[1])}
+        return output
+
+
+@dataclass
+class FileObjectsDiff:
+    """ The differences between two versions of a list of FileObjects, with items matched by their key;
+        i.e. Column.name, or MetadataRecord.remote_name.
+        Changed items are the FileObjectDiff of each key whose item differs;
+        when several items share a key, the nth of them after the first is keyed by (key, n).
+    """
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    changed: dict = field(default_factory=dict)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def dict(self):
+        """ Returns: The differences as a dict that can be written as JSON """
+        return {
+            'added': [_plain(item) for item in self.added],
+            'removed': [_plain(item) for item in self.removed],
+            'changed': {_changed_name(key): diff.dict() for key, diff in self.changed.items()},
+        }
+
+
+def diff_file_objects(old, new):
+    """ Compares two versions of a FileObject, attribute by attribute
+
+    Args:
+        old (tfo.TableauFileObject): The FileObject
+        new (tfo.TableauFileObject): The other version of the FileObject, of the same class
+
+    Returns: The FileObjectDiff; empty if they are the same
+    """
+    diff = FileObjectDiff()
+    for name in _compared_fields(type(old)):
+        old_value, new_value = getattr(old, name), getattr(new, name)
+        if isinstance(old_value, tfo.TableauFileObjects) and isinstance(new_value, tfo.TableauFileObjects):
+            change = diff_file_object_lists(old_value, new_value)
+        elif (isinstance(old_value, tfo.TableauFileObject) and isinstance(new_value, tfo.TableauFileObject)
+              and type(old_value) is type(new_value)):
+            change = diff_file_objects(old_value, new_value) if _signature(old_value) != _signature(new_value) else None
+        elif _plain(old_value) != _plain(new_value):
+            change = (old_value, new_value)
+        else:
+            change = None
+        if change:
+            diff.changes[name] = change
+    return diff
+
+
+def diff_file_object_lists(old, new):
+    """ Compares two versions of a list of FileObjects, in linear time.
+        Items are matched by their key, the nth item with a key in one list to the nth with that key in the other;
+        items of a class without a key are matched when they are the same.
+
+    Args:
+        old (list[tfo.TableauFileObject]): The FileObjects
+        new (list[tfo.TableauFileObject]): The other version of the FileObjects
+
+    Returns: The FileObjectsDiff; empty if the lists have the same items
+    """
+    diff = FileObjectsDiff()
+    old_signatures = [_signature(item) for item in old]
+    new_signatures = [_signature(item) for item in new]
+    # Identical lists are skipped, without matching their items
+    if old_signatures == new_signatures:
+        return diff
+    # Key -> the items with that key, and their signatures, in reverse order
+    new_items = dict()
+    for item, signature in zip(new, new_signatures):
+        new_items.setdefault(_match_key(item, signature), []).append((item, signature))
+    for matches in new_items.values():
+        matches.reverse()
+    # Key -> the number of items with that key so far
+    occurrences = dict()
+    for item, signature in zip(old, old_signatures):
+        key = _match_key(item, signature)
+        occurrence = occurrences.get(key, 0)
+        occurrences[key] = occurrence + 1
+        matches = new_items.get(key)
+        if not matches:
+            diff.removed.append(item)
+            continue
+        new_item, new_signature = matches.pop()
+        if new_signature != signature:
+            diff.changed[key if occurrence == 0 else (key, occurrence)] = diff_file_objects(item, new_item)
+    for matches in new_items.values():
+        diff.added.extend(item for item, _ in reversed(matches))
+    return diff
+
+
+def _changed_name(key):
+    """ Returns: The name of a changed item in the JSON of a diff; the key, then the occurrence for duplicate keys """
+    if isinstance(key, tuple):
+        return f'{key[0]} ({key[1]})'
+    return str(key)
+
+
+def _match_key(item, signature):
+    """ Returns: The key two versions of an item are matched by; its signature if its class has no key """
+    key = type(item)._lookup_key(item) if isinstance(item, tfo.TableauFileObject) else None
+    return signature if key is None else key
+
+
+def diff_sections(old, new):
+    """ Compares two versions of a Datasource section.
+        The sections are compared as a whole first, so identical sections are skipped without comparing their items.
+
+    Args:
+        old (tfo.TableauFileObject|tfo.TableauFileObjects): The section
+        new (tfo.TableauFileObject|tfo.TableauFileObjects): The other version of the section
+
+    Returns: The FileObjectDiff of a section of one FileObject, or FileObjectsDiff of a list; empty if they're the same
+    """
+    if isinstance(old, tfo.TableauFileObject) and isinstance(new, tfo.TableauFileObject) and type(old) is type(new):
+        if _signature(old) == _signature(new):
+            return FileObjectDiff()
+        return diff_file_objects(old, new)
+    # A section is a list when its element is repeated in either version
+    old = old if isinstance(old, list) else [old] if old else []
+    new = new if isinstance(new, list) else [new] if new else []
+    return diff_file_object_lists(old, new)
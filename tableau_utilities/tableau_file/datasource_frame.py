@@ -0,0 +1,109 @@
+from dataclasses import fields
+from operator import attrgetter
+
+import pandas as pd
+
+import tableau_utilities.tableau_file.tableau_file_objects as tfo
+
+# The sections of a Datasource that can be exported as a frame
+FRAME_SECTIONS = ('columns', 'metadata_records', 'folders', 'mapping_cols', 'connections')
+
+# FileObject class -> the names of its fields that are exported; all fields except the tag and nested values
+_FRAME_FIELDS = dict()
+
+
+def _frame_fields(cls):
+    """ Returns: The names of the fields of a FileObject class that are exported as columns of a frame """
+    if cls not in _FRAME_FIELDS:
+        nested = set(cls._tracked_fields())
+        _FRAME_FIELDS[cls] = tuple(f.name for f in fields(cls) if f.name != 'tag' and f.name not in nested)
+    return _FRAME_FIELDS[cls]
+
+
+def _attribute_columns(items, cls):
+    """ Gets the values of each field of the items, field by field, without converting each item into a dict
+
+    Args:
+        items (list[tfo.TableauFileObject]): The FileObjects
+        cls (type): The class of the FileObjects
+
+    Returns: A dict of column name -> the value of each item
+    """
+    return {name: list(map(attrgetter(name), items)) for name in _frame_fields(cls)}
+
+
+def section_columns(datasource, section):
+    """ Gets a section of a Datasource as columns; one row per item of the section.
+
+        - columns: One row per column
+        - metadata_records: One row per metadata record of the connection
+        - folders: One row per folder-item; the folder_name and folder_role columns are of its folder.
+          A folder without folder-items has a row, with no name
+        - mapping_cols: One row per mapping col of the connection
+        - connections: One row per named connection, with the attributes of its connection
+
+    Args:
+        datasource (Datasource): The Datasource
+        section (str): The section; one of FRAME_SECTIONS
+
+    Returns: A dict of column name -> the value of each row
+    """
+    if section == 'columns':
+        return _attribute_columns(datasource.columns, tfo.Column)
+    if section == 'metadata_records':
+        return _attribute_columns(datasource.connection.metadata_records, tfo.MetadataRecord)
+    if section == 'mapping_cols':
+        return _attribute_columns(datasource.connection.cols, tfo.MappingCol)
+    if section == 'folders':
+        folders, folder_items = list(), list()
+        for folder in datasource.folders_common.folder:
+            for folder_item in folder.folder_item or [None]:
+                folders.append(folder)
+                folder_items.append(folder_item)
+        columns = {
+            'folder_name': [folder.name for folder in folders],
+            'folder_role': [folder.role for folder in folders],
+        }
+        for name in _frame_fields(tfo.FolderItem):
+            columns[name] = [getattr(item, name) if item else None for item in folder_items]
+        return columns
+    if section == 'connections':
+        named_connections = datasource.connection.named_connections
+        columns = _attribute_columns(named_connections, tfo.NamedConnection)
+        connections = [nc.connection or tfo.Connection() for nc in named_connections]
+        columns.update(_attribute_columns(connections, tfo.Connection))
+        return columns
+    raise ValueError(f'Section must be one of {", ".join(FRAME_SECTIONS)}; not {section}')
+
+
+def arrow_table(columns):
+    """ Returns: A pyarrow Table of the columns; pyarrow is an optional dependency """
+    try:
+        import pyarrow as pa
+    except ImportError as err:
+        raise ImportError('Exporting Arrow tables requires pyarrow: pip install tableau-utilities[arrow]') from err
+    return pa.Table.from_pydict(columns)
+
+
+def to_frame(datasource, section):
+    """ Exports a section of a Datasource as a pandas DataFrame, built column by column; see section_columns
+
+    Args:
+        datasource (Datasource): The Datasource
+        section (str): The section; one of FRAME_SECTIONS
+
+    Returns: A DataFrame with a row per item of the section
+    """
+    return pd.DataFrame(section_columns(datasource, section))
+
+
+def to_arrow(datasource, section):
+    """ Exports a section of a Datasource as a pyarrow Table, built column by column; see section_columns
+
+    Args:
+        datasource (Datasource): The Datasource
+        section (str): The section; one of FRAME_SECTIONS
+
+    Returns: A Table with a row per item of the section
+    """
+    return arrow_table(section_columns(datasource, section))
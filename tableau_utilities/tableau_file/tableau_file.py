@@ -1,12 +1,32 @@
+import copy
+import io
 import logging
 import xml.etree.ElementTree as ET
 import os
 import shutil
-import xmltodict
-from zipfile import ZipFile
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from zipfile import ZipFile, ZipInfo, ZIP64_LIMIT
 
 import tableau_utilities.tableau_file.tableau_file_objects as tfo
-from tableau_utilities.general.funcs import transform_tableau_object
+from tableau_utilities.tableau_file.compression import (
+    compression_policy, compress_member, raw_writes_supported, write_raw_member, strip_zip64_extra
+)
+from tableau_utilities.tableau_file.datasource_cache import DatasourceCache
+from tableau_utilities.tableau_file.datasource_diff import diff_sections
+from tableau_utilities.tableau_file.datasource_frame import to_frame, to_arrow
+from tableau_utilities.tableau_file.workspace import temp_workspace, replace_file
+
+
+# The XML libraries a TableauFile can be parsed and written with
+XML_BACKENDS = ('etree', 'lxml')
+# The sections TableauFile.probe can collect
+PROBE_SECTIONS = ('connection', 'columns', 'folders_common', 'extract')
 
 
 class TableauFileError(Exception):
@@ -16,25 +36,183 @@ class TableauFileError(Exception):
         self.message = message
 
 
+def _xml_module(xml_backend):
+    """ Gets the module of an XML backend; lxml is an optional dependency
+
+    Args:
+        xml_backend (str): The name of the XML backend; etree or lxml
+
+    Returns: The xml.etree.ElementTree or lxml.etree module
+    """
+    if xml_backend == 'etree':
+        return ET
+    if xml_backend == 'lxml':
+        try:
+            from lxml import etree
+        except ImportError as err:
+            raise TableauFileError(
+                'The lxml XML backend requires lxml: pip install tableau-utilities[lxml]'
+            ) from err
+        return etree
+    raise TableauFileError(f'XML backend must be one of {", ".join(XML_BACKENDS)}; not {xml_backend}')
+
+
+def _is_section_tag(tag, section_tag):
+    """ Returns: True if an element with the tag belongs to the datasource section with the section_tag """
+    return (
+        tag.endswith(f'true...{section_tag}')
+        or tag == section_tag
+        or (tag.startswith(f'layout _.fcp.SchemaViewerObjectModel.false...') and section_tag == 'layout')
+    )
+
+
+@dataclass
+class TableauFileSummary:
+    """
+        A lightweight summary of a Tableau file, collected by TableauFile.probe without loading the whole file.
+        Attributes of sections that were not probed are None.
+        For workbooks, the summary covers every datasource in the workbook.
+
+        - named_connections: The attributes of each named connection's connection; class, dbname, schema, etc
+        - relations: The attributes of each (distinct) relation of the connection; tables, custom SQL, joins
+        - metadata_record_names: The remote names of the connection's metadata records
+        - folders: The names of the folder items in each folder
+        - extract: The attributes of the extract; an empty dict if there is no extract
+    """
+    file_path: str
+    connection_class: str = None
+    named_connections: list[dict] = None
+    relations: list[dict] = None
+    metadata_record_names: list[str] = None
+    column_names: list[str] = None
+    folders: dict[str, list[str]] = None
+    extract: dict = None
+
+
+def _copy_zip_member(source, target, info):
+    """ Copies a member from one archive into another, as the raw compressed bytes, without decompressing it.
+
+    Args:
+        source (ZipFile): The archive opened for reading
+        target (ZipFile): The archive opened for writing
+        info (ZipInfo): The member of the source archive to copy
+    """
+    if not raw_writes_supported(target):
+        # The member is decompressed and compressed again; streamed, so large members aren't read into memory
+        member = copy.copy(info)
+        member.extra = strip_zip64_extra(info.extra)
+        with source.open(info) as data, target.open(member, 'w', force_zip64=info.file_size > ZIP64_LIMIT // 2) as f:
+            shutil.copyfileobj(data, f, 1024 * 1024)
+        return None
+    # Skip past the member's local file header; the name & extra field lengths are the last 4 bytes of its 30
+    source.fp.seek(info.header_offset + 26)
+    name_length, extra_length = struct.unpack('<HH', source.fp.read(4))
+    source.fp.seek(name_length + extra_length, os.SEEK_CUR)
+    member = copy.copy(info)
+    member.extra = strip_zip64_extra(info.extra)
+    # The CRC and sizes are already known, so no data descriptor is written after the data
+    member.flag_bits &= ~0x08
+    try:
+        write_raw_member(target, member, source.fp)
+    except EOFError:
+        raise TableauFileError(f'Unexpected end of archive while copying {info.filename}')
+
+
+def _extract_path(directory, info):
+    """ Returns: The path a member of an archive is extracted to by ZipFile.extract """
+    name = info.filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        name = name.replace(os.path.altsep, os.path.sep)
+    name = os.path.splitdrive(name)[1]
+    parts = [p for p in name.split(os.path.sep) if p not in ('', os.path.curdir, os.path.pardir)]
+    return os.path.join(directory, *parts)
+
+
+def _is_extracted(info, path):
+    """ Checks if a member of an archive is already extracted to the path, by its size and CRC32
+
+    Args:
+        info (ZipInfo): The member of the archive
+        path (str): The path the member is extracted to
+
+    Returns: True if the file at the path has the member's contents
+    """
+    if info.is_dir():
+        return os.path.isdir(path)
+    # The size is compared first, so the file is only read when it's likely the same
+    if not os.path.isfile(path) or os.path.getsize(path) != info.file_size:
+        return False
+    crc = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc == info.CRC
+
+
+def _open_zip_member(file_path, info):
+    """ Opens a member of an archive, from a handle of the archive of its own; the archive is closed with the member
+
+    Args:
+        file_path (str): The path of the archive
+        info (ZipInfo): The member to open
+
+    Returns: The member opened for reading
+    """
+    with ZipFile(file_path) as zip_file:
+        return zip_file.open(info)
+
+
+def _extract_member(file_path, info, directory):
+    """ Extracts a member of an archive, from a handle of the archive of its own; so members can be extracted in parallel
+
+    Args:
+        file_path (str): The path of the archive
+        info (ZipInfo): The member to extract
+        directory (str): The directory to extract the member to
+    """
+    with ZipFile(file_path) as zip_file:
+        zip_file.extract(member=info, path=directory)
+
+
 class TableauFile:
     """ The base class for a Tableau file, i.e. Datasource or Workbook. """
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, xml_backend='etree', lazy=False):
         """
         Args:
             file_path (str): Path to a Tableau file
+            xml_backend (str): The XML library used to parse and write the file; etree (default) or lxml.
+                lxml is faster for large files, and is able to parse very large files (huge_tree)
+            lazy (bool): True to parse the XML the first time it's used, rather than on init
 
         """
+        self.xml_backend = xml_backend
+        self._etree = _xml_module(xml_backend)
         self.file_path = os.path.abspath(file_path)
         self.file_directory = os.path.dirname(self.file_path)
         self.file_basename = os.path.basename(self.file_path)
         self.extension = file_path.split('.')[-1]
         self.file_name = self.file_basename.replace(f'.{self.extension}', '')
+        # The CompressionPolicy of the archive when it's saved; defaults to the policy set with set_compression_policy
+        self.compression = None
         ''' Set on init '''
         self._tree: ET.ElementTree
         self._root: ET.Element
         self.has_extract_data: bool = False
+        if not lazy:
+            self.__extract_xml()
+        elif self.extension in ['tdsx', 'twbx']:
+            with ZipFile(self.file_path) as zip_file:
+                self.has_extract_data = any(z.filename.split('.')[-1] not in ['tds', 'twb'] for z in zip_file.filelist)
+
+    def __getattr__(self, attr):
+        # Only called when the attribute is not set yet, i.e. the XML of a lazy TableauFile
+        if attr not in ['_tree', '_root']:
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {attr!r}')
         self.__extract_xml()
+        if attr not in self.__dict__:
+            raise TableauFileError(f'No tds or twb file in {self.file_path}')
+        return self.__dict__[attr]
 
     def __extract_xml(self, path=None):
         """ Extracts the XML from a Tableau file.
@@ -53,77 +231,251 @@ class TableauFile:
                     if z.filename.split('.')[-1] not in ['tds', 'twb']:
                         self.has_extract_data = True
                         continue
-                    self._tree = ET.parse(zip_file.open(z.filename))
+                    with zip_file.open(z.filename) as f:
+                        self._tree = self.__parse(f)
                     self._root = self._tree.getroot()
         else:
-            self._tree = ET.parse(path)
+            self._tree = self.__parse(path)
             self._root = self._tree.getroot()
 
-    def unzip(self, unzip_all=False, extract_to=None):
+    def __parse(self, source):
+        """ Parses the XML with the XML backend of the TableauFile
+
+        Args:
+            source (str|file): The path to, or file object of, the XML
+
+        Returns: The ElementTree of the XML
+        """
+        if self.xml_backend == 'lxml':
+            # Comments and processing instructions are dropped, the same as ElementTree does
+            parser = self._etree.XMLParser(huge_tree=True, remove_comments=True, remove_pis=True)
+            return self._etree.parse(source, parser)
+        return self._etree.parse(source)
+
+    @classmethod
+    def probe(cls, file_path, sections=('connection',), xml_backend='etree'):
+        """ Collects a summary of the Tableau file, by streaming its XML and only reading the requested sections.
+            Stops reading a datasource file as soon as the requested sections have been read,
+            i.e. the columns and extract are not read when only the connection is requested.
+
+        Args:
+            file_path (str): Path to a Tableau file; tds, tdsx, twb, or twbx
+            sections (Iterable[str]): The sections to collect; connection, columns, folders_common, and/or extract
+            xml_backend (str): The XML library used to parse the file; etree (default) or lxml
+
+        Returns: A TableauFileSummary of the requested sections
+        """
+        sections = set(sections)
+        if not sections.issubset(PROBE_SECTIONS):
+            raise TableauFileError(f'Sections must be in {", ".join(PROBE_SECTIONS)}; not {sections}')
+        etree = _xml_module(xml_backend)
+        summary = TableauFileSummary(file_path=os.path.abspath(file_path))
+        if 'connection' in sections:
+            summary.named_connections, summary.relations, summary.metadata_record_names = list(), list(), list()
+        if 'columns' in sections:
+            summary.column_names = list()
+        if 'folders_common' in sections:
+            summary.folders = dict()
+        if 'extract' in sections:
+            summary.extract = dict()
+        extension = file_path.split('.')[-1]
+        # A datasource file can stop being read once its sections are complete; except columns, which is a list
+        stop_early = extension in ['tds', 'tdsx'] and 'columns' not in sections
+        remaining = set(sections)
+        with ExitStack() as stack:
+            if extension in ['tdsx', 'twbx']:
+                zip_file = stack.enter_context(ZipFile(file_path))
+                names = [z.filename for z in zip_file.filelist if z.filename.split('.')[-1] in ['tds', 'twb']]
+                if not names:
+                    raise TableauFileError(f'No tds or twb file in {file_path}')
+                source = stack.enter_context(zip_file.open(names[0]))
+            else:
+                source = stack.enter_context(open(file_path, 'rb'))
+            if xml_backend == 'lxml':
+                events = etree.iterparse(source, events=('start', 'end'), huge_tree=True, remove_comments=True)
+            else:
+                events = etree.iterparse(source, events=('start', 'end'))
+            # The tags of the elements being read, to find the sections; the direct children of a datasource
+            tags = list()
+            for event, element in events:
+                if event == 'start':
+                    tags.append(element.tag)
+                    continue
+                tags.pop()
+                if not tags or tags[-1] != 'datasource':
+                    continue
+                section = cls.__probe_section(summary, element)
+                # Free the memory of the section, once it has been read
+                element.clear()
+                remaining.discard(section)
+                if stop_early and not remaining:
+                    break
+        return summary
+
+    @staticmethod
+    def __probe_section(summary, element):
+        """ Adds the details of a datasource section element to the summary, if the section was requested
+
+        Args:
+            summary (TableauFileSummary): The summary being collected
+            element (ET.Element): A direct child element of a datasource
+
+        Returns: The name of the section the element belongs to, or None
+        """
+        if _is_section_tag(element.tag, 'connection'):
+            if summary.named_connections is None:
+                return 'connection'
+            summary.connection_class = summary.connection_class or element.get('class')
+            for named_connection in element.iterfind('named-connections/named-connection'):
+                connection = named_connection.find('connection')
+                if connection is not None:
+                    summary.named_connections.append(dict(connection.attrib))
+            for relation in element.iter():
+                if isinstance(relation.tag, str) and relation.tag.split('...')[-1] == 'relation':
+                    if dict(relation.attrib) not in summary.relations:
+                        summary.relations.append(dict(relation.attrib))
+            for remote_name in element.iterfind('metadata-records/metadata-record/remote-name'):
+                summary.metadata_record_names.append(remote_name.text)
+            return 'connection'
+        if _is_section_tag(element.tag, 'column'):
+            if summary.column_names is not None:
+                summary.column_names.append(element.get('name'))
+            return 'columns'
+        if _is_section_tag(element.tag, 'folders-common'):
+            if summary.folders is not None:
+                for folder in element:
+                    summary.folders[folder.get('name')] = [i.get('name') for i in folder if i.get('name')]
+            return 'folders_common'
+        if _is_section_tag(element.tag, 'extract'):
+            if summary.extract is not None:
+                summary.extract.update(element.attrib)
+            return 'extract'
+        return None
+
+    def __getstate__(self):
+        # The XML is not pickled with the TableauFile; it's parsed from the file again the first time it's used
+        state = dict(self.__dict__)
+        for attr in ['_etree', '_tree', '_root']:
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._etree = _xml_module(self.xml_backend)
+
+    def _tree_builder(self):
+        """ Returns: A TreeBuilder for creating Elements that can be added to the TableauFile's XML """
+        return self._etree.TreeBuilder()
+
+    def unzip(self, unzip_all=False, extract_to=None, members=None, skip_unchanged=False, max_workers=None):
         """ Unzips the Tableau File.
+            Members are extracted in parallel; with skip_unchanged, members already extracted with the same size
+            and CRC32 are skipped, rather than rewritten.
 
         Args:
             unzip_all (bool): True to unzip all zipped files
             extract_to: Override the source file directory and save the file to another location
+            members (str|list[str]): Glob pattern(s) of the members to unzip, instead of the TDS / TWB;
+             i.e. "Data/Extracts/*.hyper"
+            skip_unchanged (bool): True to skip members that are already extracted and unchanged
+            max_workers (int): The maximum number of threads extracting members; 1 extracts them one by one
 
-        Returns: The path to the unzipped Tableau File
+        Returns: The path to the unzipped Tableau File; None if it wasn't unzipped
         """
 
         if extract_to is not None:
             file_dir = extract_to
         else:
             file_dir = self.file_directory
+        if isinstance(members, str):
+            members = [members]
 
         tableau_file_path = None
         with ZipFile(self.file_path) as zip_file:
+            selected = list()
             for z in zip_file.filelist:
-                ext = z.filename.split('.')[-1]
-                if unzip_all:
-                    zip_file.extract(member=z, path=file_dir)
-                    if ext in ['tds', 'twb']:
-                        tableau_file_path = os.path.join(file_dir, z.filename)
-                elif not unzip_all and ext in ['tds', 'twb']:
-                    zip_file.extract(member=z, path=file_dir)
+                is_tableau_file = z.filename.split('.')[-1] in ['tds', 'twb']
+                if members is not None:
+                    if not any(fnmatchcase(z.filename, pattern) for pattern in members):
+                        continue
+                elif not unzip_all and not is_tableau_file:
+                    continue
+                if is_tableau_file:
                     tableau_file_path = os.path.join(file_dir, z.filename)
+                if skip_unchanged and _is_extracted(z, _extract_path(file_dir, z)):
+                    logging.info('Skipping unchanged file {}'.format(z.filename))
+                    continue
+                selected.append(z)
+            if len(selected) > 1 and max_workers != 1:
+                # Each thread reads from its own handle of the archive; decompressing and writing release the GIL
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(lambda z: _extract_member(self.file_path, z, file_dir), selected))
+            else:
+                for z in selected:
+                    zip_file.extract(member=z, path=file_dir)
         return tableau_file_path
 
     def save(self):
-        """ Save/Update the Tableau file with the XML changes made """
-        if self.extension in ['tdsx', 'twbx']:
-            # Rebuild the TDSX / TWBX archive file, with the updated archived TDS / TWB
-            # Move the file into a temporary folder while updating
-            temp_folder = os.path.join(self.file_directory, f'__TEMP_{self.file_name}')
-            os.makedirs(temp_folder, exist_ok=False)
-            temp_path = os.path.join(temp_folder, self.file_basename)
-            dupe_temp_path = os.path.join(temp_folder, f'__tmp_{self.file_basename}')
-            shutil.move(self.file_path, temp_path)
-            # Unzip the zipped files
-            logging.info('Unzipping files from {}'.format(temp_path))
-            extracted_files = list()
-            with ZipFile(temp_path) as z:
-                for f in z.filelist:
-                    ext = f.filename.split('.')[-1]
-                    logging.info('Extracting file {}'.format(f.filename))
-                    path = z.extract(member=f, path=temp_folder)
-                    extracted_files.append(path)
-                    if ext in ['tds', 'twb']:
-                        xml_path = path
-            # Overwrite XML file with new XML
-            logging.info('Overwriting XML file {}'.format(os.path.basename(xml_path)))
-            self._tree.write(xml_path, encoding="utf-8", xml_declaration=True)
-            logging.info('Zipping files into {}'.format(temp_path))
-            # Repack the unzipped files
-            with ZipFile(temp_path, 'w') as z:
-                for file in extracted_files:
-                    logging.info('Archiving {}'.format(os.path.basename(file)))
-                    arcname = file.split(temp_folder)[-1]
-                    z.write(file, arcname=arcname)
-            # Move file back to the original folder and remove any unpacked contents
-            shutil.move(temp_path, self.file_path)
-            shutil.rmtree(temp_folder)
-        else:
-            # Update the Tableau file's contents
-            self._tree.write(self.file_path, encoding="utf-8", xml_declaration=True)
+        """ Save/Update the Tableau file with the XML changes made.
+            The file is written in a temp workspace, then replaces the original file;
+            so the original is left untouched if writing fails.
+        """
+        policy = self.compression or compression_policy()
+        with temp_workspace(self.file_directory, prefix=f'__TEMP_{self.file_name}.') as workspace:
+            temp_path = os.path.join(workspace, self.file_basename)
+            if self.extension in ['tdsx', 'twbx']:
+                # Rebuild the TDSX / TWBX archive file, with the updated archived TDS / TWB.
+                # Every other member is copied as-is, without being decompressed or extracted,
+                # unless the compression policy changes its compression.
+                logging.info('Writing archive {}'.format(temp_path))
+                with ExitStack() as stack:
+                    source = stack.enter_context(ZipFile(self.file_path))
+                    executor = stack.enter_context(ThreadPoolExecutor(max_workers=policy.max_workers))
+                    target = stack.enter_context(ZipFile(temp_path, 'w'))
+                    # Members to recompress are compressed by threads, ahead of being written in order
+                    recompressed = dict()
+                    for info in source.infolist() if raw_writes_supported(target) else []:
+                        compress_type = policy.compress_type_of(info.filename, info.compress_type)
+                        if info.filename.split('.')[-1] in ['tds', 'twb'] or compress_type == info.compress_type:
+                            continue
+                        recompressed[info.filename] = executor.submit(
+                            compress_member, lambda i=info: _open_zip_member(self.file_path, i),
+                            info, compress_type, policy.compresslevel, workspace
+                        )
+                    for info in source.infolist():
+                        if info.filename.split('.')[-1] in ['tds', 'twb']:
+                            logging.info('Writing XML file {}'.format(info.filename))
+                            member = ZipInfo(info.filename, date_time=time.localtime()[:6])
+                            member.external_attr = info.external_attr
+                            xml = io.BytesIO()
+                            self._tree.write(xml, encoding="utf-8", xml_declaration=True)
+                            target.writestr(
+                                member, xml.getvalue(),
+                                policy.compress_type_of(info.filename, info.compress_type), policy.compresslevel
+                            )
+                        elif info.filename in recompressed:
+                            logging.info('Compressing file {}'.format(info.filename))
+                            member, data = recompressed[info.filename].result()
+                            with data:
+                                write_raw_member(target, member, data)
+                        elif policy.compress_type_of(info.filename, info.compress_type) != info.compress_type:
+                            # Raw members can't be written with this version of Python; see raw_writes_supported
+                            logging.info('Compressing file {}'.format(info.filename))
+                            member = copy.copy(info)
+                            member.extra = strip_zip64_extra(info.extra)
+                            target.writestr(
+                                member, source.read(info),
+                                policy.compress_type_of(info.filename, info.compress_type), policy.compresslevel
+                            )
+                        else:
+                            logging.info('Copying file {}'.format(info.filename))
+                            _copy_zip_member(source, target, info)
+            else:
+                # Write the Tableau file's contents
+                self._tree.write(temp_path, encoding="utf-8", xml_declaration=True)
+            shutil.copymode(self.file_path, temp_path)
+            # Replace the original file with the new file
+            replace_file(temp_path, self.file_path)
 
 
 class Datasource(TableauFile):
@@ -133,47 +485,162 @@ class Datasource(TableauFile):
         such as Columns, Folders, Connections, Metadata, etc.
     """
 
-    def __init__(self, file_path):
+    # Each section's attribute name, Tableau File Object, and whether the section is a TableauFileObjects list.
+    # Sections are built from the XML the first time they are accessed.
+    _SECTIONS = {
+        'connection': (tfo.ParentConnection, False),
+        'aliases': (tfo.Aliases, False),
+        'columns': (tfo.Column, True),
+        'column_instance': (tfo.ColumnInstance, False),
+        'drill_paths': (tfo.DrillPaths, False),
+        'folders_common': (tfo.FoldersCommon, False),
+        'date_options': (tfo.DateOptions, False),
+        'extract': (tfo.Extract, False),
+        'layout': (tfo.Layout, False),
+    }
+    connection: tfo.ParentConnection
+    aliases: tfo.Aliases
+    columns: tfo.TableauFileObjects[tfo.Column]
+    column_instance: tfo.ColumnInstance
+    drill_paths: tfo.DrillPaths
+    folders_common: tfo.FoldersCommon
+    date_options: tfo.DateOptions
+    extract: tfo.Extract
+    layout: tfo.Layout
+
+    def __init__(self, file_path, xml_backend='etree', cache=None):
         """
         Args:
             file_path (str): Path to a Tableau Datasource file; tds or tdsx
+            xml_backend (str): The XML library used to parse and write the file; etree (default) or lxml
+            cache (DatasourceCache|str): A DatasourceCache, or the directory of one, to load the parsed sections
+             of the Datasource from when the file is unchanged. Each section is cached when it's first built;
+             the XML is only parsed to build a section that isn't cached, or to save the Datasource
         """
-        super().__init__(file_path)
+        self._cache = DatasourceCache(cache) if isinstance(cache, str) else cache
+        super().__init__(file_path, xml_backend, lazy=self._cache is not None)
         # Validate the file on initialization
         if self.extension not in ['tds', 'tdsx']:
             raise TableauFileError('File must be TDS or TDSX')
+        # The cache key of the file; sections are cached under it as each is built
+        self._cache_key = self._cache.key(self.file_path) if self._cache is not None else None
 
-        self.connection: tfo.ParentConnection = self.__get_section(tfo.ParentConnection)
-        self.aliases: tfo.Aliases = self.__get_section(tfo.Aliases)
-        self.columns: tfo.TableauFileObjects[tfo.Column] = self.__get_section(tfo.Column, enforce_list=True)
-        self.column_instance: tfo.ColumnInstance = self.__get_section(tfo.ColumnInstance)
-        self.drill_paths: tfo.DrillPaths = self.__get_section(tfo.DrillPaths)
-        self.folders_common: tfo.FoldersCommon = self.__get_section(tfo.FoldersCommon)
-        self.date_options: tfo.DateOptions = self.__get_section(tfo.DateOptions)
-        self.extract: tfo.Extract = self.__get_section(tfo.Extract)
-        self.layout: tfo.Layout = self.__get_section(tfo.Layout)
+    def __getattr__(self, attr):
+        # Only called when the attribute is not set yet, i.e. a section that has not been accessed
+        if attr in ['_tree', '_root']:
+            value = super().__getattr__(attr)
+            self.__link_cached_elements()
+            return value
+        if attr not in self._SECTIONS:
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {attr!r}')
+        cached = self.__cached_section(attr)
+        if cached is not None:
+            section = cached['section']
+            # Items are linked to their Elements once the XML is parsed, so unchanged items aren't regenerated
+            self.__dict__.setdefault('_cached_elements', []).extend(cached['elements'])
+            if '_root' in self.__dict__:
+                self.__link_cached_elements()
+        else:
+            obj, enforce_list = self._SECTIONS[attr]
+            section = self.__get_section(obj, enforce_list)
+            self.__cache_section(attr, section)
+        setattr(self, attr, section)
+        return section
 
     def __delattr__(self, attr):
+        if attr not in self._SECTIONS:
+            return super().__delattr__(attr)
         section = getattr(self, attr)
         if not section:
             return None
-        # Remove the section from the parent Element
+        # Remove the section from the parent Element; the XML no longer matches the file until it's saved
         parent = self._root.find('.')
         self.__remove_section_from_parent(parent, section.tag)
+        self._xml_changed = True
         # Set the section to None
         setattr(self, attr, None)
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Items are linked to their Elements again once the XML is parsed, as they are when loaded from a cache;
+        # unless the XML was changed, so the positions of the Elements in the file are no longer known
+        if '_root' in self.__dict__ and not self.__dict__.get('_xml_changed'):
+            sections = [self.__dict__[attr] for attr in self.materialized_sections()]
+            state['_cached_elements'] = self.__element_positions(sections)
+            # The positions are only linked again if the file is unchanged when it's parsed
+            state['_cached_file_key'] = DatasourceCache.key(self.file_path)
+        state.pop('_xml_changed', None)
+        return state
+
     def sections(self):
-        """ Yields each section defined in the class, for iteration """
-        yield self.connection
-        yield self.aliases
-        yield self.columns
-        yield self.column_instance
-        yield self.drill_paths
-        yield self.folders_common
-        yield self.date_options
-        yield self.extract
-        yield self.layout
+        """ Yields each section defined in the class, for iteration.
+            Sections that have not been accessed yet will be built from the XML.
+        """
+        for attr in self._SECTIONS:
+            yield getattr(self, attr)
+
+    def materialized_sections(self):
+        """ Returns: The attribute names of the sections that have been built from the XML, or set """
+        return [attr for attr in self._SECTIONS if attr in self.__dict__]
+
+    def __cached_section(self, attr):
+        """ Gets a section from the cache
+
+        Args:
+            attr (str): The attribute name of the section
+
+        Returns: The cached section, and the positions of the XML Elements its items were loaded from;
+         None if it's not cached, or the XML has changed since the file was loaded
+        """
+        if self._cache is None or self.__dict__.get('_xml_changed'):
+            return None
+        return self._cache.get(self._cache.section_key(self._cache_key, attr))
+
+    def __cache_section(self, attr, section):
+        """ Caches a section, as it is in the file, with the position of the XML Element each item was loaded from
+
+        Args:
+            attr (str): The attribute name of the section
+            section: The section; unchanged since it was built from, or saved to, the file
+        """
+        if self._cache is None or self.__dict__.get('_xml_changed'):
+            return None
+        elements = self.__element_positions([section]) if section else []
+        self._cache.put(self._cache.section_key(self._cache_key, attr), {'section': section, 'elements': elements})
+
+    def __element_positions(self, sections):
+        """ Gets the position of the XML Element each item of the sections was loaded from, or last saved as
+
+        Args:
+            sections (Iterable): The sections
+
+        Returns: A list of (item, position) for each item whose Element is in the XML
+        """
+        positions = {id(e): i for i, e in enumerate(self._root)}
+        elements = list()
+        for section in sections:
+            for item in section if isinstance(section, tfo.TableauFileObjects) else [section]:
+                if isinstance(item, tfo.TableauFileObject) and id(item._element) in positions:
+                    elements.append((item, positions[id(item._element)]))
+        return elements
+
+    def __link_cached_elements(self):
+        """ Links items loaded from the cache to the XML Elements they were loaded from, once the XML is parsed """
+        cached_elements = self.__dict__.pop('_cached_elements', [])
+        file_key = self.__dict__.pop('_cached_file_key', None)
+        if cached_elements and file_key is not None and file_key != DatasourceCache.key(self.file_path):
+            # The file was changed since the Datasource was pickled; its items are regenerated when saved
+            logging.info('{} changed since it was pickled; not linking its items to the XML'.format(self.file_path))
+            return None
+        children = list(self._root)
+        for item, position in cached_elements:
+            if item._element is None and position < len(children):
+                item._element = children[position]
+
+    @staticmethod
+    def __is_section_element(element, tag):
+        """ Returns: True if the Element belongs to the section with the tag """
+        return _is_section_tag(element.tag, tag)
 
     @staticmethod
     def __remove_section_from_parent(parent, tag) -> list[tuple[int, ET.Element]]:
@@ -185,7 +652,7 @@ class Datasource(TableauFile):
         Returns: A list of (index, Element) for the elements removed from the parent Element
         """
         # A section can be multiple elements within the parent element
-        elements = [(i, e) for i, e in enumerate(parent) if e.tag.endswith(f'true...{tag}') or e.tag == tag or (e.tag.startswith(f'layout _.fcp.SchemaViewerObjectModel.false...') and tag == 'layout')]
+        elements = [(i, e) for i, e in enumerate(parent) if Datasource.__is_section_element(e, tag)]
         for _, e in elements:
             parent.remove(e)
         return elements
@@ -201,15 +668,14 @@ class Datasource(TableauFile):
         # Gets elements within the parent element, with the appropriate section.tag
         section: list[dict] = list()
         for element in parent:
-            if element.tag.endswith(f'true...{obj.tag}') or element.tag == obj.tag or (element.tag.startswith(f'layout _.fcp.SchemaViewerObjectModel.false...') and obj.tag == 'layout'):
-                item = xmltodict.parse(ET.tostring(element))[element.tag]
-                if not item:
-                    continue
-                new_item = transform_tableau_object(item)
+            if self.__is_section_element(element, obj.tag):
                 try:
-                    section.append(obj(**new_item))
+                    item = obj.from_element(element)
                 except TypeError as err:
-                    raise TableauFileError(f'{err}\n\nPre-transform {obj.tag} attributes: {item}') from err
+                    raise TableauFileError(f'{err}\n\nPre-transform {obj.tag} attributes: {element.attrib}') from err
+                if item is None:
+                    continue
+                section.append(item)
         if len(section) > 1 or len(section) == 1 and enforce_list:
             return tfo.TableauFileObjects(section, item_class=obj, tag=obj.tag)
         if len(section) == 1:
@@ -235,77 +701,122 @@ class Datasource(TableauFile):
             folder_name (str): The name of the folder that the column should be in
 
         """
-        # Add Column
-        if column not in self.columns:
-            self.columns.add(column)
-        # Update the Column
+        self.enforce_columns([(column, folder_name, remote_name)])
+
+    def enforce_columns(self, columns):
+        """ Enforces each of the columns, the same as calling enforce_column for each of them in order.
+            The mapping cols of the connections are indexed once for all columns, rather than being searched for each
+            column; the folders of the columns are found with the index kept by FoldersCommon.
+
+        Args:
+            columns (Iterable[tfo.Column|tuple]): The columns to enforce;
+             each either a Column, or a tuple of (column, folder_name, remote_name) as passed to enforce_column
+
+        """
+        # Mapping col key / value -> positions, for the connection and extract; built when metadata is first enforced
+        connection_mappings = None
+        extract_mappings = None
+        for item in columns:
+            if isinstance(item, tfo.Column):
+                column, folder_name, remote_name = item, None, None
+            else:
+                column, folder_name, remote_name = (tuple(item) + (None, None))[:3]
+
+            # Add Column
+            if column not in self.columns:
+                self.columns.add(column)
+            # Update the Column
+            else:
+                self.columns.update(column)
+
+            # Add Folder / FolderItem for the column, if folder_name was provided
+            if folder_name:
+                self.__enforce_column_folder(column, folder_name)
+                # Set display to show folders
+                self.layout.show_structure = False
+
+            # If a remote_name was provided, and the column is not a Tableau Calculation - enforce metadata
+            if not remote_name or column.calculation:
+                continue
+
+            # Update Connection MetadataRecords & MappingCols
+            connection_record = self.connection.metadata_records.get(remote_name)
+            if not connection_record:
+                raise TableauFileError(f'Remote name provided is not in the metadata of the connection: {remote_name}')
+            connection_record.local_name = column.name
+            self.connection.metadata_records.update(connection_record)
+            if connection_mappings is None:
+                connection_mappings = self.__index_mapping_cols(self.connection.cols)
+            conn_col = tfo.MappingCol(key=column.name, value=f'{connection_record.parent_name}.[{remote_name}]')
+            self.__enforce_mapping_col(self.connection.cols, conn_col, connection_mappings)
+
+            # Update Extract MetadataRecords & MappingCols
+            if not self.extract:
+                continue
+            extract_record = self.extract.connection.metadata_records.get(remote_name)
+            if not extract_record:
+                raise TableauFileError(f'Remote name provided is not in the metadata of the extract: {remote_name}')
+            extract_record.local_name = column.name
+            self.extract.connection.metadata_records.update(extract_record)
+            if extract_mappings is None:
+                extract_mappings = self.__index_mapping_cols(self.extract.connection.cols)
+            extract_col = tfo.MappingCol(key=column.name, value=f'{extract_record.parent_name}.[{remote_name}]')
+            self.__enforce_mapping_col(self.extract.connection.cols, extract_col, extract_mappings)
+
+    def __enforce_column_folder(self, column, folder_name):
+        """ Moves the column's folder-item to the folder, creating the folder if it doesn't exist
+
+        Args:
+            column (tfo.Column): The column
+            folder_name (str): The name of the folder that the column should be in
+        """
+        # Remove the column's folder-item for preview folder, if it will be moved to a new folder
+        current_folder = self.folders_common.folder_of(column.name)
+        if current_folder and current_folder.name != folder_name:
+            self.folders_common.delete_folder_item(current_folder, column.name)
+        # Add column to the specified folder
+        folder = self.folders_common.get(folder_name)
+        if folder:
+            self.folders_common.add_folder_item(folder, tfo.FolderItem(name=column.name))
         else:
-            self.columns.update(column)
-
-        # Add Folder / FolderItem for the column, if folder_name was provided
-        if folder_name:
-            # Remove the column's folder-item for preview folder, if it will be moved to a new folder
-            current_folder = [f for f in self.folders_common.folder if f.folder_item.get(column.name)]
-            if current_folder and current_folder[0].name != folder_name:
-                current_folder[0].folder_item.delete(column.name)
-                self.folders_common.folder.update(current_folder[0])
-            # Add column to the specified folder
-            folder = self.folders_common.folder.get(folder_name)
-            folder_item = tfo.FolderItem(name=column.name)
-            if folder and folder_item not in folder.folder_item:
-                folder.folder_item.append(folder_item)
-                self.folders_common.folder.update(folder)
-            elif not folder:
-                self.folders_common.folder.add(tfo.Folder(name=folder_name, folder_item=[folder_item]))
-
-            # Set display to show folders
-            self.layout.show_structure=False
-
-        # If a remote_name was provided, and the column is not a Tableau Calculation - enforce metadata
-        if not remote_name or column.calculation:
-            return None
+            self.folders_common.add(tfo.Folder(name=folder_name, folder_item=[tfo.FolderItem(name=column.name)]))
 
-        # Update Connection MetadataRecords & MappingCols
-        connection_record = self.connection.metadata_records.get(remote_name)
-        if not connection_record:
-            raise TableauFileError(f'Remote name provided is not in the metadata of the connection: {remote_name}')
-        connection_record.local_name = column.name
-        self.connection.metadata_records.update(connection_record)
-        conn_col = tfo.MappingCol(key=column.name, value=f'{connection_record.parent_name}.[{remote_name}]')
-        # Update Connection MappingCols
-        if conn_col not in self.connection.cols:
-            # Update the Connection MappingCol if key or value is different
-            found = False
-            for col in self.connection.cols:
-                if conn_col.key == col.key or conn_col.value == col.value:
-                    found = True
-                    self.connection.cols[col].key = conn_col.key
-                    self.connection.cols[col].value = conn_col.value
-            # Otherwise, Add Connection MappingCol
-            if not found:
-                self.connection.cols.append(conn_col)
-
-        # Update Extract MetadataRecords & MappingCols
-        if not self.extract:
+    @staticmethod
+    def __index_mapping_cols(cols):
+        """ Returns: A tuple of dicts of mapping col key -> positions, and mapping col value -> positions """
+        keys, values = dict(), dict()
+        for idx, col in enumerate(cols):
+            keys.setdefault(col.key, []).append(idx)
+            values.setdefault(col.value, []).append(idx)
+        return keys, values
+
+    @staticmethod
+    def __enforce_mapping_col(cols, mapping_col, mappings):
+        """ Updates the mapping cols with the same key or value to match the mapping col, or adds it if there are none
+
+        Args:
+            cols (tfo.TableauFileObjects): The mapping cols of a connection
+            mapping_col (tfo.MappingCol): The mapping col to enforce
+            mappings (tuple[dict, dict]): The key -> positions, and value -> positions, of the cols; kept up-to-date
+        """
+        keys, values = mappings
+        positions = sorted(set(keys.get(mapping_col.key, [])) | set(values.get(mapping_col.value, [])))
+        if any(cols[idx] == mapping_col for idx in positions):
             return None
-        extract_record = self.extract.connection.metadata_records.get(remote_name)
-        if not extract_record:
-            raise TableauFileError(f'Remote name provided is not in the metadata of the extract: {remote_name}')
-        extract_record.local_name = column.name
-        self.extract.connection.metadata_records.update(extract_record)
-        extract_col = tfo.MappingCol(key=column.name, value=f'{extract_record.parent_name}.[{remote_name}]')
-        # Update Extract MappingCols
-        if extract_col not in self.extract.connection.cols:
-            # Update the Extract MappingCol if key or value is different
-            found = False
-            for col in self.extract.connection.cols:
-                if extract_col.key == col.key or extract_col.value == col.value:
-                    found = True
-                    self.extract.connection.cols[col].key = extract_col.key
-                    self.extract.connection.cols[col].value = extract_col.value
-            # Otherwise, Add Extract MappingCol
-            if not found:
-                self.extract.connection.cols.append(extract_col)
+        # Update the MappingCols if key or value is different;
+        # they're replaced rather than changed, so the cols don't have to be re-indexed by key
+        for idx in positions:
+            col = cols[idx]
+            keys[col.key].remove(idx)
+            values[col.value].remove(idx)
+            cols[idx] = tfo.MappingCol(key=mapping_col.key, value=mapping_col.value)
+            keys.setdefault(mapping_col.key, []).append(idx)
+            values.setdefault(mapping_col.value, []).append(idx)
+        # Otherwise, Add the MappingCol
+        if not positions:
+            cols.append(mapping_col)
+            keys.setdefault(mapping_col.key, []).append(len(cols) - 1)
+            values.setdefault(mapping_col.value, []).append(len(cols) - 1)
 
     def remove_empty_folders(self):
         """ Removes any folder without a column in it
@@ -338,31 +849,214 @@ class Datasource(TableauFile):
 
         # Remove Empty Folders
         for empty_folder in empty_folder_list:
-            self.folders_common.folder.delete(empty_folder)
+            self.folders_common.delete(empty_folder)
 
         return empty_folder_list
 
+    def diff(self, other):
+        """ Compares each section of the Datasource with another version of the Datasource.
+            Identical sections are skipped; within a section that differs, items are matched by key
+            (i.e. Column.name), and compared attribute by attribute. Runs in linear time in the number of items.
 
-    def save(self):
-        """ Save all changes made to each section of the Datasource """
+        Args:
+            other (Datasource): The other version of the Datasource
+
+        Returns: A dict of section name -> FileObjectDiff, or FileObjectsDiff for a list section (i.e. columns),
+         for each section that differs. Items in "added" are only in the other Datasource; "removed" only in this one
+        """
+        diffs = dict()
+        for attr in self._SECTIONS:
+            diff = diff_sections(getattr(self, attr), getattr(other, attr))
+            if diff:
+                diffs[attr] = diff
+        return diffs
+
+    def to_frame(self, section):
+        """ Exports a section of the Datasource as a pandas DataFrame, with a row per item of the section.
+            The DataFrame is built column by column from the FileObjects, rather than from a dict of each.
+
+        Args:
+            section (str): columns, metadata_records, folders, mapping_cols, or connections
+
+        Returns: The DataFrame
+        """
+        return to_frame(self, section)
+
+    def to_arrow(self, section):
+        """ Exports a section of the Datasource as a pyarrow Table, with a row per item of the section;
+            pyarrow is an optional dependency.
+
+        Args:
+            section (str): columns, metadata_records, folders, mapping_cols, or connections
+
+        Returns: The Table
+        """
+        return to_arrow(self, section)
+
+    def __section_elements(self, section, existing):
+        """ Gets the XML Elements of the section, regenerating only the items that changed
+
+        Args:
+            section (tfo.TableauFileObject|tfo.TableauFileObjects): The section
+            existing (list[ET.Element]): The elements of the section currently in the XML
+
+        Returns: A list of XML Elements, one per item of the section
+        """
+        items = section if isinstance(section, tfo.TableauFileObjects) else [section]
+        # Only elements of this XML can be reused; i.e. not those of an item added from another Datasource
+        reusable = {id(e) for e in existing}
+        elements = list()
+        for item in items:
+            if id(item._element) not in reusable or item.is_dirty():
+                item._saved(item.xml(self._tree_builder()))
+            elements.append(item._element)
+        if isinstance(section, tfo.TableauFileObjects):
+            section._dirty = False
+        return elements
+
+    def _write_sections(self):
+        """ Writes the changes made to each section of the Datasource into its XML.
+            Only the sections, and items of a section, that changed are regenerated;
+            all other elements are left untouched in the XML.
+        """
         parent = self._root.find('.')
         ending_index = -1
-        for section in self.sections():
-            if not section:
-                continue
-            # Remove and get all elements of the section from the parent element
-            elements = self.__remove_section_from_parent(parent, section.tag)
-            # If there are no existing element(s), the index will be for the previous ending_index (default == -1)
-            starting_index = elements[0][0] if elements else ending_index
-            ending_index = elements[-1][0] + 1 if elements else starting_index
-            # Insert the new / updated items
-            if isinstance(section, tfo.TableauFileObjects):
-                section.reverse()
-                for idx, item in enumerate(section, 1):
-                    parent.insert(starting_index, item.xml())
-                    ending_index = starting_index + idx
-            else:
-                parent.insert(starting_index, section.xml())
+        for attr, (obj, _) in self._SECTIONS.items():
+            indexes = [i for i, e in enumerate(parent) if self.__is_section_element(e, obj.tag)]
+            section = self.__dict__.get(attr)
+            if section:
+                existing = [parent[i] for i in indexes]
+                elements = self.__section_elements(section, existing)
+                # Element equality is identity, so this is only True when nothing in the section changed
+                if elements != existing:
+                    # Replace the existing element(s); or insert after the previous section, if there are none
+                    removed = set(indexes)
+                    children = [e for i, e in enumerate(parent) if i not in removed]
+                    starting_index = indexes[0] if indexes else ending_index
+                    if starting_index < 0:
+                        starting_index = max(len(children) + starting_index, 0)
+                    children[starting_index:starting_index] = elements
+                    parent[:] = children
+                    ending_index = starting_index + len(elements)
+                    continue
+            # Keep track of where the section is, so following sections are inserted after it
+            if indexes:
+                ending_index = indexes[-1] + 1
+
+    def save(self):
+        """ Save all changes made to each section of the Datasource """
+        self._write_sections()
+        super().save()
+        self.__dict__.pop('_xml_changed', None)
+        if self._cache is not None:
+            # The sections built so far are cached as they were saved; the rest are cached when they're built
+            self._cache_key = self._cache.key(self.file_path)
+            for attr in self.materialized_sections():
+                self.__cache_section(attr, self.__dict__[attr])
+
+
+class EmbeddedDatasource(Datasource):
+    """
+        A Datasource embedded in a Tableau Workbook.
+        Has the same sections as a Datasource, built from the workbook's XML the first time they are accessed;
+        saving it saves the Workbook it is embedded in.
+    """
+
+    def __init__(self, workbook, element):
+        """
+        Args:
+            workbook (Workbook): The Workbook the datasource is embedded in
+            element (ET.Element): The datasource Element within the Workbook's XML
+        """
+        self.workbook = workbook
+        self.name = element.get('name')
+        self.caption = element.get('caption')
+        for attr in ['xml_backend', '_etree', 'file_path', 'file_directory', 'file_basename', 'extension',
+                     'file_name', 'has_extract_data', '_tree']:
+            setattr(self, attr, getattr(workbook, attr))
+        self._root = element
+        self._cache = None
+
+    def __getstate__(self):
+        raise TypeError(f'{self.__class__.__name__} can not be pickled, as it is part of the XML of its Workbook')
+
+    def save(self):
+        """ Save all changes made to the Workbook, including those made to this datasource """
+        self.workbook.save()
+
+
+class Workbook(TableauFile):
+    """
+        A class representation of a Tableau Workbook.
+        Used to inspect a Tableau Workbook's embedded datasources, worksheets, and dashboards,
+        and to update its embedded datasources.
+    """
+
+    # Each section's attribute name, the tag of its elements within the workbook, and its Tableau File Object;
+    # None for the embedded datasources. Sections are built from the XML the first time they are accessed.
+    _SECTIONS = {
+        'datasources': ('datasources/datasource', None),
+        'worksheets': ('worksheets/worksheet', tfo.Worksheet),
+        'dashboards': ('dashboards/dashboard', tfo.Dashboard),
+    }
+    datasources: list[EmbeddedDatasource]
+    worksheets: tfo.TableauFileObjects[tfo.Worksheet]
+    dashboards: tfo.TableauFileObjects[tfo.Dashboard]
+
+    def __init__(self, file_path, xml_backend='etree'):
+        """
+        Args:
+            file_path (str): Path to a Tableau Workbook file; twb or twbx
+            xml_backend (str): The XML library used to parse and write the file; etree (default) or lxml
+        """
+        super().__init__(file_path, xml_backend)
+        # Validate the file on initialization
+        if self.extension not in ['twb', 'twbx']:
+            raise TableauFileError('File must be TWB or TWBX')
+
+    def __getattr__(self, attr):
+        # Only called when the attribute is not set yet, i.e. a section that has not been accessed
+        if attr not in self._SECTIONS:
+            return super().__getattr__(attr)
+        path, obj = self._SECTIONS[attr]
+        if obj is None:
+            section = [EmbeddedDatasource(self, element) for element in self._root.iterfind(path)]
+        else:
+            section = tfo.TableauFileObjects(item_class=obj, tag=obj.tag)
+            for element in self._root.iterfind(path):
+                try:
+                    section.append(obj.from_element(element))
+                except TypeError as err:
+                    raise TableauFileError(f'{err}\n\nPre-transform {obj.tag} attributes: {element.attrib}') from err
+        setattr(self, attr, section)
+        return section
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Embedded datasources are part of the XML; they're built from the file again when next accessed
+        state.pop('datasources', None)
+        return state
+
+    def materialized_sections(self):
+        """ Returns: The attribute names of the sections that have been built from the XML """
+        return [attr for attr in self._SECTIONS if attr in self.__dict__]
+
+    def get_datasource(self, name):
+        """ Gets an embedded datasource by name or caption
+
+        Args:
+            name (str): The name or caption of the datasource
+
+        Returns: The EmbeddedDatasource, or None if the workbook doesn't embed it
+        """
+        return next((d for d in self.datasources if name in [d.name, d.caption]), None)
+
+    def save(self):
+        """ Save all changes made to the embedded datasources of the Workbook.
+            Worksheets and dashboards are read-only, and are left untouched in the XML.
+        """
+        for datasource in self.__dict__.get('datasources', []):
+            datasource._write_sections()
         super().save()
 
 
@@ -1,13 +1,294 @@
 import logging
 import sys
 import re
+import weakref
 import xml.etree.ElementTree as ET
-import xmltodict
+from bisect import bisect_left, insort
+from contextvars import ContextVar
 from datetime import datetime
-from dataclasses import dataclass, astuple
-from typing import Literal
+from dataclasses import dataclass, astuple, fields, MISSING
+from types import MemberDescriptorType
+from typing import Literal, get_origin
 from tableau_utilities.general.funcs import transform_tableau_object
 
+XML_NAMESPACE = 'http://www.w3.org/XML/1998/namespace'
+# True while FileObjects are built from an XML Element; the dicts and lists they're built from are created from
+# the Element, and owned by the FileObjects, so their values are used without being copied.
+# The values of dicts passed in by callers are copied, so the FileObjects don't share them
+_from_element = ContextVar('_from_element', default=False)
+
+
+def _qualified_name(name, namespaces):
+    """ Converts a "{uri}local" ElementTree name into the "prefix:local" form that ET.tostring would write
+
+    Args:
+        name (str): The tag or attribute name
+        namespaces (dict): Namespace URI to prefix mapping, updated in place as new URIs are seen
+
+    Returns: The name, with the namespace URI replaced by its prefix
+    """
+    if name[:1] != '{':
+        return name
+    uri, local = name[1:].rsplit('}', 1)
+    if uri == XML_NAMESPACE:
+        return f'xml:{local}'
+    if uri not in namespaces:
+        namespaces[uri] = f'ns{len(namespaces)}'
+    return f'{namespaces[uri]}:{local}'
+
+
+def _copy_value(value):
+    """ Returns: A copy of nested lists and dicts, to compare against later for in-place changes """
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    return value
+
+
+def _element_to_dict(element, namespaces=None):
+    """ Converts an XML Element into the same structure xmltodict.parse returns for it,
+        without serializing the Element to a string first.
+
+    Args:
+        element (ET.Element): The XML Element to convert
+        namespaces (dict): Namespace URI to prefix mapping; only given on recursive calls
+
+    Returns: A dict of attributes ("@name") and child elements, the element text, or None if the element is empty
+    """
+    item = dict()
+    if namespaces is None:
+        # Assign namespace prefixes in the order ET.tostring would, and declare them on the outermost element
+        namespaces = dict()
+        for e in element.iter():
+            _qualified_name(e.tag, namespaces)
+            for key in e.keys():
+                _qualified_name(key, namespaces)
+        for uri, prefix in sorted(namespaces.items(), key=lambda ns: ns[1]):
+            item[f'@xmlns:{prefix}'] = uri
+    for key, value in element.items():
+        item[f'@{_qualified_name(key, namespaces)}'] = value
+    text = element.text or ''
+    for child in element:
+        text += child.tail or ''
+        tag = _qualified_name(child.tag, namespaces)
+        value = _element_to_dict(child, namespaces)
+        if tag not in item:
+            item[tag] = value
+        elif isinstance(item[tag], list):
+            item[tag].append(value)
+        else:
+            item[tag] = [item[tag], value]
+    text = text.strip() or None
+    if not item:
+        return text
+    if text:
+        item['#text'] = text
+    return item
+
+
+def _resolved_name(name, namespaces, attribute=False):
+    """ Converts a "prefix:local" name into the "{uri}local" form that parsing it with ElementTree would give
+
+    Args:
+        name (str): The tag or attribute name
+        namespaces (dict): Prefix to namespace URI mapping of the declarations in scope; None is the default namespace
+        attribute (bool): True if the name is an attribute name, which the default namespace doesn't apply to
+
+    Returns: The name, with the prefix replaced by its namespace URI; names with an undeclared prefix are unchanged
+    """
+    prefix, sep, local = name.partition(':')
+    if not sep:
+        if attribute or None not in namespaces:
+            return name
+        return f'{{{namespaces[None]}}}{name}'
+    if prefix == 'xml':
+        return f'{{{XML_NAMESPACE}}}{local}'
+    if prefix in namespaces:
+        return f'{{{namespaces[prefix]}}}{local}'
+    return name
+
+
+def _emit(builder, tag, value, namespaces, depth):
+    """ Adds the element(s) for the tag and value to the builder, the same way xmltodict.unparse would write them
+
+    Args:
+        builder (ET.TreeBuilder): The TreeBuilder to add the element(s) to
+        tag (str): The tag of the element(s)
+        value (dict|list|str|None): The attributes ("@name"), text ("#text"), and children of the element(s)
+        namespaces (dict): Prefix to namespace URI mapping of the declarations in scope
+        depth (int): The depth of the element(s); used for the pretty-print whitespace
+    """
+    if not hasattr(value, '__iter__') or isinstance(value, (str, dict)):
+        value = [value]
+    for index, v in enumerate(value):
+        if depth == 0 and index > 0:
+            raise ValueError('document with multiple roots')
+        if v is None:
+            v = dict()
+        elif isinstance(v, bool):
+            v = 'true' if v else 'false'
+        elif not isinstance(v, (dict, str)):
+            v = str(v)
+        if isinstance(v, str):
+            v = {'#text': v}
+        text = None
+        attributes = dict()
+        children = list()
+        scope = namespaces
+        for key, item in v.items():
+            if key == '#text':
+                text = item
+            elif isinstance(key, str) and key.startswith('@'):
+                name = key[1:]
+                if name == 'xmlns' and isinstance(item, dict):
+                    scope = {**scope, **{k or None: str(uri) for k, uri in item.items()}}
+                elif name == 'xmlns' or name.startswith('xmlns:'):
+                    scope = {**scope, name[6:] or None: str(item)}
+                else:
+                    attributes[name] = item if isinstance(item, str) else str(item)
+            else:
+                children.append((key, item))
+        name = _resolved_name(tag, scope) if scope or ':' in tag else tag
+        if scope or any(':' in k for k in attributes):
+            attributes = {_resolved_name(k, scope, attribute=True): a for k, a in attributes.items()}
+        if depth:
+            builder.data('\t' * depth)
+        builder.start(name, attributes)
+        if children:
+            builder.data('\n')
+        for child_tag, child_value in children:
+            _emit(builder, child_tag, child_value, scope, depth + 1)
+        if text:
+            text = str(text)
+            # Line endings are normalized when XML is parsed
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            builder.data(text)
+        if children and depth:
+            builder.data('\t' * depth)
+        builder.end(name)
+        if depth:
+            builder.data('\n')
+
+
+def _dict_to_element(tag, value, builder=None):
+    """ Converts the structure xmltodict.unparse takes into an XML Element,
+        without writing it to a string and parsing it again.
+        The Element is the same as ET.fromstring(xmltodict.unparse({tag: value}, pretty=True)) would return.
+
+    Args:
+        tag (str): The tag of the Element
+        value (dict|list|str|None): The attributes ("@name"), text ("#text"), and children of the Element
+        builder (ET.TreeBuilder): The TreeBuilder used to create the Element; defaults to an ElementTree TreeBuilder
+
+    Returns: The XML Element
+    """
+    builder = ET.TreeBuilder() if builder is None else builder
+    _emit(builder, tag, value, dict(), 0)
+    element = builder.close()
+    if element is None:
+        raise ValueError(f'No element to create for {tag}')
+    return element
+
+
+class _DefaultSlot:
+    """ The slot of a dataclass field, that still returns the field's default when accessed on the class;
+        i.e. Column.tag is 'column', as it is for a dataclass without slots
+    """
+    __slots__ = ('slot', 'default')
+
+    def __init__(self, slot, default):
+        self.slot = slot
+        self.default = default
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self.default
+        return self.slot.__get__(obj, owner)
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+    def __delete__(self, obj):
+        self.slot.__delete__(obj)
+
+
+def _to_bool(value):
+    """ Returns: True if the string is true or yes """
+    return value.lower() in ['true', 'yes']
+
+
+def _to_datetime(value):
+    """ Converts a "%Y-%m-%d %H:%M:%S.%f" timestamp string into a datetime, without the overhead of strptime
+
+    Args:
+        value (str): The timestamp, i.e. 2023-01-31 12:00:00.123
+
+    Returns: The datetime
+    """
+    match = _TIMESTAMP.match(value)
+    if match is None:
+        # Let strptime parse (or reject) anything that isn't in the usual form
+        return datetime.strptime(value, '%Y-%m-%d %H:%M:%S.%f')
+    year, month, day, hour, minute, second, fraction = match.groups()
+    return datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second), int(fraction.ljust(6, '0'))
+    )
+
+
+_TIMESTAMP = re.compile(r'(\d{4})-(\d\d)-(\d\d) (\d\d):(\d\d):(\d\d)\.(\d{1,6})$')
+# The attributes of FileObjects that are converted from strings, and the function that converts each
+_COERCIONS = {
+    # Boolean
+    'contains_null': _to_bool,
+    'datatype_customized': _to_bool,
+    'extract_engine': _to_bool,
+    'enabled': _to_bool,
+    'hidden': _to_bool,
+    'incremental_updates': _to_bool,
+    'user_specific': _to_bool,
+    'show_structure': _to_bool,
+    # Integer
+    'approx_count': int,
+    'collation_flag': int,
+    'count': int,
+    'ordinal': int,
+    'port': int,
+    'precision': int,
+    'scale': int,
+    'width': int,
+    # Datetime
+    'timestamp_start': _to_datetime,
+}
+
+
+def _slotted(cls):
+    """ Makes a FileObject class a dataclass, with __slots__ for its fields on Python 3.10+, where dataclass
+        supports slots; so its instances don't each need a dict of their fields. On older versions it's a
+        plain dataclass. Instances can still be given attributes that aren't fields, held in a __dict__
+        that's only created when one is set; see TableauFileObject.__slots__.
+
+        dataclass recreates a class to slot it, so methods of slotted classes call super() with arguments;
+        zero-argument super() would refer to the class before it was recreated.
+        Fields with a default other than None still return it when accessed on the class, i.e. Column.tag;
+        fields defaulting to None are left as plain slots, as they're faster to get and set.
+
+    Args:
+        cls (type): A subclass of TableauFileObject
+
+    Returns: The dataclass
+    """
+    if sys.version_info < (3, 10):
+        return dataclass(cls)
+    slotted_cls = dataclass(slots=True)(cls)
+    for f in fields(slotted_cls):
+        slot = slotted_cls.__dict__.get(f.name)
+        if isinstance(slot, MemberDescriptorType) and f.default is not MISSING and f.default is not None:
+            setattr(slotted_cls, f.name, _DefaultSlot(slot, f.default))
+    return slotted_cls
+
+
 @dataclass
 class TableauFileObject:
     """
@@ -21,99 +302,293 @@ class TableauFileObject:
         The data types of attributes from child class will be converted to the appropriate type,
         if it is provided as a string instead.
     """
+    # Whether the FileObject has been initialized, and change tracking; the XML Element the FileObject was loaded from,
+    # or last saved as, whether an attribute has been set since, and copies of list / dict attributes
+    # to detect in-place changes; and weak references to the TableauFileObjects holding the FileObject,
+    # which are notified when its key attribute changes. Subclasses have slots for their fields as well; see _slotted.
+    # __dict__ holds any other attributes a FileObject is given; it's only created when one is set
+    __slots__ = ('_initialized', '_element', '_dirty', '_snapshot', '_owners', '__dict__')
+    # The attribute TableauFileObjects index items of this class by; None if the items can't be indexed
+    _key_attr = None
+
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls)
+        object.__setattr__(self, '_initialized', False)
+        object.__setattr__(self, '_element', None)
+        object.__setattr__(self, '_dirty', False)
+        object.__setattr__(self, '_snapshot', None)
+        object.__setattr__(self, '_owners', None)
+        return self
 
     def __bool__(self):
-        return len([v for k, v in self.__dict__.items() if v and k != 'tag']) > 0
-
-    def __existing_str_attr(self, attr: str):
-        """ Returns: True if the attribute exists and is a string """
-        return (
-            hasattr(self, attr)
-            and getattr(self, attr)
-            and isinstance(getattr(self, attr), str)
-        )
+        return len([f for f in fields(self) if f.name != 'tag' and getattr(self, f.name)]) > 0
+
+    def __setattr__(self, name, value):
+        # Only fields are tracked; not other attributes the FileObject is given
+        if not self._initialized or name not in self.__dataclass_fields__:
+            return object.__setattr__(self, name, value)
+        object.__setattr__(self, '_dirty', True)
+        if not self._owners or name != self._key_attr and name not in self._tracked_fields():
+            return object.__setattr__(self, name, value)
+        old_value = getattr(self, name)
+        object.__setattr__(self, name, value)
+        # Only the TableauFileObjects holding the FileObject re-index it, or are told its nested items were replaced
+        for ref in self._owners:
+            owner = ref()
+            if owner is None:
+                continue
+            if name == self._key_attr:
+                owner._key_changed(self, old_value)
+            else:
+                owner._item_changed(self)
+
+    @classmethod
+    def _slot_names(cls):
+        """ Returns: The names of the slots of the class and its bases """
+        if '_slots' not in cls.__dict__:
+            cls._slots = tuple(
+                name for c in cls.__mro__ for name in c.__dict__.get('__slots__', ()) if name != '__dict__'
+            )
+        return cls._slots
+
+    def __getstate__(self):
+        # The XML Element is not copied or pickled with the FileObject; a copy has no Element to reuse on save.
+        # Nor are the TableauFileObjects holding it; a copy is held by the TableauFileObjects it's added to
+        state = dict(getattr(self, '__dict__', {}))
+        for name in self._slot_names():
+            if name not in ('_element', '_owners') and hasattr(self, name):
+                state[name] = getattr(self, name)
+        state.pop('_element', None)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def _coercions(cls):
+        """ Returns: The fields of the class that are converted from strings, and the function that converts each """
+        if '_coercion_plan' not in cls.__dict__:
+            cls._coercion_plan = tuple((f.name, _COERCIONS[f.name]) for f in fields(cls) if f.name in _COERCIONS)
+        return cls._coercion_plan
 
-    def __to_int(self, attr: str):
-        """
-            Set the attribute to an integer,
-            if the class has the attribute,
-            and if the attribute is a string.
-        """
-        if self.__existing_str_attr(attr):
-            setattr(self, attr, int(getattr(self, attr)))
+    def __post_init__(self):
+        # Convert string attributes to Booleans, Integers, and Datetimes
+        for name, coerce in self._coercions():
+            value = getattr(self, name)
+            if value and isinstance(value, str):
+                object.__setattr__(self, name, coerce(value))
+        self.__take_snapshot()
+        self._initialized = True
+
+    @classmethod
+    def _tracked_fields(cls):
+        """ Returns: The names of the fields that can hold lists, dicts, or other FileObjects """
+        if '_tracked' not in cls.__dict__:
+            tracked = list()
+            for f in fields(cls):
+                field_type = get_origin(f.type) or f.type
+                if isinstance(field_type, type) and issubclass(field_type, (list, dict, TableauFileObject)):
+                    tracked.append(f.name)
+            cls._tracked = tuple(tracked)
+        return cls._tracked
+
+    def __take_snapshot(self):
+        """ Copies the list / dict attributes, so changes made to them in-place can be detected """
+        snapshot = dict()
+        for name in self._tracked_fields():
+            value = getattr(self, name)
+            if isinstance(value, (list, dict)) and not isinstance(value, TableauFileObjects):
+                snapshot[name] = _copy_value(value)
+        self._snapshot = snapshot or None
+
+    def is_dirty(self):
+        """ Returns: True if the FileObject, or a FileObject within it, changed since it was loaded or saved """
+        if self._dirty:
+            return True
+        if self._snapshot:
+            for name, value in self._snapshot.items():
+                if getattr(self, name) != value:
+                    return True
+        for name in self._tracked_fields():
+            value = getattr(self, name)
+            if isinstance(value, (TableauFileObject, TableauFileObjects)) and value.is_dirty():
+                return True
+        return False
 
-    def __to_bool(self, attr: str):
-        """
-            Set the attribute to a boolean,
-            if the class has the attribute,
-            and if the attribute is a string.
-        """
-        if self.__existing_str_attr(attr):
-            setattr(self, attr, getattr(self, attr).lower() in ['true', 'yes'])
+    def _saved(self, element=None):
+        """ Marks the FileObject, and the FileObjects within it, as unchanged
 
-    def __to_datetime(self, attr: str):
+        Args:
+            element (ET.Element): The XML Element the FileObject was saved as
         """
-            Set the attribute to a datetime,
-            if the class has the attribute,
-            and if the attribute is a string.
+        self._element = element
+        self._dirty = False
+        self.__take_snapshot()
+        for name in self._tracked_fields():
+            value = getattr(self, name)
+            if isinstance(value, (TableauFileObject, TableauFileObjects)):
+                value._saved()
+
+    @classmethod
+    def _lookup_key(cls, item):
+        """ Returns: The key an item equal to the provided item would be indexed by, or None if it's unknown
+
+        Args:
+            item (dict|str|TableauFileObject): The item being looked up
         """
-        if self.__existing_str_attr(attr):
-            setattr(self, attr, datetime.strptime(getattr(self, attr), '%Y-%m-%d %H:%M:%S.%f'))
+        if cls._key_attr is None:
+            return None
+        if isinstance(item, str):
+            return item
+        if isinstance(item, dict):
+            key = item.get(cls._key_attr)
+        else:
+            key = getattr(item, cls._key_attr, None)
+        return key if isinstance(key, str) else None
 
-    def __post_init__(self):
-        # Convert to Boolean
-        self.__to_bool('contains_null')
-        self.__to_bool('datatype_customized')
-        self.__to_bool('extract_engine')
-        self.__to_bool('enabled')
-        self.__to_bool('hidden')
-        self.__to_bool('incremental_updates')
-        self.__to_bool('user_specific')
-        self.__to_bool('show_structure')
-        # Convert to Integer
-        self.__to_int('approx_count')
-        self.__to_int('collation_flag')
-        self.__to_int('count')
-        self.__to_int('ordinal')
-        self.__to_int('port')
-        self.__to_int('precision')
-        self.__to_int('scale')
-        self.__to_int('width')
-        # Convert to Datetime
-        self.__to_datetime('timestamp_start')
+    @classmethod
+    def from_element(cls, element):
+        """ Creates the FileObject directly from an XML Element
+
+        Args:
+            element (ET.Element): The XML Element of the FileObject
+
+        Returns: The FileObject, or None if the Element has no attributes, children, or text
+        """
+        item = _element_to_dict(element)
+        if not item:
+            return None
+        token = _from_element.set(True)
+        try:
+            obj = cls(**transform_tableau_object(item, copy_values=False))
+        finally:
+            _from_element.reset(token)
+        obj._element = element
+        return obj
 
     def dict(self):
         pass
 
-    def xml(self):
-        """ Returns the FileObject as an XML Element """
-        return ET.fromstring(xmltodict.unparse({self.tag: self.dict()}, pretty=True))
+    def xml(self, builder=None):
+        """ Returns the FileObject as an XML Element
+
+        Args:
+            builder (ET.TreeBuilder): The TreeBuilder used to create the Element, i.e. an lxml.etree.TreeBuilder;
+             defaults to an ElementTree TreeBuilder
+        """
+        return _dict_to_element(self.tag, self.dict(), builder)
 
 
 class TableauFileObjects(list):
     """
         A list of FileObject items from a Tableau file,
         i.e. Columns, Folders, Connections, etc
+
+        Items are indexed by the key attribute of the item_class (i.e. Column.name, MetadataRecord.remote_name),
+        so getting, updating, and deleting items doesn't compare against every item in the list.
+        Items that can't be indexed are looked up by comparing against each item, as a list would.
+        Items notify the lists holding them when their key changes, so they're re-indexed by those lists only.
     """
     def __init__(self, seq=(), item_class=TableauFileObject, tag=''):
         # Set and validate
         self._item_class = item_class
         self.tag = tag
+        # Key -> items with that key; valid while _index_version matches _key_version
+        self._index = None
+        self._index_version = None
+        # Incremented whenever the key of an item changes; see FoldersCommon
+        self._key_version = 0
+        # id(item) -> the position of the item when the hints were built, or it was added;
+        # and the sorted positions of the items deleted since, to correct the positions of the items after them
+        self._positions = dict()
+        self._deleted = list()
+        # Whether items have been added, removed, replaced, or reordered since it was loaded or saved
+        self._dirty = False
+        # The object notified whenever the list changes; see _watch
+        self._listener = None
         # Enforce listed items
         if isinstance(seq, (dict, TableauFileObject)):
             seq = [seq]
-        super().__init__(self.__validate_item(item) for item in seq)
+        # Dicts built from XML are owned by the list, so they're converted without copying their values
+        copy_values = not _from_element.get()
+        super().__init__(self.__validate_item(item, copy_values) for item in seq)
+        for item in self:
+            self.__own(item)
+
+    def __reduce__(self):
+        return self.__class__, (list(self), self._item_class, self.tag)
 
     def __getitem__(self, item):
-        if isinstance(item, int):
+        if isinstance(item, (int, slice)):
             return super().__getitem__(item)
         return super().__getitem__(self.index(item))
 
     def __setitem__(self, item, newitem):
-        if isinstance(item, int):
-            super().__setitem__(item, newitem)
+        self._dirty = True
+        self.__notify()
+        if isinstance(item, slice):
+            newitems = list(newitem)
+            super().__setitem__(item, newitems)
+            for _item in newitems:
+                self.__own(_item)
+            self._index_version = None
+            self.__reset_positions()
+            return None
+        if not isinstance(item, int):
+            item = self.index(item)
+        if item < 0:
+            item += len(self)
+        olditem = super().__getitem__(item)
+        super().__setitem__(item, newitem)
+        self.__own(newitem)
+        self.__unindex_item(olditem)
+        self.__index_item(newitem)
+        position = self.__pop_position(olditem, item)
+        if position is None:
+            self.__reset_positions()
         else:
-            super().__setitem__(self.index(item), newitem)
+            self._positions.setdefault(id(newitem), position)
+
+    def __delitem__(self, item):
+        self._dirty = True
+        self.__notify()
+        if isinstance(item, slice):
+            super().__delitem__(item)
+            self._index_version = None
+            self.__reset_positions()
+            return None
+        if not isinstance(item, int):
+            item = self.index(item)
+        if item < 0:
+            item += len(self)
+        olditem = super().__getitem__(item)
+        super().__delitem__(item)
+        self.__unindex_item(olditem)
+        self.__deleted_position(olditem, item)
+
+    def __contains__(self, item):
+        candidates = self.__candidates(item)
+        if candidates is None:
+            return super().__contains__(item)
+        return self.__first_match(item, candidates) is not None
+
+    def __iadd__(self, other):
+        self._dirty = True
+        self.__notify()
+        self._index_version = None
+        self.__reset_positions()
+        other = list(other)
+        for item in other:
+            self.__own(item)
+        return super().__iadd__(other)
+
+    def __imul__(self, other):
+        self._dirty = True
+        self.__notify()
+        self._index_version = None
+        self.__reset_positions()
+        return super().__imul__(other)
 
     def __eq__(self, other):
         same = True
@@ -125,22 +600,209 @@ class TableauFileObjects(list):
                 same = False
         return same
 
-    def __del__(self):
-        self.clear()
-
-    def __validate_item(self, item):
+    def __validate_item(self, item, copy_values=True):
         if isinstance(item, dict):
-            _item = transform_tableau_object(item)
+            _item = transform_tableau_object(item, copy_values)
             try:
                 return self._item_class(**_item)
             except TypeError as err:
-                print(item)
-                print(_item)
                 raise TypeError(err) from err
         elif not isinstance(item, self._item_class):
             raise TypeError(f'Item must be of type {self._item_class.__name__} or dict, not {item.__class__.__name__}')
         return item
 
+    def __own(self, item):
+        """ Registers the list with the item, so the list is notified when the key of the item changes """
+        if not isinstance(item, TableauFileObject):
+            return None
+        owners = tuple(ref for ref in item._owners or () if ref() is not None)
+        if not any(ref() is self for ref in owners):
+            owners += (weakref.ref(self),)
+        object.__setattr__(item, '_owners', owners)
+
+    def _watch(self, listener):
+        """ Registers the object notified, by calling its _list_changed, whenever items are added, removed,
+            replaced, or reordered, or the key or nested items of an item change; replacing any other listener
+
+        Args:
+            listener: The object notified, i.e. FoldersCommon
+        """
+        self._listener = listener
+
+    def _watched_by(self, listener):
+        """ Returns: True if the listener is notified of changes to the list """
+        return self._listener is listener
+
+    def __notify(self):
+        """ Notifies the listener, if any, that the list changed """
+        if self._listener is not None:
+            self._listener._list_changed()
+
+    def _item_changed(self, item):
+        """ Notifies the listener that a nested list, or FileObject, of an item was replaced; called by the item
+
+        Args:
+            item (TableauFileObject): The item
+        """
+        self.__notify()
+
+    def _key_changed(self, item, old_key):
+        """ Re-indexes an item after its key changed; called by the item, for each list holding it
+
+        Args:
+            item (TableauFileObject): The item
+            old_key: The key the item had before it changed
+        """
+        index_valid = self._index is not None and self._index_version == self._key_version
+        self._key_version += 1
+        self.__notify()
+        if not index_valid:
+            return None
+        # The item may have been removed from the list since; then it's not in the index either
+        bucket = self._index.get(old_key, []) if isinstance(old_key, str) else []
+        count = len(bucket)
+        bucket[:] = [_item for _item in bucket if _item is not item]
+        count -= len(bucket)
+        if not bucket:
+            self._index.pop(old_key, None)
+        if not count:
+            self._index_version = self._key_version
+            return None
+        key = self.__item_key(item)
+        if key is None:
+            return None
+        self._index.setdefault(key, []).extend([item] * count)
+        self._index_version = self._key_version
+
+    def __item_key(self, item):
+        """ Returns: The key the item is indexed by, or None if the item can't be indexed """
+        key = getattr(item, self._item_class._key_attr, None) if isinstance(item, TableauFileObject) else None
+        return key if isinstance(key, str) else None
+
+    def __key_index(self):
+        """ Returns: The index of items by key, rebuilt if it's stale; None if the items can't be indexed """
+        if self._index_version == self._key_version:
+            return self._index
+        self._index = None
+        self._index_version = self._key_version
+        if self._item_class._key_attr is None:
+            return None
+        index = dict()
+        for item in self:
+            key = self.__item_key(item)
+            if key is None:
+                return None
+            index.setdefault(key, []).append(item)
+        self._index = index
+        return index
+
+    def __index_item(self, item):
+        """ Adds the item to the key index, if the index is up-to-date """
+        if self._index is None or self._index_version != self._key_version:
+            self._index_version = None
+            return None
+        key = self.__item_key(item)
+        if key is None:
+            self._index_version = None
+        else:
+            self._index.setdefault(key, []).append(item)
+
+    def __unindex_item(self, item):
+        """ Removes the item from the key index, if the index is up-to-date """
+        if self._index is None or self._index_version != self._key_version:
+            self._index_version = None
+            return None
+        key = self.__item_key(item)
+        if key is None:
+            self._index_version = None
+            return None
+        bucket = self._index.get(key, [])
+        for idx, _item in enumerate(bucket):
+            if _item is item:
+                del bucket[idx]
+                break
+        if not bucket:
+            self._index.pop(key, None)
+
+    def __candidates(self, item):
+        """ Returns: The items that could be equal to the provided item,
+            or None if the provided item has to be compared against every item in the list
+        """
+        if isinstance(item, int) and not isinstance(item, bool):
+            return None
+        key = self._item_class._lookup_key(item)
+        if key is None:
+            return None
+        index = self.__key_index()
+        if index is None:
+            return None
+        return index.get(key, ())
+
+    def __reset_positions(self):
+        """ Drops the position hints, when items are inserted or reordered; they're rebuilt when next needed """
+        self._positions = dict()
+        self._deleted = list()
+
+    def __current_position(self, position):
+        """ Returns: The position in the list of an item with the position hint; shifted back by each deleted item
+            that was before it
+        """
+        return position - bisect_left(self._deleted, position)
+
+    def __pop_position(self, item, idx):
+        """ Removes the position hint of the item, at the position in the list
+
+        Returns: The position hint; None if the item had no hint for the position
+        """
+        position = self._positions.pop(id(item), None)
+        if position is None or self.__current_position(position) != idx:
+            return None
+        return position
+
+    def __deleted_position(self, item, idx):
+        """ Records that the item was deleted from the position in the list, so the hints of the items after it
+            are corrected, instead of rebuilt
+        """
+        position = self.__pop_position(item, idx)
+        if position is None:
+            self.__reset_positions()
+        else:
+            insort(self._deleted, position)
+
+    def __added_position(self, item):
+        """ Adds the position hint of an item appended to the list """
+        self._positions.setdefault(id(item), len(self) - 1 + len(self._deleted))
+
+    def __position(self, item):
+        """ Returns: The position of the item (by identity) in the list """
+        position = self._positions.get(id(item))
+        if position is not None:
+            idx = self.__current_position(position)
+            if 0 <= idx < len(self) and super().__getitem__(idx) is item:
+                return idx
+        # Rebuild the hints from the list when the item has none, i.e. it was inserted
+        self._positions = dict(zip(map(id, reversed(self)), range(len(self) - 1, -1, -1)))
+        self._deleted = list()
+        return self._positions[id(item)]
+
+    def __first_match(self, item, candidates):
+        """ Returns: The first candidate in the list that is equal to the item, or None if there isn't one """
+        matches = [c for c in candidates if c is item or c == item]
+        if len(matches) > 1:
+            matches.sort(key=self.__position)
+        return matches[0] if matches else None
+
+    def is_dirty(self):
+        """ Returns: True if items were added, removed, replaced, reordered, or changed since it was loaded or saved """
+        return self._dirty or any(not isinstance(item, TableauFileObject) or item.is_dirty() for item in self)
+
+    def _saved(self):
+        """ Marks the list, and the FileObjects within it, as unchanged """
+        self._dirty = False
+        for item in self:
+            if isinstance(item, TableauFileObject):
+                item._saved(item._element)
+
     def _to_dict(self):
         """ Converts all items into dicts """
         for idx, item in enumerate(self):
@@ -154,6 +816,67 @@ class TableauFileObjects(list):
                 item = transform_tableau_object(item)
                 self[idx] = self._item_class(**item)
 
+    def index(self, item, *args):
+        """ Returns the position of the first item in the list equal to the provided item
+
+        Args:
+            item (dict|str|TableauFileObject): The item to find
+
+        Returns: The position of the item in the list
+        """
+        candidates = None if args else self.__candidates(item)
+        if candidates is None:
+            return super().index(item, *args)
+        match = self.__first_match(item, candidates)
+        if match is None:
+            raise ValueError(f'{item!r} is not in list')
+        return self.__position(match)
+
+    def append(self, item):
+        self._dirty = True
+        self.__notify()
+        super().append(item)
+        self.__own(item)
+        self.__index_item(item)
+        self.__added_position(item)
+
+    def insert(self, index, item):
+        self._dirty = True
+        self.__notify()
+        at_end = index >= len(self)
+        super().insert(index, item)
+        self.__own(item)
+        self.__index_item(item)
+        if at_end:
+            self.__added_position(item)
+        else:
+            self.__reset_positions()
+
+    def remove(self, item):
+        del self[self.index(item)]
+
+    def clear(self):
+        self._dirty = True
+        self.__notify()
+        super().clear()
+        self._index = None
+        self._index_version = None
+        self.__reset_positions()
+
+    def reverse(self):
+        self._dirty = True
+        self.__notify()
+        super().reverse()
+        self._index_version = None
+        self.__reset_positions()
+
+    def sort(self, *args, **kwargs):
+        self._dirty = True
+        self.__notify()
+        super().sort(*args, **kwargs)
+        self._index_version = None
+        self.__reset_positions()
+
     def add(self, item):
         """ Add the provided item to the list
 
@@ -192,9 +915,10 @@ class TableauFileObjects(list):
         """
         if isinstance(item, int):
             return self[item]
-        for _item in self:
-            if _item == item:
-                return _item
+        candidates = self.__candidates(item)
+        if candidates is None:
+            return next((_item for _item in self if _item is item or _item == item), None)
+        return self.__first_match(item, candidates)
 
     def delete(self, item):
         """ Delete the item from the list
@@ -204,7 +928,7 @@ class TableauFileObjects(list):
         """
         self.remove(item)
 
-    def pop(self, item):
+    def pop(self, item=-1):
         """ Delete and return the item from the list
 
         Args:
@@ -212,22 +936,31 @@ class TableauFileObjects(list):
 
         Returns: The Tableau FileObject
         """
-        if isinstance(item, int):
-            return super().pop(item)
-        else:
-            return super().pop(self.index(item))
+        if not isinstance(item, int):
+            item = self.index(item)
+        self._dirty = True
+        self.__notify()
+        if item < 0:
+            item += len(self)
+        popped = super().pop(item)
+        self.__unindex_item(popped)
+        self.__deleted_position(popped, item)
+        return popped
+
+    def xml(self, builder=None):
+        """ Returns the TableauFileObjects as an XML Element
 
-    def xml(self):
-        """ Returns the TableauFileObjects as an XML Element """
-        self._to_dict()
-        xml = ET.fromstring(xmltodict.unparse({self.tag: self}, pretty=True))
-        self._to_obj()
-        return xml
+        Args:
+            builder (ET.TreeBuilder): The TreeBuilder used to create the Element, i.e. an lxml.etree.TreeBuilder;
+             defaults to an ElementTree TreeBuilder
+        """
+        return _dict_to_element(self.tag, [item.dict() for item in self], builder)
 
 
-@dataclass
+@_slotted
 class Column(TableauFileObject):
     """ The Column Tableau file object """
+    _key_attr = 'name'
     name: str
     datatype: Literal['boolean', 'date', 'datetime', 'integer', 'real', 'string', 'table']
     role: Literal['dimension', 'measure']
@@ -270,7 +1003,14 @@ class Column(TableauFileObject):
             self.desc = self.desc['formatted-text']['run']
         if self.calculation and isinstance(self.calculation, dict):
             self.calculation = self.calculation['@formula'] if self.calculation['@class'] == 'tableau' else None
-        super().__post_init__()
+        super(Column, self).__post_init__()
+
+    @classmethod
+    def _lookup_key(cls, item):
+        key = super(Column, cls)._lookup_key(item)
+        if key is not None and not re.match(r'^\[.+]$', key):
+            key = f'[{key}]'
+        return key
 
     def __hash__(self):
         return hash(str(astuple(self)))
@@ -348,9 +1088,10 @@ class Column(TableauFileObject):
         return output
 
 
-@dataclass
+@_slotted
 class Relation(TableauFileObject):
     """ The Relation Tableau file object """
+    _key_attr = 'name'
     type: str
     tag: str = 'relation'
     name: str = None
@@ -376,7 +1117,7 @@ class Relation(TableauFileObject):
             self.relation = TableauFileObjects(self.relation, item_class=Relation, tag=self.tag)
         else:
             self.relation = TableauFileObjects(item_class=Relation, tag=self.tag)
-        super().__post_init__()
+        super(Relation, self).__post_init__()
 
     def dict(self):
         dictionary = {'@type': self.type}
@@ -393,9 +1134,10 @@ class Relation(TableauFileObject):
         return dictionary
 
 
-@dataclass
+@_slotted
 class MappingCol(TableauFileObject):
     """ The mapping Col Tableau file object """
+    _key_attr = 'key'
     key: str
     value: str
     tag: str = 'map'
@@ -406,7 +1148,14 @@ class MappingCol(TableauFileObject):
         if not re.match(r'^\[.+]$', self.value):
             table, column = self.value.split('.')
             self.value = f'[{table}].[{column}]'
-        super().__post_init__()
+        super(MappingCol, self).__post_init__()
+
+    @classmethod
+    def _lookup_key(cls, item):
+        key = super(MappingCol, cls)._lookup_key(item)
+        if key is not None and not re.match(r'^\[.+]$', key):
+            key = f'[{key}]'
+        return key
 
     def __hash__(self):
         return hash(str(astuple(self)))
@@ -435,9 +1184,10 @@ class MappingCol(TableauFileObject):
         return {'@key': self.key, '@value': self.value}
 
 
-@dataclass
+@_slotted
 class FolderItem(TableauFileObject):
     """ The FolderItem Tableau file object, is an Item of the Folder.folder_item list """
+    _key_attr = 'name'
     name: str
     type: str = 'field'
     tag: str = 'folder-item'
@@ -458,9 +1208,10 @@ class FolderItem(TableauFileObject):
         return {'@name': self.name, '@type': self.type}
 
 
-@dataclass
+@_slotted
 class Folder(TableauFileObject):
     """ The Folder Tableau file object """
+    _key_attr = 'name'
     name: str
     tag: str = 'folder'
     role: str = None
@@ -471,7 +1222,7 @@ class Folder(TableauFileObject):
             self.folder_item = TableauFileObjects(self.folder_item, item_class=FolderItem, tag='folder-item')
         else:
             self.folder_item = TableauFileObjects(item_class=FolderItem, tag='folder-item')
-        super().__post_init__()
+        super(Folder, self).__post_init__()
 
     def __hash__(self):
         return hash(str(astuple(self)))
@@ -502,9 +1253,17 @@ class Folder(TableauFileObject):
         return output
 
 
-@dataclass
+@_slotted
 class FoldersCommon(TableauFileObject):
-    """ The FoldersCommon Tableau file object """
+    """
+        The FoldersCommon Tableau file object.
+
+        Folders are indexed by name (see TableauFileObjects), and folder-items by the name of their column;
+        so the folders of a column are found without searching every folder.
+        The index is kept up-to-date by add, delete, update, add_folder_item, and delete_folder_item,
+        and is rebuilt when folders or folder-items are changed directly; the lists of folders and folder-items
+        notify the FoldersCommon of each change, which increments its version.
+    """
     folder: TableauFileObjects[Folder] = None
     tag: str = 'folders-common'
 
@@ -513,7 +1272,10 @@ class FoldersCommon(TableauFileObject):
             self.folder = TableauFileObjects(self.folder, item_class=Folder, tag='folder')
         else:
             self.folder = TableauFileObjects(item_class=Folder, tag='folder')
-        super().__post_init__()
+        self._column_index = None
+        self._column_index_version = None
+        self._folders_version = 0
+        super(FoldersCommon, self).__post_init__()
 
     def __getitem__(self, item):
         return self.folder[item]
@@ -541,6 +1303,48 @@ class FoldersCommon(TableauFileObject):
                 return False
         return True
 
+    def _list_changed(self):
+        """ Increments the version of the folders; called by the lists of folders and folder-items as they change """
+        self._folders_version += 1
+
+    def __column_index(self):
+        """ Returns: The index of column name -> the folders with a folder-item for the column; rebuilt if it's stale """
+        # The list of folders is no longer watched if it was replaced, or copied
+        if (self._column_index is not None and self._column_index_version == self._folders_version
+                and self.folder._watched_by(self)):
+            return self._column_index
+        self.folder._watch(self)
+        index = dict()
+        for folder in self.folder:
+            folder.folder_item._watch(self)
+            for folder_item in folder.folder_item:
+                folders = index.setdefault(folder_item.name, [])
+                if not folders or folders[-1] is not folder:
+                    folders.append(folder)
+        self._column_index = index
+        self._column_index_version = self._folders_version
+        return index
+
+    def __index_folder(self, folder, index):
+        """ Adds the folder to the index, for each of its folder-items """
+        folder.folder_item._watch(self)
+        for folder_item in folder.folder_item:
+            folders = index.setdefault(folder_item.name, [])
+            if not any(f is folder for f in folders):
+                folders.append(folder)
+                if len(folders) > 1:
+                    folders.sort(key=self.folder.index)
+
+    @staticmethod
+    def __unindex_folder(folder, index, column_names=None):
+        """ Removes the folder from the index, for each of its folder-items, or each of the column names """
+        for name in column_names or [folder_item.name for folder_item in folder.folder_item]:
+            folders = [f for f in index.get(name, ()) if f is not folder]
+            if folders:
+                index[name] = folders
+            else:
+                index.pop(name, None)
+
     def get(self, folder):
         """ Get the Folder object from FoldersCommon
 
@@ -551,13 +1355,43 @@ class FoldersCommon(TableauFileObject):
         """
         return self.folder.get(folder)
 
+    def folders_of(self, column_name):
+        """ Get the folders with a folder-item for the column
+
+        Args:
+            column_name (str): The name of the column, i.e. [COLUMN_NAME]
+
+        Returns: A list of Folder objects, in the order of the folders
+        """
+        return list(self.__column_index().get(column_name, ()))
+
+    def folder_of(self, column_name):
+        """ Get the first folder with a folder-item for the column
+
+        Args:
+            column_name (str): The name of the column, i.e. [COLUMN_NAME]
+
+        Returns: The Folder object, or None if the column isn't in a folder
+        """
+        folders = self.__column_index().get(column_name)
+        return folders[0] if folders else None
+
+    def column_folders(self):
+        """ Returns: A dict of column name -> the folders with a folder-item for the column, in folder order """
+        return {name: list(folders) for name, folders in self.__column_index().items()}
+
     def add(self, folder):
         """ Add the Folder object to FoldersCommon
 
         Args:
             folder (Folder): The Folder object to add
         """
+        index = self.__column_index()
+        count = len(self.folder)
         self.folder.add(folder)
+        if len(self.folder) > count:
+            self.__index_folder(self.folder[-1], index)
+        self._column_index_version = self._folders_version
 
     def delete(self, folder):
         """ Delete the Folder object from FoldersCommon
@@ -565,7 +1399,10 @@ class FoldersCommon(TableauFileObject):
         Args:
             folder (Folder|str|int): The Folder, Folder.name, or Folder index, to delete
         """
-        self.folder.delete(folder)
+        index = self.__column_index()
+        deleted = self.folder.pop(folder if isinstance(folder, int) else self.folder.index(folder))
+        self.__unindex_folder(deleted, index)
+        self._column_index_version = self._folders_version
 
     def update(self, folder):
         """ Update the FoldersCommon Folder object
@@ -573,15 +1410,57 @@ class FoldersCommon(TableauFileObject):
         Args:
             folder (Folder): The Folder object to update
         """
+        index = self.__column_index()
+        old_folder = self.folder.get(folder)
         self.folder.update(folder)
+        if old_folder is not None:
+            self.__unindex_folder(old_folder, index)
+        self.__index_folder(self.folder.get(folder), index)
+        self._column_index_version = self._folders_version
+
+    def add_folder_item(self, folder, folder_item):
+        """ Add a FolderItem to the Folder, if it's not already in it
+
+        Args:
+            folder (Folder|str): The Folder, or Folder.name
+            folder_item (FolderItem|dict|str): The FolderItem, or the name of its column
+        """
+        index = self.__column_index()
+        folder = self.folder.get(folder)
+        if isinstance(folder_item, str):
+            folder_item = FolderItem(name=folder_item)
+        count = len(folder.folder_item)
+        folder.folder_item.add(folder_item)
+        if len(folder.folder_item) > count:
+            self.__index_folder(folder, index)
+        self._column_index_version = self._folders_version
+
+    def delete_folder_item(self, folder, folder_item):
+        """ Delete a FolderItem from the Folder
+
+        Args:
+            folder (Folder|str): The Folder, or Folder.name
+            folder_item (FolderItem|dict|str): The FolderItem, or the name of its column
+        """
+        index = self.__column_index()
+        folder = self.folder.get(folder)
+        name = FolderItem._lookup_key(folder_item)
+        folder.folder_item.delete(folder_item)
+        if name is None:
+            self._column_index = None
+            return None
+        if folder.folder_item.get(name) is None:
+            self.__unindex_folder(folder, index, [name])
+        self._column_index_version = self._folders_version
 
     def dict(self):
         return {'folder': [f.dict() for f in self.folder]}
 
 
-@dataclass
+@_slotted
 class DrillPath(TableauFileObject):
     """ The DrillPath Tableau file object """
+    _key_attr = 'name'
     name: str
     field: list[str] = None
     tag: str = 'drill-path'
@@ -604,7 +1483,7 @@ class DrillPath(TableauFileObject):
         return output
 
 
-@dataclass
+@_slotted
 class DrillPaths(TableauFileObject):
     """ The DrillPaths Tableau file object """
     drill_path: TableauFileObjects[DrillPath] = None
@@ -615,7 +1494,7 @@ class DrillPaths(TableauFileObject):
             self.drill_path = TableauFileObjects(self.drill_path, item_class=DrillPath, tag='drill-path')
         else:
             self.drill_path = TableauFileObjects(item_class=DrillPath, tag='drill-path')
-        super().__post_init__()
+        super(DrillPaths, self).__post_init__()
 
     def __getitem__(self, item):
         return self.drill_path[item]
@@ -681,7 +1560,7 @@ class DrillPaths(TableauFileObject):
         return {'drill-path': [f.dict() for f in self.drill_path]}
 
 
-@dataclass
+@_slotted
 class Connection(TableauFileObject):
     """ The Connection Tableau file object """
     tag: str = 'connection'
@@ -766,7 +1645,7 @@ class Connection(TableauFileObject):
         return output
 
 
-@dataclass
+@_slotted
 class NamedConnection(TableauFileObject):
     """ The NamedConnection Tableau file object """
     name: str
@@ -776,8 +1655,8 @@ class NamedConnection(TableauFileObject):
 
     def __post_init__(self):
         if self.connection:
-            self.connection = Connection(**transform_tableau_object(self.connection))
-        super().__post_init__()
+            self.connection = Connection(**transform_tableau_object(self.connection, not _from_element.get()))
+        super(NamedConnection, self).__post_init__()
 
     def __hash__(self):
         return hash(str(astuple(self)))
@@ -801,9 +1680,10 @@ class NamedConnection(TableauFileObject):
         }
 
 
-@dataclass
+@_slotted
 class MetadataRecord(TableauFileObject):
     """ The MetadataRecord Tableau file object """
+    _key_attr = 'remote_name'
     class_name: str
     remote_name: str
     remote_type: str
@@ -827,7 +1707,7 @@ class MetadataRecord(TableauFileObject):
     def __post_init__(self):
         if self.attributes and isinstance(self.attributes, dict):
             self.attributes = self.attributes['attribute']
-        super().__post_init__()
+        super(MetadataRecord, self).__post_init__()
 
     def __hash__(self):
         return hash(str(astuple(self)))
@@ -878,7 +1758,7 @@ class MetadataRecord(TableauFileObject):
         return output
 
 
-@dataclass
+@_slotted
 class RefreshEvent(TableauFileObject):
     """ The RefreshEvent Tableau file object """
     add_from_file_path: str = None
@@ -902,7 +1782,7 @@ class RefreshEvent(TableauFileObject):
         return dictionary
 
 
-@dataclass
+@_slotted
 class Refresh(TableauFileObject):
     """ The Refresh Tableau file object """
     tag: str = 'refresh'
@@ -912,8 +1792,8 @@ class Refresh(TableauFileObject):
 
     def __post_init__(self):
         if isinstance(self.refresh_event, dict):
-            self.refresh_event = RefreshEvent(**transform_tableau_object(self.refresh_event))
-        super().__post_init__()
+            self.refresh_event = RefreshEvent(**transform_tableau_object(self.refresh_event, not _from_element.get()))
+        super(Refresh, self).__post_init__()
 
     def dict(self):
         dictionary = dict()
@@ -928,7 +1808,7 @@ class Refresh(TableauFileObject):
         return dictionary
 
 
-@dataclass
+@_slotted
 class ParentConnection(TableauFileObject):
     """ The parent Connection Tableau file object """
     tag: str = 'connection'
@@ -952,9 +1832,9 @@ class ParentConnection(TableauFileObject):
 
     def __post_init__(self):
         if self.refresh is not None:
-            self.refresh = Refresh(**transform_tableau_object(self.refresh))
+            self.refresh = Refresh(**transform_tableau_object(self.refresh, not _from_element.get()))
         if self.relation is not None:
-            self.relation = Relation(**transform_tableau_object(self.relation))
+            self.relation = Relation(**transform_tableau_object(self.relation, not _from_element.get()))
         if self.named_connections is not None:
             self.named_connections = TableauFileObjects(
                 self.named_connections['named-connection'], item_class=NamedConnection, tag='named-connections')
@@ -970,7 +1850,7 @@ class ParentConnection(TableauFileObject):
             )
         else:
             self.metadata_records = TableauFileObjects(item_class=MetadataRecord, tag='metadata-records')
-        super().__post_init__()
+        super(ParentConnection, self).__post_init__()
 
     def __getitem__(self, item):
         if item in self.named_connections:
@@ -1042,7 +1922,7 @@ class ParentConnection(TableauFileObject):
         return dictionary
 
 
-@dataclass
+@_slotted
 class Extract(TableauFileObject):
     """ The Extract Tableau file object """
     object_id: str = None
@@ -1055,8 +1935,8 @@ class Extract(TableauFileObject):
 
     def __post_init__(self):
         if self.connection is not None:
-            self.connection = ParentConnection(**transform_tableau_object(self.connection))
-        super().__post_init__()
+            self.connection = ParentConnection(**transform_tableau_object(self.connection, not _from_element.get()))
+        super(Extract, self).__post_init__()
 
     def dict(self):
         dictionary = dict()
@@ -1075,7 +1955,7 @@ class Extract(TableauFileObject):
         return dictionary
 
 
-@dataclass
+@_slotted
 class Layout(TableauFileObject):
     """ The Layout Tableau file object """
     dim_percentage: str = None
@@ -1099,12 +1979,8 @@ class Layout(TableauFileObject):
             dictionary['@show-structure'] = str(self.show_structure).lower()
         return dictionary
 
-    def xml(self):
-        """ Returns the FileObject as an XML Element """
-        this_xml =  ET.fromstring(xmltodict.unparse({self.tag: self.dict()}, pretty=True))
-        return this_xml
 
-@dataclass
+@_slotted
 class Aliases(TableauFileObject):
     """ The Aliases Tableau file object """
     enabled: bool = True
@@ -1114,7 +1990,7 @@ class Aliases(TableauFileObject):
         return {'@enabled': 'yes' if self.enabled else 'no'}
 
 
-@dataclass
+@_slotted
 class DateOptions(TableauFileObject):
     """ The DateOptions Tableau file object """
     fiscal_year_start: str = None
@@ -1130,7 +2006,7 @@ class DateOptions(TableauFileObject):
         return dictionary
 
 
-@dataclass
+@_slotted
 class ColumnInstance(TableauFileObject):
     """ The ColumnInstance Tableau file object """
     column: str = None
@@ -1155,6 +2031,174 @@ class ColumnInstance(TableauFileObject):
         return dictionary
 
 
+@_slotted
+class DatasourceDependencies(TableauFileObject):
+    """ The DatasourceDependencies Tableau file object; the columns of a datasource that a worksheet uses """
+    _key_attr = 'datasource'
+    datasource: str
+    column: TableauFileObjects[Column] = None
+    column_instance: TableauFileObjects[ColumnInstance] = None
+    tag: str = 'datasource-dependencies'
+
+    def __post_init__(self):
+        self.column = TableauFileObjects(self.column or [], item_class=Column, tag='column')
+        self.column_instance = TableauFileObjects(
+            self.column_instance or [], item_class=ColumnInstance, tag='column-instance'
+        )
+        super(DatasourceDependencies, self).__post_init__()
+
+    def __hash__(self):
+        return hash(str(astuple(self)))
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return self.datasource == other
+        if isinstance(other, dict):
+            return self.datasource == other.get('datasource')
+        if isinstance(other, (DatasourceDependencies, object)):
+            return self.datasource == getattr(other, 'datasource', None)
+        return False
+
+    @classmethod
+    def from_element(cls, element):
+        """ Creates the DatasourceDependencies from an XML Element, from only its column and column-instance elements
+
+        Args:
+            element (ET.Element): The XML Element of the DatasourceDependencies
+
+        Returns: The DatasourceDependencies
+        """
+        columns = [Column.from_element(e) for e in element.iterfind('column')]
+        column_instances = [ColumnInstance.from_element(e) for e in element.iterfind('column-instance')]
+        obj = cls(
+            datasource=element.get('datasource'),
+            column=[c for c in columns if c is not None],
+            column_instance=[c for c in column_instances if c is not None]
+        )
+        obj._element = element
+        return obj
+
+    def dict(self):
+        dictionary = {'@datasource': self.datasource}
+        if self.column:
+            dictionary['column'] = [c.dict() for c in self.column]
+        if self.column_instance:
+            dictionary['column-instance'] = [c.dict() for c in self.column_instance]
+        return dictionary
+
+
+@_slotted
+class Worksheet(TableauFileObject):
+    """ The Worksheet Tableau file object.
+        Only the datasources and columns the worksheet uses are read from the XML;
+        the Worksheet can't be written back to XML.
+    """
+    _key_attr = 'name'
+    name: str
+    datasources: list = None
+    datasource_dependencies: TableauFileObjects[DatasourceDependencies] = None
+    tag: str = 'worksheet'
+
+    def __post_init__(self):
+        if self.datasources is None:
+            self.datasources = list()
+        self.datasource_dependencies = TableauFileObjects(
+            self.datasource_dependencies or [], item_class=DatasourceDependencies, tag='datasource-dependencies'
+        )
+        super(Worksheet, self).__post_init__()
+
+    def __hash__(self):
+        return hash(str(astuple(self)))
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return self.name == other
+        if isinstance(other, dict):
+            return self.name == other.get('name')
+        if isinstance(other, (Worksheet, object)):
+            return self.name == getattr(other, 'name', None)
+        return False
+
+    @classmethod
+    def from_element(cls, element):
+        """ Creates the Worksheet from an XML Element, without reading its layout, style, or marks
+
+        Args:
+            element (ET.Element): The XML Element of the Worksheet
+
+        Returns: The Worksheet
+        """
+        view = element.find('table/view')
+        datasources, dependencies = list(), list()
+        if view is not None:
+            datasources = [d.get('name') for d in view.iterfind('datasources/datasource')]
+            dependencies = [DatasourceDependencies.from_element(e) for e in view.iterfind('datasource-dependencies')]
+        obj = cls(name=element.get('name'), datasources=datasources, datasource_dependencies=dependencies)
+        obj._element = element
+        return obj
+
+    def columns(self, datasource=None):
+        """ Gets the columns the worksheet uses
+
+        Args:
+            datasource (str): The name of a datasource, to only get the columns of that datasource
+
+        Returns: A list of (datasource name, Column) for each column
+        """
+        return [
+            (dependencies.datasource, column)
+            for dependencies in self.datasource_dependencies
+            if datasource is None or dependencies.datasource == datasource
+            for column in dependencies.column
+        ]
+
+
+@_slotted
+class Dashboard(TableauFileObject):
+    """ The Dashboard Tableau file object.
+        Only the worksheets on the dashboard are read from the XML; the Dashboard can't be written back to XML.
+    """
+    _key_attr = 'name'
+    name: str
+    worksheets: list = None
+    tag: str = 'dashboard'
+
+    def __post_init__(self):
+        if self.worksheets is None:
+            self.worksheets = list()
+        super(Dashboard, self).__post_init__()
+
+    def __hash__(self):
+        return hash(str(astuple(self)))
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return self.name == other
+        if isinstance(other, dict):
+            return self.name == other.get('name')
+        if isinstance(other, (Dashboard, object)):
+            return self.name == getattr(other, 'name', None)
+        return False
+
+    @classmethod
+    def from_element(cls, element):
+        """ Creates the Dashboard from an XML Element, without reading its layout or style
+
+        Args:
+            element (ET.Element): The XML Element of the Dashboard
+
+        Returns: The Dashboard
+        """
+        worksheets = list()
+        for zone in element.iterfind('.//zone[@name]'):
+            # Worksheet zones are the only named zones without a type; filters, legends, etc, have one
+            if zone.get('type-v2') is None and zone.get('type') is None and zone.get('name') not in worksheets:
+                worksheets.append(zone.get('name'))
+        obj = cls(name=element.get('name'), worksheets=worksheets)
+        obj._element = element
+        return obj
+
+
 if __name__ == '__main__':
     t1 = Column(name='Test', datatype='integer', role='measure', type='quantitative', calculation='COUNT(1)')
     t2 = Column(name='Test', datatype='string', role='dimension', type='ordinal')
@@ -0,0 +1,84 @@
+import errno
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+# The environment variable of the directory temp workspaces are created in, when one isn't set
+WORKSPACE_ROOT_ENV = 'TABLEAU_UTILITIES_WORKSPACE_ROOT'
+
+# The directory set with set_workspace_root
+_workspace_root = None
+
+
+def set_workspace_root(directory):
+    """ Sets the directory temp workspaces are created in, for every Tableau file; i.e. a tmpfs mount.
+        Otherwise, the directory of the TABLEAU_UTILITIES_WORKSPACE_ROOT environment variable is used,
+        or workspaces are created next to the file being processed.
+
+    Args:
+        directory (str): The directory; None to unset it
+    """
+    global _workspace_root
+    _workspace_root = os.path.abspath(os.path.expanduser(directory)) if directory else None
+
+
+def workspace_root(default=None):
+    """ Gets the directory temp workspaces are created in
+
+    Args:
+        default (str): The directory to use if no workspace root is set; i.e. the directory of the file
+
+    Returns: The directory
+    """
+    return _workspace_root or os.getenv(WORKSPACE_ROOT_ENV) or default
+
+
+@contextmanager
+def temp_workspace(directory=None, prefix='__TEMP_'):
+    """ Creates a uniquely named temp directory, which is removed on exit, even if an error is raised.
+        Names never collide; so the same file, or files with the same name, can be processed concurrently
+        by threads or processes.
+
+    Args:
+        directory (str): The directory to create the workspace in, if no workspace root is set;
+         defaults to the system temp directory
+        prefix (str): The prefix of the workspace's name
+
+    Returns: The path of the workspace
+    """
+    root = workspace_root(directory)
+    if root:
+        os.makedirs(root, exist_ok=True)
+    path = tempfile.mkdtemp(prefix=prefix, dir=root)
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def replace_file(source, target):
+    """ Replaces the target file with the source file, atomically;
+        so the target is never partially written, even if the workspace is on a different filesystem.
+
+    Args:
+        source (str): The path of the new file; moved to the target
+        target (str): The path of the file to replace
+    """
+    try:
+        os.replace(source, target)
+        return None
+    except OSError as err:
+        if err.errno != errno.EXDEV:
+            raise
+    # Files can't be moved atomically across filesystems; copy it next to the target first
+    fd, temp_path = tempfile.mkstemp(prefix='__tmp_', dir=os.path.dirname(os.path.abspath(target)))
+    os.close(fd)
+    try:
+        shutil.copy2(source, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.remove(source)
@@ -0,0 +1 @@
+from .tableau_server import AsyncTableauServer
@@ -0,0 +1,111 @@
+import asyncio
+from tableau_utilities.tableau_server.static import TableauConnectionError
+
+
+async def run_blocking(func, *args):
+    """ Runs a blocking function, i.e. reading or writing a file, in the default executor of the event loop;
+        so other tasks keep running while it's blocked
+
+    Args:
+        func (callable): The function
+        args: The arguments of the function
+
+    Returns: The result of the function
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+async def validate_response(response):
+    """ Validates the response received from an API call
+
+    Args:
+        response (aiohttp.ClientResponse): An aiohttp ClientResponse object
+
+    Returns: The response content as a JSON dict
+    """
+    info = await response.json(content_type=None)
+    if response.status >= 400:
+        error = (info or {}).get('error', {})
+        raise TableauConnectionError(
+            f'\nError: {error.get("code")}: {error.get("summary")} - {error.get("detail")}\n'
+            f'{response.status} {response.reason} for url: {response.url}',
+            status_code=response.status, code=error.get('code')
+        )
+    return info
+
+
+class AsyncBase:
+    """ Base functionality inherited by AsyncTableauServer class, and Core AsyncTableauServer classes """
+    def __init__(self, parent):
+        self.session = parent.session
+        self.user: str = parent.user
+        self._pw: str = parent._pw
+        self._personal_access_token_secret: str = parent._personal_access_token_secret
+        self.personal_access_token_name: str = parent.personal_access_token_name
+        self.host: str = parent.host
+        self.site: str = parent.site
+        self.api: float = parent.api
+        self._auth_token = parent._auth_token
+        self.url: str = parent.url
+        self.page_size: int = parent.page_size
+        self.connection_limit: int = parent.connection_limit
+        self.get = parent.get if hasattr(parent, 'get') else None
+
+    async def _request(self, method, url, headers=None, **params):
+        """ Request for the Tableau REST API
+
+        Args:
+            method (str): The HTTP method of the call, i.e. GET
+            url (str): URL endpoint for the call
+            headers (dict): The call header
+
+        Returns: The response content as a JSON dict
+        """
+        async with self.session.request(method, url, headers=headers, **params) as res:
+            return await validate_response(res)
+
+    async def _get(self, url, headers=None, **params):
+        """ GET request for the Tableau REST API
+
+        Args:
+            url (str): URL endpoint for GET call
+            headers (dict): GET call header
+
+        Returns: The response content as a JSON dict
+        """
+        return await self._request('GET', url, headers=headers, **params)
+
+    async def _post(self, url, json=None, headers=None, **params):
+        """ POST request for the Tableau REST API
+
+        Args:
+            url (str): URL endpoint for POST call
+            json (dict): The POST call JSON payload
+            headers (dict): POST call header
+
+        Returns: The response content as a JSON dict
+        """
+        return await self._request('POST', url, json=json, headers=headers, **params)
+
+    async def _put(self, url, json=None, headers=None, **params):
+        """ PUT request for the Tableau REST API
+
+        Args:
+            url (str): URL endpoint for PUT call
+            json (dict): The PUT call JSON payload
+            headers (dict): PUT call header
+
+        Returns: The response content as a JSON dict
+        """
+        return await self._request('PUT', url, json=json, headers=headers, **params)
+
+    async def _delete(self, url, headers=None, **params):
+        """ DELETE request for the Tableau REST API
+
+        Args:
+            url (str): URL endpoint for DELETE call
+            headers (dict): DELETE call header
+
+        Returns: The response content as a JSON dict
+        """
+        return await self._request('DELETE', url, headers=headers, **params)
@@ -0,0 +1,63 @@
+import os
+from tableau_utilities.tableau_server.static import TableauConnectionError
+from tableau_utilities.tableau_server.aio.base import AsyncBase, run_blocking
+
+
+class AsyncDownload(AsyncBase):
+    """ Core Download functionality of the AsyncTableauServer class """
+    def __init__(self, parent):
+        super().__init__(parent)
+
+    async def __download_object(self, url, file_dir=None):
+        """ Downloads a datasource from Tableau Online
+
+        Args:
+            url (str): The URL for the request
+            file_dir (str): The file directory to write the file to
+
+        Returns: The absolute path to the file
+        """
+        async with self.session.get(url) as res:
+            if res.status >= 400:
+                raise TableauConnectionError(f'{res.status} {res.reason} for url: {res.url}', status_code=res.status)
+            file_name = os.path.basename(res.content_disposition.filename)
+            if file_dir:
+                await run_blocking(lambda: os.makedirs(file_dir, exist_ok=True))
+                path = os.path.join(file_dir, file_name)
+            else:
+                path = file_name
+            # The file is opened, written, and closed in the executor, so the event loop isn't blocked
+            f = await run_blocking(open, path, 'wb')
+            try:
+                # Download in 1mb chunks
+                async for chunk in res.content.iter_chunked(1024 * 1024):
+                    await run_blocking(f.write, chunk)
+            finally:
+                await run_blocking(f.close)
+        return os.path.abspath(path)
+
+    async def datasource(self, datasource_id, file_dir=None, include_extract=False):
+        """ Downloads a datasource from Tableau Online
+
+        Args:
+            datasource_id (str):
+            file_dir (str):
+            include_extract (bool):
+        """
+        return await self.__download_object(
+            f'{self.url}/datasources/{datasource_id}/content?includeExtract={include_extract}',
+            file_dir
+        )
+
+    async def workbook(self, workbook_id, file_dir=None, include_extract=False):
+        """ Downloads a workbook from Tableau Online
+
+        Args:
+            workbook_id (str):
+            file_dir (str):
+            include_extract (bool):
+        """
+        return await self.__download_object(
+            f'{self.url}/workbooks/{workbook_id}/content?includeExtract={include_extract}',
+            file_dir
+        )
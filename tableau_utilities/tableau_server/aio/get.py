@@ -0,0 +1,347 @@
+import asyncio
+import logging
+import math
+from collections import deque
+import tableau_utilities.tableau_server.tableau_server_objects as tso
+from tableau_utilities.tableau_server.static import (
+    TableauConnectionError, filter_expression, is_rejected_filter, transform_tableau_object)
+from tableau_utilities.tableau_server.aio.base import AsyncBase
+
+
+class AsyncGet(AsyncBase):
+    """ Core Get functionality of the AsyncTableauServer class """
+    def __init__(self, parent):
+        super().__init__(parent)
+
+    @staticmethod
+    def __page_objects(response, obj):
+        """ Yields the objects in a page of a response, transformed """
+        for obj_dict in response.get(f'{obj}s', {}).get(obj, []):
+            transform_tableau_object(obj_dict)
+            yield obj_dict
+
+    async def __get_objects_pager(self, url, obj, page_size=None):
+        """ GET all objects in the site.
+            The first page gives the total number of objects; the remaining pages are then fetched concurrently,
+            a bounded number at a time, and the objects are yielded in order.
+        Args:
+            url: The url of for the request, i.e /api/api-version/sites/site-id/groups
+            obj: The name of the object being requested
+            page_size: The size of the page (number of objects per page); defaults to the page size of the server
+        Returns: An async generator of the objects
+        """
+        page_size = page_size or self.page_size
+        separator = '&' if '?' in url else '?'
+
+        def get_page(page):
+            page_url = f'{url}{separator}pageSize={page_size}&pageNumber={page}'
+            logging.info('GET %s --> %s/%s', page_url, min(page * page_size, total_available), total_available)
+            return self._get(page_url)
+
+        total_available = page_size
+        response = await get_page(1)
+        total_available = int(response.get('pagination', {}).get('totalAvailable', 0))
+        for obj_dict in self.__page_objects(response, obj):
+            yield obj_dict
+        pages = math.ceil(total_available / page_size)
+        if pages <= 1:
+            return
+        # Pages being fetched, in order; at most as many as there are connections, so pages aren't fetched
+        # much faster than they're consumed
+        window = deque()
+        window_size = self.connection_limit or pages
+        next_page = 2
+        try:
+            while window or next_page <= pages:
+                while next_page <= pages and len(window) < window_size:
+                    window.append(asyncio.ensure_future(get_page(next_page)))
+                    next_page += 1
+                for obj_dict in self.__page_objects(await window.popleft(), obj):
+                    yield obj_dict
+        finally:
+            # Pages that haven't been fetched yet are cancelled, if the objects stop being consumed
+            for task in window:
+                task.cancel()
+
+    async def __first_match(self, url, obj, cls, matches):
+        """ Returns: The first object listed by the url that matches; None if no object matches """
+        pager = self.__get_objects_pager(url, obj)
+        try:
+            async for d in pager:
+                o = cls(**d)
+                if matches(o):
+                    return o
+        finally:
+            # Closing the pager cancels the pages it's still fetching, once a match is found
+            await pager.aclose()
+        return None
+
+    async def __find(self, url, obj, cls, filters, matches):
+        """ Finds an object in the site, with the objects filtered by the server; so only the objects that match
+            are listed, in one request. All objects are listed instead, if a value can't be filtered on,
+            or the server rejects the filter as a bad request.
+        Args:
+            url: The url listing all objects, i.e /api/api-version/sites/site-id/datasources
+            obj: The name of the object being requested
+            cls: The Tableau object class of the object
+            filters (dict): The value of each field the server filters the objects on, i.e. {'name': 'Sales'}
+            matches (callable): True for the object being found; objects are matched again as the server
+                may compare values differently, i.e. ignoring case
+        Returns: The first object that matches; None if no object matches
+        """
+        expression = filter_expression(**filters)
+        if expression:
+            separator = '&' if '?' in url else '?'
+            try:
+                return await self.__first_match(f'{url}{separator}filter={expression}', obj, cls, matches)
+            except TableauConnectionError as err:
+                # Only a rejected filter is retried without it; other errors, i.e. 401 / 403, are raised
+                if not is_rejected_filter(err):
+                    raise
+                logging.warning('Filtering %ss failed; listing all %ss instead: %s', obj, obj, err)
+        return await self.__first_match(url, obj, cls, matches)
+
+    def __datasources_url(self):
+        """ Returns: The url listing all datasources, with the fields of each """
+        return f"{self.url}/datasources?fields=_default_" \
+               f",favoritesTotal" \
+               f",databaseName" \
+               f",connectedWorkbooksCount" \
+               f",hasAlert" \
+               f",hasExtracts" \
+               f",isPublished" \
+               f",serverName"
+
+    async def datasources(self):
+        """ Queries for all datasources in the site
+            URI GET /api/api-version/sites/site-id/datasources
+        Returns: All datasources in the site
+        """
+        async for d in self.__get_objects_pager(self.__datasources_url(), 'datasource'):
+            yield tso.Datasource(**d)
+
+    async def datasource(self, datasource_id=None, datasource_name=None, datasource_project=None):
+        """ Queries for a datasource in the site
+            URI GET /api/api-version/sites/site-id/datasources/datasource_id
+
+            (Optional) Can get the datasource either by ID, or by name & project;
+            the datasources are filtered by name & project on the server.
+
+        Args:
+              datasource_id (str): The ID of the datasource
+              datasource_name (str): The name of the datasource
+              datasource_project (str): The name of the project the datasource is in
+
+        Returns: A Datasource Tableau object
+        """
+        if datasource_id:
+            d = await self._get(f'{self.url}/datasources/{datasource_id}')
+            d = d['datasource']
+            transform_tableau_object(d)
+            return tso.Datasource(**d)
+        elif datasource_name and datasource_project:
+            d = await self.__find(
+                self.__datasources_url(), 'datasource', tso.Datasource,
+                {'name': datasource_name, 'projectName': datasource_project},
+                lambda o: o.name == datasource_name and o.project_name == datasource_project
+            )
+            if d:
+                return d
+            raise TableauConnectionError(
+                f'Datasource not found:\n\tName    -> {datasource_name}\n\tProject -> {datasource_project}'
+            )
+
+        raise TableauConnectionError(
+            'Please provide either the datasource_id, or both datasource_name and datasource_project'
+        )
+
+    async def datasource_connections(self, datasource_id):
+        """ Queries for all Connection Tableau objects in the datasource
+            URI GET /api/api-version/sites/site-id/datasources/datasource_id/connections
+        Args:
+            datasource_id (str): The ID of the Tableau Datasource
+        Returns: All Connection Tableau objects in the datasource
+        """
+        url = f'{self.url}/datasources/{datasource_id}/connections'
+        async for connection in self.__get_objects_pager(url, 'connection'):
+            yield tso.Connection(**connection)
+
+    async def workbook_connections(self, workbook_id):
+        """ Queries for all Connection Tableau objects in the workbook
+            URI GET /api/api-version/sites/site-id/workbooks/workbook_id/connections
+        Args:
+            workbook_id (str): The ID of the Tableau Workbook
+        Returns: All Connection Tableau objects in the workbook
+        """
+        url = f'{self.url}/workbooks/{workbook_id}/connections'
+        async for connection in self.__get_objects_pager(url, 'connection'):
+            yield tso.Connection(**connection)
+
+    async def workbooks(self):
+        """ Queries for all workbooks in the site
+            URI GET /api/api-version/sites/site-id/workbooks
+        Returns: All workbooks in the site
+        """
+        async for w in self.__get_objects_pager(f"{self.url}/workbooks", 'workbook'):
+            yield tso.Workbook(**w)
+
+    async def workbook(self, workbook_id=None, workbook_name=None, workbook_project=None):
+        """ Queries for a workbook in the site
+            URI GET /api/api-version/sites/site-id/workbooks/workbook_id
+        Args:
+            workbook_id (str): The ID of the Tableau Workbook
+            workbook_name (str): The name of the workbook
+            workbook_project (str): The name of the project the workbook is in
+        Returns: A Workbooks Tableau object; workbooks are filtered by name & project on the server
+        """
+        if workbook_id:
+            w = await self._get(f'{self.url}/workbooks/{workbook_id}')
+            w = w['workbook']
+            transform_tableau_object(w)
+            return tso.Workbook(**w)
+        elif workbook_name and workbook_project:
+            w = await self.__find(
+                f"{self.url}/workbooks", 'workbook', tso.Workbook,
+                {'name': workbook_name, 'projectName': workbook_project},
+                lambda o: o.name == workbook_name and o.project_name == workbook_project
+            )
+            if w:
+                return w
+            raise TableauConnectionError(
+                f'Workbook not found:\n\tName    -> {workbook_name}\n\tProject -> {workbook_project}'
+            )
+
+        raise TableauConnectionError(
+            'Please provide either the workbook_id, or both workbook_name and workbook_project'
+        )
+
+    async def views(self):
+        """ Queries for all views in the site
+            URI GET /api/api-version/sites/site-id/views
+        Returns: All views in the site
+        """
+        url = f"{self.url}/views?fields=_default_,sheetType,usage"
+        async for v in self.__get_objects_pager(url, 'view'):
+            yield tso.View(**v)
+
+    async def view(self, view_id):
+        """ Queries for a view in the site
+            URI GET /api/api-version/sites/site-id/views/view_id
+        Args:
+            view_id (str): The ID of the Tableau View
+        Returns: A View Tableau object
+        """
+        v = await self._get(f'{self.url}/views/{view_id}')
+        v = v['view']
+        return tso.View(**v)
+
+    def __projects_url(self, include_extra_fields=True):
+        """ Returns: The url listing all projects; with the extra fields of each, if include_extra_fields """
+        if include_extra_fields:
+            return f"{self.url}/projects?fields=_default_" \
+                   f",topLevelProject" \
+                   f",writeable" \
+                   f",contentsCounts.projectCount" \
+                   f",contentsCounts.viewCount" \
+                   f",contentsCounts.datasourceCount" \
+                   f",contentsCounts.workbookCount"
+        return f"{self.url}/projects"
+
+    async def projects(self, top_level_only=True, include_extra_fields=True):
+        """ Queries for all projects in the site
+            URI GET /api/api-version/sites/site-id/projects
+        Args:
+            top_level_only (bool): True to only get top level projects
+            include_extra_fields (bool): True to include extra fields not provided in the default query
+        Returns: All top level projects in the site
+        """
+        async for p in self.__get_objects_pager(self.__projects_url(include_extra_fields), 'project'):
+            project = tso.Project(**p)
+            if top_level_only and project.parent_project_id:
+                continue
+            yield project
+
+    async def project(self, project_id=None, project_name=None, parent_project_id=None):
+        """ Queries for the project by project_id, or by name; projects are filtered by name on the server.
+            Projects can't be filtered by ID, so all projects are listed to find one by ID.
+            URI GET /api/api-version/sites/site-id/projects
+        Args:
+            project_id (str): The ID of the project in Tableau Online; of a project at any level, not only top level
+            project_name (str): The name of the project
+            parent_project_id (str): The ID of the parent of the project, when found by name;
+                otherwise the first project with the name, at any level
+        Returns: A Tableau Project object specified by ID or name; None if it's not found
+        """
+        if project_id:
+            return await self.__find(self.__projects_url(), 'project', tso.Project, {}, lambda o: o.id == project_id)
+        if project_name:
+            return await self.__find(
+                self.__projects_url(), 'project', tso.Project,
+                {'name': project_name, 'parentProjectId': parent_project_id},
+                lambda o: o.name == project_name and (not parent_project_id or o.parent_project_id == parent_project_id)
+            )
+        raise TableauConnectionError('Please provide either the project_id, or the project_name')
+
+    async def groups(self):
+        """ Queries for all groups in the site
+            URI GET /api/api-version/sites/site-id/groups
+        Returns: All groups in the site
+        """
+        url = f"{self.url}/groups?fields=_default_,userCount,minimumSiteRole"
+        async for g in self.__get_objects_pager(url, 'group'):
+            yield tso.Group(**g)
+
+    async def group(self, group_id=None, group_name=None):
+        """ Queries for the group by group_id, or by name; groups are filtered by name on the server.
+            Groups can't be filtered by ID, so all groups are listed to find one by ID.
+            URI GET /api/api-version/sites/site-id/groups
+        Args:
+            group_id (str): The ID of the group in Tableau Online
+            group_name (str): The name of the group
+        Returns: A Tableau Group object specified by ID or name; None if it's not found
+        """
+        url = f"{self.url}/groups?fields=_default_,userCount,minimumSiteRole"
+        if group_id:
+            return await self.__find(url, 'group', tso.Group, {}, lambda o: o.id == group_id)
+        if group_name:
+            return await self.__find(url, 'group', tso.Group, {'name': group_name}, lambda o: o.name == group_name)
+        raise TableauConnectionError('Please provide either the group_id, or the group_name')
+
+    async def users(self):
+        """ Queries for all users in the site
+            URI GET /api/api-version/sites/site-id/users
+        Returns: All users in the site
+        """
+        url = f"{self.url}/users?fields=_default_,fullName,email"
+        async for user in self.__get_objects_pager(url, 'user'):
+            yield tso.User(**user)
+
+    async def user(self, user_id):
+        """ Queries for the user by user_id
+            URI GET /api/api-version/sites/site-id/users/user_id
+        Args:
+            user_id (str): The ID of the user in Tableau Online
+        Returns: A Tableau User object specified by ID
+        """
+        u = await self._get(f"{self.url}/users/{user_id}")
+        u = u['user']
+        transform_tableau_object(u)
+        return tso.User(**u)
+
+    async def user_groups(self, group_id=None, group_name=None):
+        """ Queries for all groups and all user in those groups
+            URI GET /api/api-version/sites/site-id/groups/group_id/users
+        Args:
+            group_id (str): The ID of a group, to only get the users of that group
+            group_name (str): The name of a group, to only get the users of that group
+        Returns: A list of all user/group combinations
+        """
+        if group_id or group_name:
+            group = await self.group(group_id, group_name)
+            if group:
+                async for u in self.__get_objects_pager(f"{self.url}/groups/{group.id}/users", 'user'):
+                    yield group, tso.User(**u)
+            return
+        async for group in self.groups():
+            async for u in self.__get_objects_pager(f"{self.url}/groups/{group.id}/users", 'user'):
+                yield group, tso.User(**u)
@@ -0,0 +1,21 @@
+import tableau_utilities.tableau_server.tableau_server_objects as tso
+from tableau_utilities.tableau_server.static import transform_tableau_object
+from tableau_utilities.tableau_server.aio.base import AsyncBase
+
+
+class AsyncRefresh(AsyncBase):
+    """ Core Refresh functionality of the AsyncTableauServer class """
+    def __init__(self, parent):
+        super().__init__(parent)
+
+    async def datasource(self, datasource_id):
+        """ Refresh a datasource """
+        content = await self._post(f'{self.url}/datasources/{datasource_id}/refresh', json={})
+        transform_tableau_object(content['job'])
+        return tso.Job(**content['job'])
+
+    async def workbook(self, workbook_id):
+        """ Refresh a workbook """
+        content = await self._post(f'{self.url}/workbooks/{workbook_id}/refresh', json={})
+        transform_tableau_object(content['job'])
+        return tso.Job(**content['job'])
@@ -0,0 +1,156 @@
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+from tableau_utilities.tableau_server.aio.base import AsyncBase
+from tableau_utilities.tableau_server.aio.get import AsyncGet
+from tableau_utilities.tableau_server.aio.create import AsyncCreate
+from tableau_utilities.tableau_server.aio.download import AsyncDownload
+from tableau_utilities.tableau_server.aio.publish import AsyncPublish
+from tableau_utilities.tableau_server.aio.refresh import AsyncRefresh
+from tableau_utilities.tableau_server.aio.update import AsyncUpdate
+from tableau_utilities.tableau_server.static import TableauConnectionError
+from tableau_utilities.tableau_server.tableau_server import MAX_PAGE_SIZE
+
+
+class AsyncTableauServer(AsyncBase):
+    """ Connects and interacts with Tableau Online/Server, via the REST API, from an asyncio event loop.
+        Has the same methods as TableauServer, as coroutines; methods listing all objects are async generators.
+
+        i.e.
+            async with AsyncTableauServer(host, site, user, password) as ts:
+                async for datasource in ts.get.datasources():
+                    ...
+    """
+
+    def __init__(
+            self,
+            host: str,
+            site: str,
+            user: str = None,
+            password: str = None,
+            personal_access_token_secret: str = None,
+            personal_access_token_name: str = None,
+            api_version: float = None,
+            page_size: int = 100,
+            connection_limit: int = 100
+    ):
+        """ To sign in to Tableau a user needs either a username & password or token secret & token name.
+            Signs in on entering the context of the server, or with sign_in.
+
+        Args:
+            host: Tableau server address
+            user: The username to sign in to Tableau Online with
+            password: The password to sign in to Tableau Online with
+            personal_access_token_name: The name of the personal access token used
+            personal_access_token_secret: The secret of the personal access token used
+            site: The Tableau Online site id
+            api_version: The Tableau REST API version
+            page_size: The number of objects per page, when getting all objects of a type; up to 1000
+            connection_limit: The maximum number of connections open at once, i.e. for pages of objects;
+             0 for no limit
+        """
+        if aiohttp is None:
+            raise ImportError('AsyncTableauServer requires aiohttp: pip install tableau-utilities[async]')
+        self.user = user
+        self._pw = password
+        self._personal_access_token_secret = personal_access_token_secret
+        self.personal_access_token_name = personal_access_token_name
+        self.host = host
+        self.site = site
+        self.api = api_version or 3.18
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise TableauConnectionError(f'Page size must be between 1 and {MAX_PAGE_SIZE}; not {page_size}')
+        self.page_size = page_size
+        self.connection_limit = connection_limit
+        # Set by class
+        self._auth_token = None
+        self.url: str = None
+        # The session is created on sign in, within the event loop
+        self.session = None
+        self.get: AsyncGet = None
+        self.create: AsyncCreate = None
+        self.download: AsyncDownload = None
+        self.publish: AsyncPublish = None
+        self.refresh: AsyncRefresh = None
+        self.update: AsyncUpdate = None
+
+    async def __aenter__(self):
+        await self.sign_in()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.sign_out()
+
+    async def sign_in(self):
+        """
+            To sign in to Tableau a user needs either a username & password or token secret & token name
+            Signs in to the server with credentials from the specified connection.
+            Sets the auth_token, site_id, and url common prefix
+
+        """
+        url = f"{self.host}/api/{self.api}/auth/signin"
+        if self._personal_access_token_secret and self.personal_access_token_name:
+            body = {"credentials": {"personalAccessTokenSecret": self._personal_access_token_secret,
+                                    "personalAccessTokenName": self.personal_access_token_name,
+                                    "site": {"contentUrl": self.site}}}
+        elif self.user and self._pw:
+            body = {"credentials": {"name": self.user, "password": self._pw, "site": {"contentUrl": self.site}}}
+        else:
+            raise TableauConnectionError(
+                'Please provide either user and password, or token_secret and token_name'
+            )
+
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.connection_limit),
+            headers={'accept': 'application/json', 'content-type': 'application/json'}
+        )
+        try:
+            res = (await self._post(url, json=body)).get('credentials', {})
+        except BaseException:
+            await self.session.close()
+            raise
+        # Set auth token and site ID attributes on sign in
+        self.session.headers.update({'x-tableau-auth': res.get('token')})
+        self.site = res.get('site', {}).get('id')
+        self.url = f"{self.host}/api/{self.api}/sites/{self.site}"
+        # Assign core functionality
+        self.get = AsyncGet(self)
+        self.create = AsyncCreate(self)
+        self.download = AsyncDownload(self)
+        self.publish = AsyncPublish(self)
+        self.refresh = AsyncRefresh(self)
+        self.update = AsyncUpdate(self)
+
+    async def sign_out(self):
+        """ Destroys the active session and invalidates authentication token. """
+        try:
+            await self._post(url=f"{self.host}/api/{self.api}/auth/signout")
+        finally:
+            await self.session.close()
+
+    async def embed_datasource_credentials(self, datasource_id, credentials, connection_type):
+        """ Embed the given credentials for all connections of a datasource of the given connection type.
+            Only embeds Username and Password credentials.
+
+        Args:
+            datasource_id (str): The ID of the datasource
+            connection_type (str): Type of connection you want to embed creds for, i.e. snowflake
+            credentials (dict): The credentials dict to embed
+                i.e. {'username': 'user', 'password': 'password'}
+        """
+        for cred in ['username', 'password']:
+            if not credentials.get(cred):
+                raise TableauConnectionError(f'Missing required credential: {cred}')
+
+        connections = self.get.datasource_connections(datasource_id)
+        try:
+            async for c in connections:
+                if c.type.lower() == connection_type.lower():
+                    c.user_name = credentials['username']
+                    c.password = credentials['password']
+                    c.embed_password = True
+                    response = await self.update.datasource_connection(datasource_id, c)
+                    return response
+        finally:
+            await connections.aclose()
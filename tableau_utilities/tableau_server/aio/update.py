@@ -0,0 +1,18 @@
+import tableau_utilities.tableau_server.tableau_server_objects as tso
+from tableau_utilities.tableau_server.static import connection_update_json, transform_tableau_object
+from tableau_utilities.tableau_server.aio.base import AsyncBase
+
+
+class AsyncUpdate(AsyncBase):
+    """ Core Update functionality of the AsyncTableauServer class """
+    def __init__(self, parent):
+        super().__init__(parent)
+
+    async def datasource_connection(self, datasource_id, connection: tso.Connection):
+        content = await self._put(
+            f'{self.url}/datasources/{datasource_id}/connections/{connection.id}',
+            json=connection_update_json(connection)
+        )
+
+        transform_tableau_object(content['connection'])
+        return tso.Connection(**content['connection'])
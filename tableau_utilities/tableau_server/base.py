@@ -15,6 +15,9 @@ class Base:
         self.api: float = parent.api
         self._auth_token = parent._auth_token
         self.url: str = parent.url
+        self.page_size: int = parent.page_size
+        self.max_workers: int = parent.max_workers
+        self.catalog = parent.catalog
         self.get = parent.get if hasattr(parent, 'get') else None
 
     def _get(self, url, headers=None, **params):
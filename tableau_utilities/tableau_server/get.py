@@ -1,6 +1,10 @@
 import logging
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import tableau_utilities.tableau_server.tableau_server_objects as tso
-from tableau_utilities.tableau_server.static import TableauConnectionError, transform_tableau_object
+from tableau_utilities.tableau_server.static import (
+    TableauConnectionError, filter_expression, is_rejected_filter, transform_tableau_object)
 from tableau_utilities.tableau_server.base import Base
 
 
@@ -9,54 +13,118 @@ class Get(Base):
     def __init__(self, parent):
         super().__init__(parent)
 
-    def __get_objects_pager(self, url, obj, page_size=100):
-        """ GET all objects in the site
+    @staticmethod
+    def __page_objects(response, obj):
+        """ Yields the objects in a page of a response, transformed """
+        for obj_dict in response.get(f'{obj}s', {}).get(obj, []):
+            transform_tableau_object(obj_dict)
+            yield obj_dict
+
+    def __get_objects_pager(self, url, obj, page_size=None):
+        """ GET all objects in the site.
+            The first page gives the total number of objects; the remaining pages are then fetched concurrently,
+            a bounded number at a time, and the objects are yielded in order.
         Args:
             url: The url of for the request, i.e /api/api-version/sites/site-id/groups
             obj: The name of the object being requested
-            page_size: The size of the page (number of objects per page)
-        Returns: A list of the objects
-        """
-        response = self._get(url)
-        total_available = response.get('pagination', {}).get('totalAvailable', page_size)
-        total_available = int(total_available)
-        current = 0
-        page = 0
-        while current < total_available:
-            current += page_size
-            page += 1
-            if '?' in url:
-                page_url = f'{url}&pageSize={page_size}&pageNumber={page}'
-            else:
-                page_url = f'{url}?pageSize={page_size}&pageNumber={page}'
-            logging.info('GET %s --> %s/%s', page_url, current, total_available)
-            res = self._get(page_url)
-            for obj_dict in res[f'{obj}s'][obj]:
-                transform_tableau_object(obj_dict)
-                yield obj_dict
+            page_size: The size of the page (number of objects per page); defaults to the page size of the server
+        Returns: A generator of the objects
+        """
+        page_size = page_size or self.page_size
+        separator = '&' if '?' in url else '?'
+
+        def get_page(page):
+            page_url = f'{url}{separator}pageSize={page_size}&pageNumber={page}'
+            logging.info('GET %s --> %s/%s', page_url, min(page * page_size, total_available), total_available)
+            return self._get(page_url)
+
+        total_available = page_size
+        response = get_page(1)
+        total_available = int(response.get('pagination', {}).get('totalAvailable', 0))
+        yield from self.__page_objects(response, obj)
+        pages = math.ceil(total_available / page_size)
+        if pages <= 1:
+            return None
+        # Pages being fetched, in order; at most twice as many as there are workers, so pages aren't fetched
+        # much faster than they're consumed
+        window = deque()
+        next_page = 2
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                while window or next_page <= pages:
+                    while next_page <= pages and len(window) < self.max_workers * 2:
+                        window.append(executor.submit(get_page, next_page))
+                        next_page += 1
+                    yield from self.__page_objects(window.popleft().result(), obj)
+            finally:
+                # Pages that haven't been fetched yet are cancelled, if the objects stop being consumed
+                for future in window:
+                    future.cancel()
+
+    def __from_catalog(self, obj, **lookup):
+        """ Finds an object in the SiteCatalog attached to the server, without making a request
+        Args:
+            obj: The name of the objects in the catalog, i.e. datasources
+            lookup: The arguments of the catalog's lookup, i.e. datasource_id
+        Returns: The object; None if no catalog of the objects is attached, the catalog could not load them,
+            or the object isn't in it
+        """
+        if not self.catalog or not self.catalog.includes(obj):
+            return None
+        return getattr(self.catalog, obj[:-1])(**lookup)
+
+    def __find(self, url, obj, cls, filters, matches):
+        """ Finds an object in the site, with the objects filtered by the server; so only the objects that match
+            are listed, in one request. All objects are listed instead, if a value can't be filtered on,
+            or the server rejects the filter as a bad request.
+        Args:
+            url: The url listing all objects, i.e /api/api-version/sites/site-id/datasources
+            obj: The name of the object being requested
+            cls: The Tableau object class of the object
+            filters (dict): The value of each field the server filters the objects on, i.e. {'name': 'Sales'}
+            matches (callable): True for the object being found; objects are matched again as the server
+                may compare values differently, i.e. ignoring case
+        Returns: The first object that matches; None if no object matches
+        """
+        expression = filter_expression(**filters)
+        if expression:
+            separator = '&' if '?' in url else '?'
+            try:
+                objects = self.__get_objects_pager(f'{url}{separator}filter={expression}', obj)
+                return next((o for o in (cls(**d) for d in objects) if matches(o)), None)
+            except TableauConnectionError as err:
+                # Only a rejected filter is retried without it; other errors, i.e. 401 / 403, are raised
+                if not is_rejected_filter(err):
+                    raise
+                logging.warning('Filtering %ss failed; listing all %ss instead: %s', obj, obj, err)
+        objects = self.__get_objects_pager(url, obj)
+        return next((o for o in (cls(**d) for d in objects) if matches(o)), None)
+
+    def __datasources_url(self):
+        """ Returns: The url listing all datasources, with the fields of each """
+        return f"{self.url}/datasources?fields=_default_" \
+               f",favoritesTotal" \
+               f",databaseName" \
+               f",connectedWorkbooksCount" \
+               f",hasAlert" \
+               f",hasExtracts" \
+               f",isPublished" \
+               f",serverName"
 
     def datasources(self):
         """ Queries for all datasources in the site
             URI GET /api/api-version/sites/site-id/datasources
         Returns: All datasources in the site
         """
-        url = f"{self.url}/datasources?fields=_default_" \
-              f",favoritesTotal" \
-              f",databaseName" \
-              f",connectedWorkbooksCount" \
-              f",hasAlert" \
-              f",hasExtracts" \
-              f",isPublished" \
-              f",serverName"
-
-        for d in self.__get_objects_pager(url, 'datasource'):
+        for d in self.__get_objects_pager(self.__datasources_url(), 'datasource'):
             yield tso.Datasource(**d)
 
     def datasource(self, datasource_id=None, datasource_name=None, datasource_project=None):
         """ Queries for a datasource in the site
             URI GET /api/api-version/sites/site-id/datasources/datasource_id
 
-            (Optional) Can get the datasource either by ID, or by name & project.
+            (Optional) Can get the datasource either by ID, or by name & project;
+            the datasources are filtered by name & project on the server.
 
         Args:
               datasource_id (str): The ID of the datasource
@@ -66,14 +134,23 @@ class Get(Base):
         Returns: A Datasource Tableau object
         """
         if datasource_id:
+            d = self.__from_catalog('datasources', datasource_id=datasource_id)
+            if d:
+                return d
             d = self._get(f'{self.url}/datasources/{datasource_id}')
             d = d['datasource']
             transform_tableau_object(d)
             return tso.Datasource(**d)
         elif datasource_name and datasource_project:
-            for d in self.datasources():
-                if d.name == datasource_name and d.project_name == datasource_project:
-                    return d
+            d = self.__from_catalog(
+                'datasources', datasource_name=datasource_name, project_name=datasource_project
+            ) or self.__find(
+                self.__datasources_url(), 'datasource', tso.Datasource,
+                {'name': datasource_name, 'projectName': datasource_project},
+                lambda o: o.name == datasource_name and o.project_name == datasource_project
+            )
+            if d:
+                return d
             raise TableauConnectionError(
                 f'Datasource not found:\n\tName    -> {datasource_name}\n\tProject -> {datasource_project}'
             )
@@ -119,19 +196,28 @@ class Get(Base):
             workbook_id (str): The ID of the Tableau Workbook
             workbook_name (str): The name of the workbook
             workbook_project (str): The name of the project the workbook is in
-        Returns: A Workbooks Tableau object
+        Returns: A Workbooks Tableau object; workbooks are filtered by name & project on the server
         """
         if workbook_id:
+            w = self.__from_catalog('workbooks', workbook_id=workbook_id)
+            if w:
+                return w
             w = self._get(f'{self.url}/workbooks/{workbook_id}')
             w = w['workbook']
             transform_tableau_object(w)
             return tso.Workbook(**w)
         elif workbook_name and workbook_project:
-            for w in self.workbooks():
-                if w.name == workbook_name and w.project_name == workbook_project:
-                    return w
+            w = self.__from_catalog(
+                'workbooks', workbook_name=workbook_name, project_name=workbook_project
+            ) or self.__find(
+                f"{self.url}/workbooks", 'workbook', tso.Workbook,
+                {'name': workbook_name, 'projectName': workbook_project},
+                lambda o: o.name == workbook_name and o.project_name == workbook_project
+            )
+            if w:
+                return w
             raise TableauConnectionError(
-                f'Datasource not found:\n\tName    -> {workbook_name}\n\tProject -> {workbook_project}'
+                f'Workbook not found:\n\tName    -> {workbook_name}\n\tProject -> {workbook_project}'
             )
 
         raise TableauConnectionError(
@@ -154,10 +240,25 @@ class Get(Base):
             view_id (str): The ID of the Tableau View
         Returns: A View Tableau object
         """
+        v = self.__from_catalog('views', view_id=view_id)
+        if v:
+            return v
         v = self._get(f'{self.url}/views/{view_id}')
         v = v['view']
         return tso.View(**v)
 
+    def __projects_url(self, include_extra_fields=True):
+        """ Returns: The url listing all projects; with the extra fields of each, if include_extra_fields """
+        if include_extra_fields:
+            return f"{self.url}/projects?fields=_default_" \
+                   f",topLevelProject" \
+                   f",writeable" \
+                   f",contentsCounts.projectCount" \
+                   f",contentsCounts.viewCount" \
+                   f",contentsCounts.datasourceCount" \
+                   f",contentsCounts.workbookCount"
+        return f"{self.url}/projects"
+
     def projects(self, top_level_only=True, include_extra_fields=True):
         """ Queries for all projects in the site
             URI GET /api/api-version/sites/site-id/projects
@@ -166,32 +267,35 @@ class Get(Base):
             include_extra_fields (bool): True to include extra fields not provided in the default query
         Returns: All top level projects in the site
         """
-        if include_extra_fields:
-            url = f"{self.url}/projects?fields=_default_" \
-              f",topLevelProject" \
-              f",writeable" \
-              f",contentsCounts.projectCount" \
-              f",contentsCounts.viewCount" \
-              f",contentsCounts.datasourceCount" \
-              f",contentsCounts.workbookCount"
-        else:
-            url = f"{self.url}/projects"
-        for p in self.__get_objects_pager(url, 'project'):
+        for p in self.__get_objects_pager(self.__projects_url(include_extra_fields), 'project'):
             project = tso.Project(**p)
             if top_level_only and project.parent_project_id:
                 continue
             yield project
 
-    def project(self, project_id):
-        """ Queries for the project by project_id
-            URI GET /api/api-version/sites/site-id/projects/project_id
+    def project(self, project_id=None, project_name=None, parent_project_id=None):
+        """ Queries for the project by project_id, or by name; projects are filtered by name on the server.
+            Projects can't be filtered by ID, so all projects are listed to find one by ID.
+            URI GET /api/api-version/sites/site-id/projects
         Args:
-            project_id (str): The ID of the project in Tableau Online
-        Returns: A Tableau Project object specified by ID
+            project_id (str): The ID of the project in Tableau Online; of a project at any level, not only top level
+            project_name (str): The name of the project
+            parent_project_id (str): The ID of the parent of the project, when found by name;
+                otherwise the first project with the name, at any level
+        Returns: A Tableau Project object specified by ID or name; None if it's not found
         """
-        for p in self.projects():
-            if p.id == project_id:
-                return p
+        if project_id:
+            return self.__from_catalog('projects', project_id=project_id) or self.__find(
+                self.__projects_url(), 'project', tso.Project, {}, lambda o: o.id == project_id
+            )
+        if project_name:
+            p = None if parent_project_id else self.__from_catalog('projects', project_name=project_name)
+            return p or self.__find(
+                self.__projects_url(), 'project', tso.Project,
+                {'name': project_name, 'parentProjectId': parent_project_id},
+                lambda o: o.name == project_name and (not parent_project_id or o.parent_project_id == parent_project_id)
+            )
+        raise TableauConnectionError('Please provide either the project_id, or the project_name')
 
     def groups(self):
         """ Queries for all groups in the site
@@ -202,16 +306,25 @@ class Get(Base):
         for g in self.__get_objects_pager(url, 'group'):
             yield tso.Group(**g)
 
-    def group(self, group_id):
-        """ Queries for the group by user_id
-            URI GET /api/api-version/sites/site-id/groups/group_id
+    def group(self, group_id=None, group_name=None):
+        """ Queries for the group by group_id, or by name; groups are filtered by name on the server.
+            Groups can't be filtered by ID, so all groups are listed to find one by ID.
+            URI GET /api/api-version/sites/site-id/groups
         Args:
             group_id (str): The ID of the group in Tableau Online
-        Returns: A Tableau Group object specified by ID
+            group_name (str): The name of the group
+        Returns: A Tableau Group object specified by ID or name; None if it's not found
         """
-        for group in self.groups():
-            if group.id == group_id:
-                return group
+        url = f"{self.url}/groups?fields=_default_,userCount,minimumSiteRole"
+        if group_id:
+            return self.__from_catalog('groups', group_id=group_id) or self.__find(
+                url, 'group', tso.Group, {}, lambda o: o.id == group_id
+            )
+        if group_name:
+            return self.__from_catalog('groups', group_name=group_name) or self.__find(
+                url, 'group', tso.Group, {'name': group_name}, lambda o: o.name == group_name
+            )
+        raise TableauConnectionError('Please provide either the group_id, or the group_name')
 
     def users(self):
         """ Queries for all users in the site
@@ -229,16 +342,27 @@ class Get(Base):
             user_id (str): The ID of the user in Tableau Online
         Returns: A Tableau User object specified by ID
         """
+        u = self.__from_catalog('users', user_id=user_id)
+        if u:
+            return u
         u = self._get(f"{self.url}/users/{user_id}")
         u = u['user']
         transform_tableau_object(u)
         return tso.User(**u)
 
-    def user_groups(self):
+    def user_groups(self, group_id=None, group_name=None):
         """ Queries for all groups and all user in those groups
             URI GET /api/api-version/sites/site-id/groups/group_id/users
+        Args:
+            group_id (str): The ID of a group, to only get the users of that group
+            group_name (str): The name of a group, to only get the users of that group
         Returns: A list of all user/group combinations
         """
-        for group in self.groups():
+        if group_id or group_name:
+            group = self.group(group_id, group_name)
+            groups = [group] if group else []
+        else:
+            groups = self.groups()
+        for group in groups:
             for u in self.__get_objects_pager(f"{self.url}/groups/{group.id}/users", 'user'):
                 yield group, tso.User(**u)
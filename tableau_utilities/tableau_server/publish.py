@@ -1,12 +1,10 @@
 import os
 import logging
 from time import time
-from urllib3.fields import RequestField
-from urllib3.filepost import encode_multipart_formdata
 import tableau_utilities.tableau_server.tableau_server_objects as tso
 from requests import Session
 from tableau_utilities.tableau_server.static import (
-    TableauConnectionError, bytes_to_mb, mb_to_bytes, transform_tableau_object)
+    TableauConnectionError, bytes_to_mb, mb_to_bytes, get_multipart_details, transform_tableau_object)
 from tableau_utilities.tableau_server.base import Base
 
 
@@ -15,34 +13,11 @@ class Publish(Base):
     def __init__(self, parent):
         super().__init__(parent)
 
-    @staticmethod
-    def __get_multipart_details(parts):
-        """ Gets the body and content_type for a multipart/mixed request.
-
-        Args:
-            parts (list[tuple[str, str, str, str]]): The parts that make up the RequestField
-                i.e. [(name, data, file_name, content_type)]
-
-        Returns: Request body and content_type
-        """
-        part_list = list()
-        for name, data, file_name, content_type in parts:
-            r = RequestField(name=name, data=data, filename=file_name)
-            r.make_multipart(content_type=content_type)
-            part_list.append(r)
-        post_body, content_type = encode_multipart_formdata(part_list)
-        content_type = ''.join(('multipart/mixed',) + content_type.partition(';')[1:])
-        return post_body, content_type
-
     def __get_datasource_for_publication(self, datasource_id, datasource_name, project_name):
         if datasource_id:
             return self.get.datasource(datasource_id)
         elif datasource_name and project_name:
-            project = None
-            for p in self.get.projects(False, False):
-                if p.name == project_name:
-                    project = p
-                    break
+            project = self.get.project(project_name=project_name)
             if not project:
                 raise TableauConnectionError(f'Project does not exist: {project_name}')
             return tso.Datasource(
@@ -57,11 +32,7 @@ class Publish(Base):
         if workbook_id:
             return self.get.workbook(workbook_id)
         elif workbook_name and project_name:
-            project = None
-            for p in self.get.projects(False, False):
-                if p.name == project_name:
-                    project = p
-                    break
+            project = self.get.project(project_name=project_name)
             if not project:
                 raise TableauConnectionError(f'Project does not exist: {project_name}')
             return tso.Workbook(
@@ -98,7 +69,7 @@ class Publish(Base):
             chunk = file.read(mb_to_bytes(chunk_size_mb))
             if not chunk:
                 break
-            post_body, content_type = self.__get_multipart_details([
+            post_body, content_type = get_multipart_details([
                 ('request_payload', '', None, 'text/xml'),
                 ('tableau_file', chunk, file_name, 'application/octet-stream')
             ])
@@ -153,14 +124,14 @@ class Publish(Base):
             upload_session_id = self.__upload_in_chunks(file_path, upload_chunk_size, upload_log_interval)
             publish_url = f'{self.url}/datasources?uploadSessionId={upload_session_id}' \
                           f'&datasourceType={extension}&overwrite={overwrite}&append={append}&asJob={as_job}'
-            post_body, content_type = self.__get_multipart_details([
+            post_body, content_type = get_multipart_details([
                 ('request_payload', ds_xml, None, 'text/xml')
             ])
         else:
             publish_url = f'{self.url}/datasources?datasourceType={extension}' \
                           f'&overwrite={overwrite}&append={append}&asJob={as_job}'
             with open(file_path, 'rb') as f:
-                post_body, content_type = self.__get_multipart_details([
+                post_body, content_type = get_multipart_details([
                     ('request_payload', ds_xml, None, 'text/xml'),
                     ('tableau_datasource', f.read(), file_name, 'application/octet-stream')
                 ])
@@ -214,7 +185,7 @@ class Publish(Base):
                           f'&workbookType={extension}' \
                           f'&skipConnectionCheck={skip_connection_check}' \
                           f'&overwrite={overwrite}&asJob={as_job}'
-            post_body, content_type = self.__get_multipart_details([
+            post_body, content_type = get_multipart_details([
                 ('request_payload', wb_xml, None, 'text/xml')
             ])
         else:
@@ -223,7 +194,7 @@ class Publish(Base):
                           f'&skipConnectionCheck={skip_connection_check}' \
                           f'&asJob={as_job}'
             with open(file_path, 'rb') as f:
-                post_body, content_type = self.__get_multipart_details([
+                post_body, content_type = get_multipart_details([
                     ('request_payload', wb_xml, None, 'text/xml'),
                     ('tableau_workbook', f.read(), file_name, 'application/octet-stream')
                 ])
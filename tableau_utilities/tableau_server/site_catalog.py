@@ -0,0 +1,260 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, time
+from requests.exceptions import RequestException
+from tableau_utilities.tableau_server.static import TableauConnectionError
+
+# The objects of a site that are loaded into a catalog, by the name of the Get method listing them
+CATALOG_OBJECTS = ('projects', 'datasources', 'workbooks', 'views', 'users', 'groups')
+
+
+class SiteCatalog:
+    """ An in-memory snapshot of the projects, datasources, workbooks, views, users and groups of a site.
+        Objects are indexed by ID, by name, and by the path of their project; i.e. 'Finance/Reports'.
+        Lookups don't make requests, once the catalog is loaded. The catalog is loaded on its first lookup,
+        and reloaded on the next lookup after the TTL expires.
+        Objects that can't be listed, i.e. users without the role to list them, are left out of the catalog
+        until it's reloaded; lookups of those objects raise, and helpers look them up on the server instead.
+
+        Attach a catalog to a TableauServer with attach_catalog, so lookups by its helpers use the catalog;
+        i.e. get.datasource(datasource_name=..., datasource_project=...).
+    """
+
+    def __init__(self, server, ttl=None, objects=CATALOG_OBJECTS):
+        """
+        Args:
+            server (TableauServer): The server the objects are listed from
+            ttl (float): The number of seconds the catalog is kept for, before it's reloaded; None to keep it
+            objects (tuple[str]): The objects to load; any of CATALOG_OBJECTS
+        """
+        for obj in objects:
+            if obj not in CATALOG_OBJECTS:
+                raise TableauConnectionError(f'Catalog objects must be in {", ".join(CATALOG_OBJECTS)}; not {obj}')
+        self.server = server
+        self.ttl = ttl
+        self.objects = tuple(objects)
+        self.loaded_at: float = None
+        self._loaded_monotonic: float = None
+        self._lock = threading.RLock()
+        self._indexes = dict()
+        self.errors = dict()
+
+    def load(self):
+        """ Lists the objects of the site, concurrently, and indexes them; replacing any that were loaded.
+            The errors of objects that couldn't be listed are kept in errors.
+        """
+        start = time()
+        with ThreadPoolExecutor(max_workers=len(self.objects)) as executor:
+            futures = {obj: executor.submit(self.__list, obj) for obj in self.objects}
+            listed, errors = dict(), dict()
+            for obj, future in futures.items():
+                try:
+                    listed[obj] = future.result()
+                except (TableauConnectionError, RequestException) as err:
+                    logging.warning('Could not load %s into the catalog of site %s: %s', obj, self.server.site, err)
+                    errors[obj] = err
+        indexes = {obj: self.__index(objects) for obj, objects in listed.items()}
+        if 'projects' in listed:
+            indexes['project_paths'] = self.__index_project_paths(listed['projects'])
+        with self._lock:
+            self._indexes = indexes
+            self.errors = errors
+            self.loaded_at = time()
+            self._loaded_monotonic = monotonic()
+        logging.info('Loaded catalog of site %s: %s in %s seconds', self.server.site,
+                     ', '.join(f'{len(listed[obj])} {obj}' for obj in listed), round(time() - start, 2))
+        return self
+
+    def includes(self, obj):
+        """ Returns: True if the objects of the type are in the catalog; loading the catalog if it's expired """
+        if obj not in self.objects:
+            return False
+        with self._lock:
+            if self.expired:
+                self.load()
+            return obj in self._indexes
+
+    def invalidate(self):
+        """ Marks the catalog as expired; it's reloaded on its next lookup """
+        with self._lock:
+            self._loaded_monotonic = None
+
+    @property
+    def expired(self):
+        """ True if the catalog hasn't been loaded, or the TTL has expired """
+        loaded = self._loaded_monotonic
+        if loaded is None:
+            return True
+        return self.ttl is not None and monotonic() - loaded >= self.ttl
+
+    def __list(self, obj):
+        """ Returns: All objects of the site of the type """
+        if obj == 'projects':
+            return list(self.server.get.projects(top_level_only=False))
+        return list(getattr(self.server.get, obj)())
+
+    @staticmethod
+    def __index(objects):
+        """ Indexes the objects by ID, by name, and by the ID or name of their project & their name.
+            The first object listed with a name is kept, where names are shared.
+
+        Args:
+            objects (list): The Tableau server objects
+
+        Returns: A dict of the objects, by_id, by_name, by_project_id and by_project_name
+        """
+        by_id, by_name, by_project_id, by_project_name = dict(), dict(), dict(), dict()
+        for o in objects:
+            by_id[o.id] = o
+            by_name.setdefault(o.name, o)
+            project_id = getattr(o, 'project_id', None)
+            if project_id:
+                by_project_id.setdefault((project_id, o.name), o)
+            project_name = getattr(o, 'project_name', None)
+            if project_name:
+                by_project_name.setdefault((project_name, o.name), o)
+        return {
+            'objects': objects,
+            'by_id': by_id,
+            'by_name': by_name,
+            'by_project_id': by_project_id,
+            'by_project_name': by_project_name
+        }
+
+    @staticmethod
+    def __index_project_paths(projects):
+        """ Indexes the projects by their path; the names of the project and each of its parents, from the top level
+
+        Args:
+            projects (list[tso.Project]): All projects of the site
+
+        Returns: A dict of the ID -> path of each project, and the path -> project
+        """
+        by_id = {p.id: p for p in projects}
+        paths = dict()
+
+        for project in projects:
+            # Paths are resolved iteratively, so deeply nested projects can't exceed the recursion limit
+            chain, chain_ids = list(), set()
+            while project and project.id not in paths and project.id not in chain_ids:
+                chain.append(project)
+                chain_ids.add(project.id)
+                project = by_id.get(project.parent_project_id)
+            # A missing parent, or a cycle, ends the path
+            prefix = paths.get(project.id, ()) if project else ()
+            for p in reversed(chain):
+                prefix = prefix + (p.name,)
+                paths[p.id] = prefix
+        return {'by_id': paths, 'by_path': {path: by_id[project_id] for project_id, path in paths.items()}}
+
+    def __indexes(self, obj):
+        """ Returns: The indexes of the objects of the type; loading the catalog if it's expired """
+        if (obj if obj != 'project_paths' else 'projects') not in self.objects:
+            raise TableauConnectionError(f'The catalog does not include {obj}')
+        with self._lock:
+            if self.expired:
+                self.load()
+            if obj not in self._indexes:
+                error = self.errors.get(obj if obj != 'project_paths' else 'projects')
+                raise TableauConnectionError(f'The catalog could not load {obj}: {error}')
+            return self._indexes[obj]
+
+    @staticmethod
+    def __split_path(path):
+        """ Returns: The names in a project path, i.e. 'Finance/Reports' -> ('Finance', 'Reports') """
+        if isinstance(path, str):
+            return tuple(name for name in path.split('/') if name)
+        return tuple(path)
+
+    def __find(self, obj, object_id=None, name=None, project_name=None, project_path=None):
+        """ Finds an object by ID, or by name; and the name or path of its project, if given.
+
+        Returns: The object; None if it's not in the catalog
+        """
+        indexes = self.__indexes(obj)
+        if object_id:
+            return indexes['by_id'].get(object_id)
+        if not name:
+            raise TableauConnectionError(f'Please provide either the ID, or the name of the {obj[:-1]}')
+        if project_path:
+            project = self.project(project_path=project_path)
+            return indexes['by_project_id'].get((project.id, name)) if project else None
+        if project_name:
+            return indexes['by_project_name'].get((project_name, name))
+        return indexes['by_name'].get(name)
+
+    def all(self, obj):
+        """ Returns: All objects of the type in the catalog, i.e. all('datasources') """
+        return list(self.__indexes(obj)['objects'])
+
+    def project(self, project_id=None, project_name=None, project_path=None):
+        """ Finds a project by ID, name, or path
+
+        Args:
+            project_id (str): The ID of the project
+            project_name (str): The name of the project; the first project with the name, at any level
+            project_path (str|tuple[str]): The path of the project; i.e. 'Finance/Reports'
+
+        Returns: A Tableau Project object; None if it's not in the catalog
+        """
+        if project_path:
+            return self.__indexes('project_paths')['by_path'].get(self.__split_path(project_path))
+        return self.__find('projects', project_id, project_name)
+
+    def project_path(self, project_id):
+        """ Returns: The path of a project, i.e. 'Finance/Reports'; None if it's not in the catalog """
+        path = self.__indexes('project_paths')['by_id'].get(project_id)
+        return '/'.join(path) if path else None
+
+    def datasource(self, datasource_id=None, datasource_name=None, project_name=None, project_path=None):
+        """ Finds a datasource by ID, or by name; and the name or path of its project
+
+        Args:
+            datasource_id (str): The ID of the datasource
+            datasource_name (str): The name of the datasource
+            project_name (str): The name of the project the datasource is in
+            project_path (str|tuple[str]): The path of the project the datasource is in; i.e. 'Finance/Reports'
+
+        Returns: A Tableau Datasource object; None if it's not in the catalog
+        """
+        return self.__find('datasources', datasource_id, datasource_name, project_name, project_path)
+
+    def workbook(self, workbook_id=None, workbook_name=None, project_name=None, project_path=None):
+        """ Finds a workbook by ID, or by name; and the name or path of its project
+
+        Args:
+            workbook_id (str): The ID of the workbook
+            workbook_name (str): The name of the workbook
+            project_name (str): The name of the project the workbook is in
+            project_path (str|tuple[str]): The path of the project the workbook is in; i.e. 'Finance/Reports'
+
+        Returns: A Tableau Workbook object; None if it's not in the catalog
+        """
+        return self.__find('workbooks', workbook_id, workbook_name, project_name, project_path)
+
+    def view(self, view_id=None, view_name=None, project_path=None):
+        """ Finds a view by ID, or by name; and the path of its project
+
+        Args:
+            view_id (str): The ID of the view
+            view_name (str): The name of the view
+            project_path (str|tuple[str]): The path of the project the view is in; i.e. 'Finance/Reports'
+
+        Returns: A Tableau View object; None if it's not in the catalog
+        """
+        return self.__find('views', view_id, view_name, project_path=project_path)
+
+    def user(self, user_id=None, user_name=None):
+        """ Finds a user by ID, or by name
+
+        Returns: A Tableau User object; None if it's not in the catalog
+        """
+        return self.__find('users', user_id, user_name)
+
+    def group(self, group_id=None, group_name=None):
+        """ Finds a group by ID, or by name
+
+        Returns: A Tableau Group object; None if it's not in the catalog
+        """
+        return self.__find('groups', group_id, group_name)
@@ -1,11 +1,22 @@
 """ Static functionality of the TableauServer and Core classes """
+from urllib.parse import quote
 import requests
+from urllib3.fields import RequestField
+from urllib3.filepost import encode_multipart_formdata
 from tableau_utilities.general.funcs import flatten_dict
 
 
 class TableauConnectionError(Exception):
-    """ An Exception in the TableauServer connection """
-    pass
+    """ An Exception in the TableauServer connection
+
+    Attributes:
+        status_code (int): The HTTP status of the response that failed; None if the error isn't from a response
+        code (str): The Tableau error code of the response, i.e. 400065; None if the response has no error code
+    """
+    def __init__(self, *args, status_code=None, code=None):
+        super().__init__(*args)
+        self.status_code = status_code
+        self.code = code
 
 
 def bytes_to_mb(b):
@@ -31,6 +42,80 @@ def transform_tableau_object(object_dict):
     object_dict.update(update)
 
 
+def filter_expression(**filters):
+    """ Gets the filter expression of a REST API query, matching fields equal to values,
+        i.e. filter_expression(name='Sales', projectName='Finance') -> name:eq:Sales,projectName:eq:Finance
+
+    Args:
+        filters: The value of each field to filter on; fields with a value of None are not filtered
+
+    Returns: The URL encoded expression; None if a value can't be filtered on, i.e. it contains a comma,
+     which separates the filters of an expression
+    """
+    expressions = list()
+    for field, value in filters.items():
+        if value is None:
+            continue
+        value = str(value)
+        if ',' in value:
+            return None
+        expressions.append(f'{field}:eq:{quote(value, safe="")}')
+    return ','.join(expressions) or None
+
+
+def is_rejected_filter(err):
+    """ Checks if an error is the server rejecting the filter of a query, as a bad request;
+        rather than i.e. the user not being signed in or permitted, or the server not being reachable
+
+    Args:
+        err (TableauConnectionError): The error of the query
+
+    Returns: True if the query can be made again without the filter
+    """
+    return err.status_code == 400
+
+
+def get_multipart_details(parts):
+    """ Gets the body and content_type for a multipart/mixed request.
+
+    Args:
+        parts (list[tuple[str, str, str, str]]): The parts that make up the RequestField
+            i.e. [(name, data, file_name, content_type)]
+
+    Returns: Request body and content_type
+    """
+    part_list = list()
+    for name, data, file_name, content_type in parts:
+        r = RequestField(name=name, data=data, filename=file_name)
+        r.make_multipart(content_type=content_type)
+        part_list.append(r)
+    post_body, content_type = encode_multipart_formdata(part_list)
+    content_type = ''.join(('multipart/mixed',) + content_type.partition(';')[1:])
+    return post_body, content_type
+
+
+def connection_update_json(connection):
+    """ Gets the JSON payload to update a connection with
+
+    Args:
+        connection (tso.Connection): The Connection Tableau server object
+
+    Returns: The payload, with the attributes of the connection named as the REST API expects
+    """
+    conn_dict = connection.dict()
+    if 'user_name' in conn_dict:
+        conn_dict.setdefault('userName', conn_dict.pop('user_name'))
+    if 'embed_password' in conn_dict:
+        conn_dict.setdefault('embedPassword', conn_dict.pop('embed_password'))
+    if 'password' in conn_dict:
+        conn_dict.setdefault('password', conn_dict.pop('password'))
+    if 'server_address' in conn_dict:
+        conn_dict.setdefault('serverAddress', conn_dict.pop('server_address'))
+    if 'query_tagging_enabled' in conn_dict:
+        conn_dict.setdefault('queryTaggingEnabled', conn_dict.pop('query_tagging_enabled'))
+    return {'connection': conn_dict}
+
+
 def validate_response(response):
     """ Validates the response received from an API call
 
@@ -46,6 +131,7 @@ def validate_response(response):
     except requests.exceptions.HTTPError as err:
         error = info.get('error', {})
         raise TableauConnectionError(
-            f'\nError: {error.get("code")}: {error.get("summary")} - {error.get("detail")}\n{err}'
+            f'\nError: {error.get("code")}: {error.get("summary")} - {error.get("detail")}\n{err}',
+            status_code=response.status_code, code=error.get('code')
         ) from err
     return info
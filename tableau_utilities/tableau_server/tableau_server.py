@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
 from tableau_utilities.tableau_server.base import Base
 from tableau_utilities.tableau_server.get import Get
 from tableau_utilities.tableau_server.create import Create
@@ -6,8 +7,12 @@ from tableau_utilities.tableau_server.download import Download
 from tableau_utilities.tableau_server.publish import Publish
 from tableau_utilities.tableau_server.refresh import Refresh
 from tableau_utilities.tableau_server.update import Update
+from tableau_utilities.tableau_server.site_catalog import SiteCatalog, CATALOG_OBJECTS
 from tableau_utilities.tableau_server.static import TableauConnectionError
 
+# The maximum number of objects per page the REST API returns
+MAX_PAGE_SIZE = 1000
+
 
 class TableauServer(Base):
     """ Connects and interacts with Tableau Online/Server, via the REST API. """
@@ -20,7 +25,9 @@ class TableauServer(Base):
             password: str = None,
             personal_access_token_secret: str = None,
             personal_access_token_name: str = None,
-            api_version: float = None
+            api_version: float = None,
+            page_size: int = 100,
+            max_workers: int = 8
     ):
         """ To sign in to Tableau a user needs either a username & password or token secret & token name
 
@@ -32,6 +39,8 @@ class TableauServer(Base):
             personal_access_token_secret: The secret of the personal access token used
             site: The Tableau Online site id
             api_version: The Tableau REST API version
+            page_size: The number of objects per page, when getting all objects of a type; up to 1000
+            max_workers: The maximum number of requests made concurrently, i.e. for pages of objects
         """
         self.user = user
         self._pw = password
@@ -40,12 +49,23 @@ class TableauServer(Base):
         self.host = host
         self.site = site
         self.api = api_version or 3.18
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise TableauConnectionError(f'Page size must be between 1 and {MAX_PAGE_SIZE}; not {page_size}')
+        self.page_size = page_size
+        if max_workers < 1:
+            raise TableauConnectionError(f'Max workers must be at least 1; not {max_workers}')
+        self.max_workers = max_workers
         # Set by class
         self._auth_token = None
         self.url: str = None
+        self.catalog: SiteCatalog = None
         # Create a session on initialization
         self.session = requests.session()
         self.session.headers.update({'accept': 'application/json', 'content-type': 'application/json'})
+        # Keep a connection for each concurrent request; a SiteCatalog pages each of its objects concurrently
+        adapter = HTTPAdapter(pool_maxsize=max(max_workers * len(CATALOG_OBJECTS), DEFAULT_POOLSIZE))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         super().__init__(self)
         # Sign in on initialization
         self.__sign_in()
@@ -95,6 +115,27 @@ class TableauServer(Base):
         self._post(url=f"{self.host}/api/{self.api}/auth/signout")
         self.session.close()
 
+    def attach_catalog(self, catalog=None, ttl=None):
+        """ Attaches a SiteCatalog to the server; so lookups by each helper, i.e. get.datasource and publishing,
+            find objects in the catalog instead of listing them. Objects that aren't in the catalog,
+            i.e. ones created since it was loaded, are still looked up on the server.
+
+        Args:
+            catalog (SiteCatalog): The catalog to attach; defaults to a new catalog of the site
+            ttl (float): The number of seconds a new catalog is kept for, before it's reloaded; None to keep it
+
+        Returns: The catalog
+        """
+        catalog = catalog or SiteCatalog(self, ttl=ttl)
+        for obj in (self, self.get, self.create, self.download, self.publish, self.refresh, self.update):
+            obj.catalog = catalog
+        return catalog
+
+    def detach_catalog(self):
+        """ Detaches the SiteCatalog from the server; so lookups are made on the server again """
+        for obj in (self, self.get, self.create, self.download, self.publish, self.refresh, self.update):
+            obj.catalog = None
+
     def embed_datasource_credentials(self, datasource_id, credentials, connection_type):
         """ Embed the given credentials for all connections of a datasource of the given connection type.
             Only embeds Username and Password credentials.
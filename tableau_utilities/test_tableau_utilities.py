@@ -1,14 +1,33 @@
+import asyncio
 import pytest
 import tableau_utilities as tu
 import tableau_utilities.tableau_file.tableau_file_objects as tfo
 import shutil
+import io
 import os
+import pickle
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+import xmltodict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+from time import sleep
+from types import SimpleNamespace
+from tableau_utilities.general.funcs import transform_tableau_object
+from tableau_utilities.tableau_file.datasource_diff import diff_file_object_lists
+from tableau_utilities.tableau_server.get import Get
+from tableau_utilities.tableau_server.aio.get import AsyncGet
+from tableau_utilities.tableau_server.aio.download import AsyncDownload
+from tableau_utilities.tableau_server.aio.publish import AsyncPublish
 
 
 EXTRACT_PATH = 'test_data_source.tdsx'
 LIVE_PATH = 'test_live_data_source.tdsx'
 ONE_FOLDER_PATH = 'one_folder.tdsx'
 NO_FOLDER_PATH = 'no_folder.tdsx'
+WORKBOOK_PATH = 'test_workbook.twbx'
 
 COLUMN = tfo.Column(
     name='FRIENDLY_NAME',
@@ -69,6 +88,63 @@ def test_column_attributes():
             assert value == getattr(column2, attr)
 
 
+# TableauFileObject().__post_init__()
+def test_file_object_coercions():
+    record = tfo.MetadataRecord(class_name='column', remote_name='A', remote_type='129', parent_name='[T]',
+                                remote_alias='A', ordinal='3', width='100', contains_null='true')
+    assert (record.ordinal, record.width, record.contains_null, record.precision) == (3, 100, True, None)
+    assert tfo.Column(name='A', datatype='string', role='dimension', type='nominal', hidden='false').hidden is False
+    for timestamp in ['2023-01-31 12:34:56.789', '2023-01-31 12:34:56.000123', '2023-1-31 2:34:56.5']:
+        event = tfo.RefreshEvent(timestamp_start=timestamp)
+        assert event.timestamp_start == datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S.%f')
+    with pytest.raises(ValueError):
+        tfo.RefreshEvent(timestamp_start='2023-01-31T12:34:56')
+
+
+# transform_tableau_object()
+def test_transform_tableau_object():
+    item = {'@class': 'sqlserver', '@_.fcp.ObjectModelEncapsulateLegacy.true...caption': 'Name',
+            '@default-role': 'dimension', 'attributes': {'attribute': ['a']}}
+    expected = {'class_name': 'sqlserver', 'caption': 'Name', 'default_role': 'dimension',
+                'attributes': {'attribute': ['a']}}
+    copied = transform_tableau_object(item)
+    owned = transform_tableau_object(item, copy_values=False)
+    assert copied == owned == expected
+    assert copied['attributes'] is not item['attributes'] and owned['attributes'] is item['attributes']
+
+
+# TableauFileObjects() of dicts passed in
+def test_file_objects_copy_caller_values():
+    record = {
+        '@class': 'column', '@remote-name': 'ID', '@remote-type': '130', '@parent-name': '[T]',
+        '@remote-alias': 'ID', 'collation': {'@flag': '0', '@name': 'binary'},
+        'attributes': {'attribute': [{'@datatype': 'string', '@name': 'DebugRemoteType', '#text': '"VARCHAR"'}]}
+    }
+    records = tfo.TableauFileObjects([record], item_class=tfo.MetadataRecord, tag='metadata-record')
+    connection = tfo.ParentConnection(class_name='federated', metadata_records={'metadata-record': [record]})
+    extract = tfo.Extract(connection={'@class': 'hyper', 'metadata-records': {'metadata-record': [record]}})
+    record['collation']['@name'] = 'changed'
+    record['attributes']['attribute'].append({'@datatype': 'string', '@name': 'Changed'})
+    for item in [records[0], connection.metadata_records[0], extract.connection.metadata_records[0]]:
+        assert item.collation == {'@flag': '0', '@name': 'binary'}
+        assert len(item.attributes) == 1
+
+
+# TableauFileObject slots
+def test_file_objects_are_slotted():
+    folder = tfo.Folder(name='Friendly Folder', folder_item=[tfo.FolderItem(name='FRIENDLY_CALC')])
+    for obj in [COLUMN, folder, folder.folder_item[0], tfo.MappingCol(key='A', value='[T].[A]')]:
+        # Fields are held in slots, not the instance's __dict__
+        assert sys.version_info < (3, 10) or not obj.__dict__
+    assert (tfo.Column.tag, tfo.FolderItem.type) == ('column', 'field')
+    assert bool(folder) and not tfo.DateOptions()
+    # Attributes that aren't fields can still be set
+    folder.note = 'Not a field'
+    copied = pickle.loads(pickle.dumps(folder))
+    assert copied == folder and copied.folder_item == folder.folder_item and copied.note == 'Not a field'
+    assert not copied.is_dirty()
+
+
 # TableauFileObjects().pop()
 def test_tableau_file_objects_pop():
     column = tfo.Column(**{
@@ -84,6 +160,67 @@ def test_tableau_file_objects_pop():
     assert len(columns) == 0
 
 
+# TableauFileObjects() key index
+def test_tableau_file_objects_index():
+    columns = tfo.TableauFileObjects(
+        [{'name': f'COL_{i}', 'datatype': 'string', 'role': 'dimension', 'type': 'nominal'} for i in range(10)],
+        item_class=tfo.Column, tag='column'
+    )
+    assert columns.get('COL_3') is columns[3]
+    assert columns.index('[COL_7]') == 7
+    # Updating keeps the position of the item
+    columns.update(tfo.Column(name='COL_3', datatype='integer', role='measure', type='quantitative'))
+    assert columns[3].datatype == 'integer'
+    # Deleting and popping shift the following items
+    columns.delete('COL_0')
+    assert columns.pop('COL_5').name == '[COL_5]'
+    assert [c.name for c in columns][:4] == ['[COL_1]', '[COL_2]', '[COL_3]', '[COL_4]']
+    assert 'COL_5' not in columns and columns.get('COL_5') is None
+    # Renaming an item in place is picked up by the index
+    columns[0].name = '[RENAMED]'
+    assert columns.get('RENAMED') is columns[0] and 'COL_1' not in columns
+    # The first matching item is found, as with a list
+    columns.insert(0, tfo.Column(name='COL_9', datatype='real', role='measure', type='quantitative'))
+    assert columns.get('COL_9').datatype == 'real'
+    assert columns.index('COL_9') == 0
+    with pytest.raises(ValueError):
+        columns.index('MISSING')
+
+
+# TableauFileObjects() key versions and positions
+def test_tableau_file_objects_index_tracking():
+    def make_columns(prefix):
+        return tfo.TableauFileObjects(
+            [{'name': f'{prefix}_{i}', 'datatype': 'string', 'role': 'dimension', 'type': 'nominal'}
+             for i in range(100)],
+            item_class=tfo.Column, tag='column'
+        )
+    columns, others = make_columns('COL'), make_columns('OTHER')
+    assert columns.get('COL_50') is columns[50] and others.get('OTHER_50') is others[50]
+    # Renaming an item only changes the key version of the lists holding it
+    others[0].name = '[RENAMED]'
+    assert columns._key_version == 0 and others._key_version == 1
+    assert others.get('RENAMED') is others[0] and others.get('OTHER_0') is None
+    # An item held by two lists is re-indexed by both
+    shared = columns[10]
+    others.append(shared)
+    shared.name = '[SHARED]'
+    assert columns.get('SHARED') is shared and others.get('SHARED') is shared
+    assert others.index('SHARED') == 100
+    # Copies of an item aren't held by the lists the item is in
+    pickle.loads(pickle.dumps(shared)).name = '[COPY]'
+    assert columns.get('COPY') is None and columns.get('SHARED') is shared
+    # Positions stay valid as items are deleted, without being rebuilt
+    columns.index('COL_99')
+    for i in range(0, 90, 3):
+        columns.delete(f'COL_{i}')
+    positions = columns._positions
+    assert [columns.index(c.name) for c in columns] == list(range(len(columns)))
+    assert columns._positions is positions and columns._deleted
+    assert columns.pop().name == '[COL_99]' and columns.pop(0).name == '[COL_1]'
+    assert columns.index('COL_98') == len(columns) - 1 and columns.index('COL_2') == 0
+
+
 # Datasource().DatasourceItems
 def test_datasource_items():
     shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
@@ -96,6 +233,34 @@ def test_datasource_items():
     assert datasource.extract is not None and datasource.extract != []
 
 
+# TableauFileObject.from_element()
+def test_from_element_matches_xmltodict():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    datasource = tu.Datasource(EXTRACT_PATH)
+    os.remove(EXTRACT_PATH)
+    for element in datasource._root.iter():
+        expected = xmltodict.parse(ET.tostring(element))[element.tag]
+        assert tfo._element_to_dict(element) == expected
+    for element in datasource._root.iter('column'):
+        expected = tfo.Column(**transform_tableau_object(xmltodict.parse(ET.tostring(element))['column']))
+        assert tfo.Column.from_element(element).dict() == expected.dict()
+
+
+# TableauFileObject.xml()
+def test_xml_matches_xmltodict():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    datasource = tu.Datasource(EXTRACT_PATH)
+    os.remove(EXTRACT_PATH)
+    for section in datasource.sections():
+        for item in section if isinstance(section, tfo.TableauFileObjects) else [section]:
+            if item:
+                expected = ET.fromstring(xmltodict.unparse({item.tag: item.dict()}, pretty=True))
+                assert ET.tostring(item.xml()) == ET.tostring(expected)
+    value = {'@xmlns:ns0': 'http://example.com', '@ns0:flag': True, '@empty': None, 'child': [1, None, 'text']}
+    expected = ET.fromstring(xmltodict.unparse({'root': value}, pretty=True))
+    assert ET.tostring(tfo._dict_to_element('root', value)) == ET.tostring(expected)
+
+
 # Datasource().unzip()
 def test_unzip_tableau_file():
     shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
@@ -107,6 +272,119 @@ def test_unzip_tableau_file():
     assert content is not None
 
 
+# Datasource().unzip(members=..., skip_unchanged=True)
+def test_unzip_selected_members():
+    extract_to = 'test_unzip_selected_members'
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    try:
+        datasource = tu.Datasource(EXTRACT_PATH)
+        path = datasource.unzip(extract_to=extract_to, members='*/Extracts/*.hyper')
+        hyper_path = os.path.join(extract_to, 'test_data_source.tds Files', 'Data', 'Extracts', 'test_data_source.hyper')
+        assert path is None
+        assert os.path.getsize(hyper_path) == 65536
+        assert not os.path.exists(os.path.join(extract_to, 'test_data_source.tds'))
+        # Unchanged members are not rewritten, when they're skipped; changed members are
+        modified = os.path.getmtime(hyper_path) - 100
+        os.utime(hyper_path, (modified, modified))
+        path = datasource.unzip(extract_to=extract_to, unzip_all=True, skip_unchanged=True)
+        assert os.path.getmtime(hyper_path) == modified
+        assert path == os.path.join(extract_to, 'test_data_source.tds')
+        with open(path, 'w') as f:
+            f.write('changed')
+        datasource.unzip(extract_to=extract_to, unzip_all=True, skip_unchanged=True)
+        assert tu.Datasource(path).columns
+        # Every member is rewritten by default
+        datasource.unzip(extract_to=extract_to, unzip_all=True)
+        assert os.path.getmtime(hyper_path) != modified
+    finally:
+        shutil.rmtree(extract_to, ignore_errors=True)
+        os.remove(EXTRACT_PATH)
+
+
+# Datasource().save() with a CompressionPolicy
+def test_datasource_save_compression():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    try:
+        with zipfile.ZipFile(EXTRACT_PATH) as z:
+            before = {i.filename: (i.compress_type, z.read(i)) for i in z.infolist()}
+        datasource = tu.Datasource(EXTRACT_PATH)
+        # Members keep their compression by default
+        datasource.save()
+        with zipfile.ZipFile(EXTRACT_PATH) as z:
+            assert {i.filename: i.compress_type for i in z.infolist()} == {k: v[0] for k, v in before.items()}
+        # Otherwise, XML is deflated, and hyper extracts are stored
+        datasource.compression = tu.CompressionPolicy(compresslevel=9, preserve=False)
+        datasource.save()
+        with zipfile.ZipFile(EXTRACT_PATH) as z:
+            assert z.testzip() is None
+            after = {i.filename: (i.compress_type, z.read(i)) for i in z.infolist()}
+        hyper = 'test_data_source.tds Files/Data/Extracts/test_data_source.hyper'
+        assert after[hyper] == (zipfile.ZIP_STORED, before[hyper][1])
+        assert after['test_data_source.tds'][0] == zipfile.ZIP_DEFLATED
+        assert list(after) == list(before)
+        assert tu.Datasource(EXTRACT_PATH).columns == datasource.columns
+    finally:
+        os.remove(EXTRACT_PATH)
+
+
+# Raw archive members
+def test_raw_zip_writes(monkeypatch):
+    from tableau_utilities.tableau_file import compression
+    # Raw members are written with ZipFile internals; fail loudly if they change on a version they're used with
+    with zipfile.ZipFile(io.BytesIO(), 'w') as target:
+        if compression.raw_writes_supported():
+            assert compression.raw_writes_supported(target), 'ZipFile internals changed; see raw_writes_supported'
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    try:
+        with zipfile.ZipFile(EXTRACT_PATH) as z:
+            before = {i.filename: (i.compress_type, z.read(i)) for i in z.infolist()}
+        # Otherwise members are written with the public API
+        monkeypatch.setattr(compression, '_RAW_WRITE_VERSIONS', ((0, 0), (0, 0)))
+        datasource = tu.Datasource(EXTRACT_PATH)
+        datasource.save()
+        with zipfile.ZipFile(EXTRACT_PATH) as z:
+            assert z.testzip() is None
+            preserved = {i.filename: (i.compress_type, z.read(i)) for i in z.infolist()}
+        datasource.compression = tu.CompressionPolicy(preserve=False)
+        datasource.save()
+        with zipfile.ZipFile(EXTRACT_PATH) as z:
+            assert z.testzip() is None
+            recompressed = {i.filename: (i.compress_type, z.read(i)) for i in z.infolist()}
+        hyper = 'test_data_source.tds Files/Data/Extracts/test_data_source.hyper'
+        assert {k: v[0] for k, v in preserved.items()} == {k: v[0] for k, v in before.items()}
+        assert preserved[hyper] == before[hyper]
+        assert recompressed[hyper] == (zipfile.ZIP_STORED, before[hyper][1])
+        assert tu.Datasource(EXTRACT_PATH).columns == datasource.columns
+    finally:
+        os.remove(EXTRACT_PATH)
+
+
+# write_raw_member() on Python versions raw writes haven't been verified with
+def test_raw_zip_writes_fallback(monkeypatch):
+    from tableau_utilities.tableau_file import compression
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    try:
+        with zipfile.ZipFile(EXTRACT_PATH) as z:
+            before = {i.filename: (i.compress_type, z.read(i)) for i in z.infolist()}
+        for version in [(3, 9, 0), (3, 13, 0), (3, 14, 0)]:
+            monkeypatch.setattr(compression, 'sys', SimpleNamespace(version_info=version, version='.'.join(map(str, version))))
+            assert not compression.raw_writes_supported()
+            with zipfile.ZipFile(io.BytesIO(), 'w') as target:
+                assert not compression.raw_writes_supported(target)
+                with pytest.raises(NotImplementedError):
+                    compression.write_raw_member(target, zipfile.ZipInfo('member'), io.BytesIO())
+            tu.Datasource(EXTRACT_PATH).save()
+            with zipfile.ZipFile(EXTRACT_PATH) as z:
+                assert z.testzip() is None
+                after = {i.filename: (i.compress_type, z.read(i)) for i in z.infolist()}
+            # Members keep their compression, and only the TDS is rewritten
+            assert {k: v[0] for k, v in after.items()} == {k: v[0] for k, v in before.items()}
+            assert {k: v for k, v in after.items() if k != 'test_data_source.tds'} == \
+                {k: v for k, v in before.items() if k != 'test_data_source.tds'}
+    finally:
+        os.remove(EXTRACT_PATH)
+
+
 # Datasource().save()
 def test_datasource_save():
     shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
@@ -118,6 +396,325 @@ def test_datasource_save():
         assert before == after
 
 
+# Datasource() lazy sections
+def test_datasource_lazy_sections():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    datasource = tu.Datasource(EXTRACT_PATH)
+    assert datasource.materialized_sections() == []
+    extract_element = datasource._root.find('extract')
+    datasource.columns.add(COLUMN)
+    assert datasource.materialized_sections() == ['columns']
+    datasource.save()
+    # Sections that were never accessed keep their original elements
+    assert datasource._root.find('extract') is extract_element
+    datasource_after = tu.Datasource(EXTRACT_PATH)
+    os.remove(EXTRACT_PATH)
+    assert datasource_after.columns.get(COLUMN) is not None
+    assert datasource_after.extract == datasource.extract
+
+
+# Datasource().save() only regenerates what changed
+def test_datasource_save_incremental():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    datasource = tu.Datasource(EXTRACT_PATH)
+    column_elements = [e for e in datasource._root if e.tag == 'column']
+    connection_element = datasource._root.find('connection')
+    assert not datasource.columns.is_dirty() and not datasource.connection.is_dirty()
+    datasource.columns[0].caption = 'Changed Caption'
+    assert datasource.columns.is_dirty()
+    datasource.save()
+    after = [e for e in datasource._root if e.tag == 'column']
+    # Only the changed column is regenerated, and the order of the columns is kept
+    assert after[0] is not column_elements[0] and after[0].get('caption') == 'Changed Caption'
+    assert after[1:] == column_elements[1:]
+    assert datasource._root.find('connection') is connection_element
+    assert not datasource.columns.is_dirty()
+    # Changes made in-place to lists within a FileObject are detected
+    datasource.connection.metadata_records[0].attributes.append({'@name': 'test', '#text': 'true'})
+    assert datasource.connection.is_dirty()
+    datasource.save()
+    assert datasource._root.find('connection') is not connection_element
+    datasource_after = tu.Datasource(EXTRACT_PATH)
+    os.remove(EXTRACT_PATH)
+    assert datasource_after.columns[0].caption == 'Changed Caption'
+    assert datasource_after.connection.metadata_records[0].attributes[-1] == {'@name': 'test', '#text': 'true'}
+
+
+# Datasource(xml_backend='lxml')
+def test_datasource_lxml_backend():
+    pytest.importorskip('lxml')
+    saved = dict()
+    for xml_backend in ['etree', 'lxml']:
+        path = f'{xml_backend}_{EXTRACT_PATH}'
+        shutil.copyfile(f'resources/{EXTRACT_PATH}', path)
+        datasource = tu.Datasource(path, xml_backend=xml_backend)
+        datasource.columns[0].caption = 'Changed Caption'
+        datasource.columns.add(COLUMN)
+        datasource.save()
+        with zipfile.ZipFile(path) as z:
+            tds = [z.read(n) for n in z.namelist() if n.endswith('.tds')][0]
+        saved[xml_backend] = (
+            [s.dict() if isinstance(s, tfo.TableauFileObject) else [i.dict() for i in s] for s in datasource.sections()],
+            ET.canonicalize(tds.decode(), rewrite_prefixes=True)
+        )
+        os.remove(path)
+    assert saved['etree'] == saved['lxml']
+    with pytest.raises(tu.TableauFileError):
+        tu.Datasource(f'resources/{EXTRACT_PATH}', xml_backend='minidom')
+
+
+# Datasource.probe()
+def test_tableau_file_probe():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    summary = tu.Datasource.probe(EXTRACT_PATH)
+    everything = tu.Datasource.probe(EXTRACT_PATH, sections=['connection', 'columns', 'folders_common', 'extract'])
+    datasource = tu.Datasource(EXTRACT_PATH)
+    os.remove(EXTRACT_PATH)
+    assert summary.connection_class == datasource.connection.class_name
+    assert [c['class'] for c in summary.named_connections] == ['snowflake']
+    assert summary.metadata_record_names == [m.remote_name for m in datasource.connection.metadata_records]
+    assert summary.column_names is None and summary.folders is None and summary.extract is None
+    assert everything.column_names == [c.name for c in datasource.columns]
+    assert everything.folders == {f.name: [i.name for i in f.folder_item] for f in datasource.folders_common}
+    assert everything.extract['enabled'] == 'true'
+    assert tu.Datasource.probe(f'resources/{LIVE_PATH}', sections=['extract']).extract == {}
+    with pytest.raises(tu.TableauFileError):
+        tu.Datasource.probe(f'resources/{EXTRACT_PATH}', sections=['worksheets'])
+
+
+# Datasource(cache=)
+def test_datasource_cache():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    cache = tu.DatasourceCache('test_cache')
+    parsed = tu.Datasource(EXTRACT_PATH, cache=cache)
+    # Sections are only built, and cached, when they're accessed
+    built_on_load = parsed.materialized_sections()
+    parsed_columns = [c.dict() for c in parsed.columns]
+    cached_on_access = sorted(os.listdir('test_cache'))
+    cached = tu.Datasource(EXTRACT_PATH, cache=cache)
+    cached_columns = [c.dict() for c in cached.columns]
+    cached_xml = '_tree' in cached.__dict__
+    cached.columns[0].caption = 'Changed Caption'
+    loaded_elements = list(cached._root)
+    cached.save()
+    # Unchanged items reuse the Elements they were loaded from
+    reused = [any(c._element is e for e in loaded_elements) for c in cached.columns]
+    saved = tu.Datasource(EXTRACT_PATH, cache=cache)
+    saved_caption = saved.columns[0].caption
+    saved_xml = '_tree' in saved.__dict__
+    entries = len(os.listdir('test_cache'))
+    small_cache = tu.DatasourceCache('test_cache', max_size=1)
+    small_cache.evict()
+    evicted = len(os.listdir('test_cache'))
+    os.remove(EXTRACT_PATH)
+    shutil.rmtree('test_cache')
+    assert built_on_load == [] and len(cached_on_access) == 1 and cached_on_access[0].endswith('-columns.pickle')
+    assert not cached_xml
+    assert cached_columns == parsed_columns
+    assert reused == [False] + [True] * (len(reused) - 1)
+    assert saved_caption == 'Changed Caption' and not saved_xml
+    assert entries == 2 and evicted == 0
+
+
+# Datasource().save()
+def test_datasource_save_copies_archive_members():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    with zipfile.ZipFile(EXTRACT_PATH) as z:
+        before = {i.filename: (i.CRC, i.compress_type, i.compress_size) for i in z.infolist()}
+    files_before = set(os.listdir('.'))
+    datasource = tu.Datasource(EXTRACT_PATH)
+    datasource.columns.add(COLUMN)
+    datasource.save()
+    files_after = set(os.listdir('.'))
+    with zipfile.ZipFile(EXTRACT_PATH) as z:
+        assert z.testzip() is None
+        after = {i.filename: (i.CRC, i.compress_type, i.compress_size) for i in z.infolist()}
+    os.remove(EXTRACT_PATH)
+    assert files_before == files_after
+    assert before.keys() == after.keys()
+    for name in before:
+        if not name.endswith('.tds'):
+            assert before[name] == after[name]
+
+
+# Datasource().diff()
+def test_datasource_diff():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    datasource = tu.Datasource(EXTRACT_PATH)
+    other = tu.Datasource(EXTRACT_PATH)
+    os.remove(EXTRACT_PATH)
+    identical = datasource.diff(other)
+    other.columns['NAME'].caption = 'Full Name'
+    other.columns.delete('ID')
+    other.columns.add(COLUMN)
+    other.connection.metadata_records.get('QUANTITY').local_type = 'real'
+    diffs = datasource.diff(other)
+    assert identical == {}
+    assert list(diffs) == ['connection', 'columns']
+    assert diffs['columns'].dict() == {
+        'added': [COLUMN.dict()],
+        'removed': [datasource.columns['ID'].dict()],
+        'changed': {'[NAME]': {'caption': {'old': 'Name', 'new': 'Full Name'}}},
+    }
+    assert diffs['connection'].dict() == {
+        'metadata_records': {
+            'added': [], 'removed': [], 'changed': {'QUANTITY': {'local_type': {'old': 'integer', 'new': 'real'}}}
+        }
+    }
+    # Items that share a key are matched in order, and each change is kept
+    old_columns = [pickle.loads(pickle.dumps(datasource.columns['NAME'])) for _ in range(3)]
+    new_columns = pickle.loads(pickle.dumps(old_columns))
+    for column, caption in zip(new_columns, ['First', None, 'Third']):
+        column.caption = caption or column.caption
+    duplicates = diff_file_object_lists(old_columns, new_columns)
+    assert duplicates.dict() == {
+        'added': [], 'removed': [], 'changed': {
+            '[NAME]': {'caption': {'old': 'Name', 'new': 'First'}},
+            '[NAME] (2)': {'caption': {'old': 'Name', 'new': 'Third'}},
+        }
+    }
+    assert list(duplicates.changed) == ['[NAME]', ('[NAME]', 2)]
+
+
+# load_datasources()
+def test_load_datasources():
+    os.makedirs('test_bulk_load', exist_ok=True)
+    for path in [EXTRACT_PATH, LIVE_PATH]:
+        shutil.copyfile(f'resources/{path}', os.path.join('test_bulk_load', path))
+    paths = ['test_bulk_load/*.tdsx', 'test_bulk_load/missing.tdsx']
+    columns = tu.load_datasources(paths, projection='columns', max_workers=2)
+    datasources = tu.load_datasources(paths[0], max_workers=2)
+    # Datasources are pickled without their XML, which is parsed again when it's used
+    loaded_xml = '_root' in datasources[0].value.__dict__
+    datasources[0].value.columns['NAME'].caption = 'Full Name'
+    datasources[0].value.save()
+    saved = tu.Datasource(datasources[0].file_path)
+    shutil.rmtree('test_bulk_load')
+    assert [os.path.basename(r.file_path) for r in columns] == [EXTRACT_PATH, LIVE_PATH, 'missing.tdsx']
+    assert [c.name for c in columns[0].value] == [c.name for c in saved.columns] and columns[0].error is None
+    assert columns[2].value is None and columns[2].error.startswith('FileNotFoundError')
+    assert not loaded_xml and saved.columns['NAME'].caption == 'Full Name'
+    with pytest.raises(ValueError):
+        tu.load_datasources(paths, projection='folders')
+
+
+# Datasource().__getstate__()
+def test_datasource_pickle_checks_file():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    datasource = tu.Datasource(EXTRACT_PATH)
+    datasource.columns
+    pickled = pickle.dumps(datasource)
+    unchanged = pickle.loads(pickled)
+    unchanged._root
+    linked = [c._element is not None for c in unchanged.columns]
+    # Once the file is changed, the pickled positions of its Elements no longer apply
+    datasource.columns['NAME'].caption = 'Full Name'
+    datasource.columns.delete(datasource.columns[0].name)
+    datasource.save()
+    changed = pickle.loads(pickled)
+    changed._root
+    unlinked = [c._element is None for c in changed.columns]
+    os.remove(EXTRACT_PATH)
+    assert linked and all(linked)
+    assert unlinked and all(unlinked)
+
+
+# Datasource().to_frame()
+def test_datasource_to_frame():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    datasource = tu.Datasource(EXTRACT_PATH)
+    os.remove(EXTRACT_PATH)
+    columns = datasource.to_frame('columns')
+    assert list(columns['name']) == [c.name for c in datasource.columns]
+    assert list(columns['caption'].fillna('')) == [c.caption or '' for c in datasource.columns]
+    records = datasource.to_frame('metadata_records')
+    assert list(records['remote_name']) == [m.remote_name for m in datasource.connection.metadata_records]
+    folders = datasource.to_frame('folders')
+    assert len(folders) == sum(len(f.folder_item) or 1 for f in datasource.folders_common)
+    assert set(folders['folder_name']) == {f.name for f in datasource.folders_common}
+    assert list(datasource.to_frame('mapping_cols')['key']) == [c.key for c in datasource.connection.cols]
+    connections = datasource.to_frame('connections')
+    assert list(connections['class_name']) == [
+        nc.connection.class_name for nc in datasource.connection.named_connections
+    ]
+    with pytest.raises(ValueError):
+        datasource.to_frame('layout')
+
+
+# load_frame()
+def test_load_frame():
+    os.makedirs('test_load_frame', exist_ok=True)
+    for path in [EXTRACT_PATH, LIVE_PATH]:
+        shutil.copyfile(f'resources/{path}', os.path.join('test_load_frame', path))
+    try:
+        frame = tu.load_frame('test_load_frame/*.tdsx', 'columns', max_workers=2)
+        expected = [
+            (os.path.abspath(os.path.join('test_load_frame', path)), c.name)
+            for path in [EXTRACT_PATH, LIVE_PATH] for c in tu.Datasource(os.path.join('test_load_frame', path)).columns
+        ]
+        assert list(zip(frame['file_path'], frame['name'])) == expected
+        with pytest.raises(tu.TableauFileError):
+            tu.load_frame(['test_load_frame/*.tdsx', 'test_load_frame/missing.tdsx'], 'columns', max_workers=1)
+        ignored = tu.load_frame(
+            ['test_load_frame/*.tdsx', 'test_load_frame/missing.tdsx'], 'columns', max_workers=1, errors='ignore'
+        )
+        assert len(ignored) == len(expected)
+    finally:
+        shutil.rmtree('test_load_frame')
+
+
+# Workbook()
+def test_workbook():
+    shutil.copyfile(f'resources/{WORKBOOK_PATH}', WORKBOOK_PATH)
+    workbook = tu.Workbook(WORKBOOK_PATH)
+    names = [(d.name, d.caption) for d in workbook.datasources]
+    # Only the accessed sections are built
+    sections = workbook.materialized_sections()
+    datasource = workbook.get_datasource('Test Data Source')
+    datasource.columns['NAME'].caption = 'Full Name'
+    datasource.save()
+    saved = tu.Workbook(WORKBOOK_PATH)
+    os.remove(WORKBOOK_PATH)
+    assert names == [('Parameters', None), ('federated.0a1b2c3d4e5f6g', 'Test Data Source')]
+    assert sections == ['datasources']
+    assert datasource.connection.named_connections == ['snowflake']
+    assert saved.get_datasource('federated.0a1b2c3d4e5f6g').columns['NAME'].caption == 'Full Name'
+    assert [w.name for w in saved.worksheets] == ['Names', 'Quantity by Name']
+    assert [c.name for _, c in saved.worksheets['Quantity by Name'].columns()] == ['[NAME]', '[QUANTITY]']
+    assert saved.worksheets['Names'].columns('Parameters') == []
+    assert saved.dashboards['Overview'].worksheets == ['Names', 'Quantity by Name']
+    with pytest.raises(tu.TableauFileError):
+        tu.Workbook(f'resources/{EXTRACT_PATH}')
+
+
+# Datasource().save() in a temp workspace
+def test_datasource_save_temp_workspace():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    failed_column = tfo.Column(name='FAILED', datatype='string', role='dimension', type='nominal')
+    tu.set_workspace_root('test_workspace')
+    try:
+        datasources = [tu.Datasource(EXTRACT_PATH) for _ in range(4)]
+        for datasource in datasources:
+            datasource.columns.add(COLUMN)
+        # Workspaces are unique, so the same file can be saved concurrently
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda d: d.save(), datasources))
+        workspaces = os.listdir('test_workspace')
+        # A failed save leaves the file untouched, and removes its workspace
+        datasources[0].columns.add(failed_column)
+        datasources[0]._tree = None
+        with pytest.raises(AttributeError):
+            datasources[0].save()
+        failed_workspaces = os.listdir('test_workspace')
+        saved = tu.Datasource(EXTRACT_PATH)
+    finally:
+        tu.set_workspace_root(None)
+        os.remove(EXTRACT_PATH)
+        shutil.rmtree('test_workspace')
+    assert workspaces == [] and failed_workspaces == []
+    assert COLUMN in saved.columns and failed_column not in saved.columns
+
+
 # del Datasource().<section>
 def test_delete_datasource_section():
     shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
@@ -161,6 +758,47 @@ def test_enforce_column():
     assert metadata.local_name == '[renamed_name]'
 
 
+# Datasource().enforce_columns()
+def test_enforce_columns():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    datasource = tu.Datasource(EXTRACT_PATH)
+    os.remove(EXTRACT_PATH)
+    columns = [
+        (tfo.Column(name='renamed_name', datatype='string', role='dimension', type='nominal'), 'A New Folder', 'NAME'),
+        (tfo.Column(name='ID', datatype='integer', role='dimension', type='ordinal'), 'tidy', 'ID'),
+        (tfo.Column(name='renamed_name', datatype='string', role='dimension', type='nominal'), 'neat', 'NAME'),
+        tfo.Column(name='Calculation_1', datatype='integer', role='measure', type='quantitative', calculation='1'),
+    ]
+    datasource.enforce_columns(columns)
+    # The same as enforcing each column in turn, before columns were enforced in one pass
+    assert [(c.name, c.datatype, c.type, c.calculation) for c in datasource.columns] == [
+        ('[CREATED_AT]', 'date', 'ordinal', None),
+        ('[ID]', 'integer', 'ordinal', None),
+        ('[NAME]', 'string', 'nominal', None),
+        ('[Number of Records]', 'integer', 'quantitative', '1'),
+        ('[QUANTITY]', 'integer', 'quantitative', None),
+        ('[__tableau_internal_object_id__].[Migrated Data]', 'table', 'quantitative', None),
+        ('[renamed_name]', 'string', 'nominal', None),
+        ('[Calculation_1]', 'integer', 'quantitative', '1'),
+    ]
+    assert [(f.name, [i.name for i in f.folder_item]) for f in datasource.folders_common.folder] == [
+        ('neat', ['[QUANTITY]', '[__tableau_internal_object_id__].[Migrated Data]', '[renamed_name]']),
+        ('tidy', ['[CREATED_AT]', '[ID]', '[NAME]']),
+        ('A New Folder', []),
+    ]
+    local_names = [('ID', '[ID]'), ('NAME', '[renamed_name]'), ('CREATED_AT', '[CREATED_AT]'), ('QUANTITY', '[QUANTITY]')]
+    for connection in [datasource.connection, datasource.extract.connection]:
+        assert [(m.remote_name, m.local_name) for m in connection.metadata_records] == local_names
+    assert [(c.key, c.value) for c in datasource.connection.cols] == [
+        ('[ID]', '[TEST_DATA_SOURCE].[ID]'),
+        ('[renamed_name]', '[TEST_DATA_SOURCE].[NAME]'),
+        ('[CREATED_AT]', '[TEST_DATA_SOURCE].[CREATED_AT]'),
+        ('[QUANTITY]', '[TEST_DATA_SOURCE].[QUANTITY]'),
+    ]
+    with pytest.raises(tu.TableauFileError):
+        datasource.enforce_columns([(tfo.Column(name='X', datatype='string', role='dimension', type='nominal'), None, 'X')])
+
+
 # Datasource().columns.add()
 def test_add_existing_column():
     shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
@@ -222,6 +860,61 @@ def test_delete_folder():
     assert not found_folder
 
 
+# Datasource().folders_common.folders_of()
+def test_folders_of_column():
+    shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
+    datasource = tu.Datasource(EXTRACT_PATH)
+    os.remove(EXTRACT_PATH)
+    folders_common = datasource.folders_common
+
+    def assert_index():
+        for folder in folders_common:
+            for folder_item in folder.folder_item:
+                expected = [f for f in folders_common if folder_item in f.folder_item]
+                assert [f.name for f in folders_common.folders_of(folder_item.name)] == [f.name for f in expected]
+
+    assert_index()
+    column_name = folders_common[0].folder_item[0].name
+    folders_common.add(tfo.Folder(name='Index Folder', folder_item=[tfo.FolderItem(name=column_name)]))
+    assert [f.name for f in folders_common.folders_of(column_name)] == [folders_common[0].name, 'Index Folder']
+    folders_common.delete_folder_item(folders_common[0], column_name)
+    assert folders_common.folder_of(column_name).name == 'Index Folder'
+    folders_common.update(tfo.Folder(name='Index Folder', folder_item=[tfo.FolderItem(name='[OTHER]')]))
+    assert folders_common.folder_of(column_name) is None
+    folders_common.add_folder_item('Index Folder', column_name)
+    assert_index()
+    # Folders changed directly are re-indexed
+    folders_common.get('Index Folder').folder_item.delete('[OTHER]')
+    folders_common[0].folder_item.append(tfo.FolderItem(name='[OTHER]'))
+    assert_index()
+    folders_common.delete('Index Folder')
+    assert folders_common.folder_of(column_name) is None
+    assert_index()
+    # Lookups don't rebuild the index, unless the folders changed since it was built
+    index = folders_common._column_index
+    folders_common.folders_of(column_name)
+    folders_common.add_folder_item(folders_common[1], column_name)
+    assert folders_common._column_index is index
+    folders_common[1].folder_item[-1].name = '[RENAMED]'
+    assert folders_common.folder_of('[RENAMED]') is folders_common[1] and folders_common._column_index is not index
+    folders_common[0].folder_item = tfo.TableauFileObjects([tfo.FolderItem(name='[REPLACED]')], tfo.FolderItem)
+    assert folders_common.folder_of('[REPLACED]') is folders_common[0]
+    new_folder = tfo.Folder(name='New', folder_item=[tfo.FolderItem(name='[NEW]')])
+    folders_common.folder = tfo.TableauFileObjects([new_folder], tfo.Folder)
+    assert folders_common.folder_of('[NEW]').name == 'New' and folders_common.folder_of('[REPLACED]') is None
+    assert_index()
+    # Lists that are garbage collected don't notify the folders
+    version = folders_common._folders_version
+    dropped = tfo.TableauFileObjects([tfo.FolderItem(name='[DROPPED]')], tfo.FolderItem)
+    dropped._watch(folders_common)
+    del dropped
+    assert folders_common._folders_version == version
+    # Copies are indexed on their own
+    copied = pickle.loads(pickle.dumps(folders_common))
+    copied.add_folder_item('New', '[COPIED]')
+    assert copied.folder_of('[COPIED]').name == 'New' and folders_common.folder_of('[COPIED]') is None
+
+
 # Datasource().columns.update()
 def test_update_column():
     shutil.copyfile(f'resources/{EXTRACT_PATH}', EXTRACT_PATH)
@@ -344,3 +1037,434 @@ def test_update_connection():
     assert ds_live.connection.named_connections['snowflake'].caption == connection.server
     assert ds_extract.connection['snowflake'].dbname == 'FAKE_DB'
     assert ds_live.connection['snowflake'].dbname == 'FAKE_DB'
+
+
+# SiteCatalog()
+def test_site_catalog():
+    tso = tu.tableau_server_objects
+
+    class StubGet:
+        def projects(self, top_level_only=True):
+            return [
+                tso.Project(id='p1', name='Finance'),
+                tso.Project(id='p2', name='Reports', parent_project_id='p1'),
+                tso.Project(id='p3', name='Archive', parent_project_id='p2'),
+                # A project of a parent that isn't listed, and projects that are each other's parent
+                tso.Project(id='p4', name='Orphan', parent_project_id='missing'),
+                tso.Project(id='p5', name='Loop', parent_project_id='p6'),
+                tso.Project(id='p6', name='Back', parent_project_id='p5'),
+                tso.Project(id='p7', name='Reports'),
+            ]
+
+        def datasources(self):
+            return [
+                tso.Datasource(id='d1', name='Sales', project_id='p2', project_name='Reports'),
+                tso.Datasource(id='d2', name='Sales', project_id='p7', project_name='Reports'),
+                tso.Datasource(id='d3', name='Costs', project_id='p1', project_name='Finance'),
+            ]
+
+        def users(self):
+            raise tu.TableauConnectionError('403: Forbidden')
+
+    class StubServer:
+        site = 'site-id'
+        get = StubGet()
+
+    catalog = tu.SiteCatalog(StubServer(), objects=('projects', 'datasources', 'users'))
+    assert catalog.project_path('p3') == 'Finance/Reports/Archive'
+    assert catalog.project(project_path='Finance/Reports').id == 'p2'
+    assert catalog.project(project_path=('Finance', 'Reports', 'Archive')).id == 'p3'
+    assert catalog.project(project_path='Reports').id == 'p7'
+    assert catalog.project(project_path='Finance/Missing') is None
+    assert catalog.project_path('p4') == 'Orphan'
+    # A cycle ends the path at the first project listed in it
+    assert catalog.project_path('p5') == 'Back/Loop' and catalog.project_path('p6') == 'Back'
+    assert catalog.project(project_name='Reports').id == 'p2'
+    assert catalog.datasource(datasource_id='d3').name == 'Costs'
+    assert catalog.datasource(datasource_name='Sales').id == 'd1'
+    assert catalog.datasource(datasource_name='Sales', project_name='Reports').id == 'd1'
+    assert catalog.datasource(datasource_name='Sales', project_path='Reports').id == 'd2'
+    assert catalog.datasource(datasource_name='Sales', project_path='Finance/Reports').id == 'd1'
+    assert catalog.datasource(datasource_name='Missing') is None
+    assert [d.id for d in catalog.all('datasources')] == ['d1', 'd2', 'd3']
+    # Objects that couldn't be listed are left out, so they're looked up on the server instead
+    assert catalog.includes('datasources') and not catalog.includes('users') and not catalog.includes('groups')
+    assert str(catalog.errors['users']) == '403: Forbidden'
+    with pytest.raises(tu.TableauConnectionError):
+        catalog.user(user_name='Someone')
+    with pytest.raises(tu.TableauConnectionError):
+        catalog.group(group_name='Everyone')
+
+
+# filter_expression()
+def test_filter_expression():
+    from tableau_utilities.tableau_server.static import filter_expression
+    assert filter_expression(name='Sales', projectName='Finance') == 'name:eq:Sales,projectName:eq:Finance'
+    # Values are URL encoded, including the characters that separate filters and their parts
+    assert filter_expression(name='Sales & Costs: 2024/Q1') == 'name:eq:Sales%20%26%20Costs%3A%202024%2FQ1'
+    assert filter_expression(name='Ventes à Paris') == 'name:eq:Ventes%20%C3%A0%20Paris'
+    # Fields without a value are not filtered on
+    assert filter_expression(name='Sales', projectName=None) == 'name:eq:Sales'
+    assert filter_expression(name=None) is None
+    # Values with a comma can't be filtered on
+    assert filter_expression(name='Sales, Costs', projectName='Finance') is None
+
+
+def datasource_page(url, total=1):
+    """ Returns: A page of datasources, with the ID of each being its position in the listing """
+    params = dict(p.split('=', 1) for p in url.split('?', 1)[1].split('&'))
+    page_size, page = int(params['pageSize']), int(params['pageNumber'])
+    ids = range((page - 1) * page_size, min(page * page_size, total))
+    datasources = [{'id': str(i), 'name': 'Sales', 'project': {'id': 'p1', 'name': 'Finance'}} for i in ids]
+    return {'pagination': {'totalAvailable': str(total)}, 'datasources': {'datasource': datasources}}
+
+
+class StubGet(Get):
+    """ A Get, with each request answered by the respond function, instead of the server """
+    def __init__(self, respond, page_size=100, max_workers=2):
+        parent = SimpleNamespace(
+            session=None, user=None, _pw=None, _personal_access_token_secret=None,
+            personal_access_token_name=None, host='https://tableau', site='site-id', api=3.18, _auth_token=None,
+            url='https://tableau/sites/site-id', page_size=page_size, max_workers=max_workers, catalog=None
+        )
+        super().__init__(parent)
+        self.respond = respond
+        self.urls = list()
+
+    def _get(self, url, headers=None, **params):
+        self.urls.append(url)
+        return self.respond(url)
+
+
+# Get().datasource(datasource_name=..., datasource_project=...)
+def test_get_filter_fallback():
+    def respond(error):
+        def _respond(url):
+            if 'filter=' in url and error:
+                raise error
+            return datasource_page(url)
+        return _respond
+
+    # Filtered on the server
+    get = StubGet(respond(None))
+    assert get.datasource(datasource_name='Sales', datasource_project='Finance').id == '0'
+    assert len(get.urls) == 1 and 'filter=name:eq:Sales,projectName:eq:Finance' in get.urls[0]
+    # A rejected filter is retried without it
+    get = StubGet(respond(tu.TableauConnectionError('Bad Request', status_code=400, code='400065')))
+    assert get.datasource(datasource_name='Sales', datasource_project='Finance').id == '0'
+    assert len(get.urls) == 2 and 'filter=' not in get.urls[1]
+    # Other errors are raised
+    for error in [tu.TableauConnectionError('Unauthorized', status_code=401), tu.TableauConnectionError('Offline')]:
+        get = StubGet(respond(error))
+        with pytest.raises(tu.TableauConnectionError):
+            get.datasource(datasource_name='Sales', datasource_project='Finance')
+        assert len(get.urls) == 1
+
+
+# Get().project()
+def test_get_project():
+    projects = [
+        {'id': 'p1', 'name': 'Finance'},
+        {'id': 'p2', 'name': 'Reports', 'parentProjectId': 'p1'},
+        {'id': 'p3', 'name': 'Reports', 'parentProjectId': 'p2'},
+    ]
+
+    def respond(url):
+        return {'pagination': {'totalAvailable': str(len(projects))}, 'projects': {'project': projects}}
+
+    # Nested projects are found by ID, as well as top level projects
+    get = StubGet(respond)
+    assert get.project(project_id='p1').name == 'Finance'
+    assert get.project(project_id='p3').parent_project_id == 'p2'
+    assert get.project(project_id='p4') is None
+    assert [p.id for p in get.projects()] == ['p1']
+    # By name, the first project with the name; or the one within the parent project
+    assert get.project(project_name='Reports').id == 'p2'
+    assert get.project(project_name='Reports', parent_project_id='p2').id == 'p3'
+
+
+# Get().datasources()
+def test_get_objects_pager():
+    def respond(total, failing_page=None):
+        def _respond(url):
+            page = int(url.split('pageNumber=')[1])
+            # Later pages respond sooner, so pages complete out of order
+            sleep(0.001 * (10 - page % 10))
+            if page == failing_page:
+                raise tu.TableauConnectionError('Service Unavailable', status_code=503)
+            return datasource_page(url, total)
+        return _respond
+
+    # Objects are yielded in order, as pages are fetched concurrently
+    get = StubGet(respond(250), page_size=10, max_workers=4)
+    assert [d.id for d in get.datasources()] == [str(i) for i in range(250)]
+    assert len(get.urls) == 25
+    # Without objects, only the first page is requested
+    get = StubGet(respond(0), page_size=10, max_workers=4)
+    assert list(get.datasources()) == [] and len(get.urls) == 1
+    # An error fetching a page is raised, once the objects of the pages before it are yielded
+    get = StubGet(respond(250, failing_page=7), page_size=10, max_workers=4)
+    datasources = get.datasources()
+    ids = [next(datasources).id for _ in range(60)]
+    with pytest.raises(tu.TableauConnectionError):
+        next(datasources)
+    assert ids == [str(i) for i in range(60)]
+    # Pages that aren't fetched yet are cancelled, when the objects stop being consumed
+    get = StubGet(respond(1000), page_size=10, max_workers=4)
+    datasources = get.datasources()
+    assert [next(datasources).id for _ in range(15)] == [str(i) for i in range(15)]
+    datasources.close()
+    requested = len(get.urls)
+    sleep(0.05)
+    assert requested == len(get.urls) and requested <= 2 + 4 * 2
+    # Workers must be at least 1
+    with pytest.raises(tu.TableauConnectionError):
+        tu.TableauServer('https://tableau', 'site', max_workers=0)
+
+
+class StubResponse:
+    """ An aiohttp ClientResponse, given by a StubSession """
+    def __init__(self, url, body, status=200, filename=None):
+        self.url = url
+        self.body = body
+        self.status = status
+        self.reason = 'OK' if status < 400 else 'Error'
+        self.content_disposition = SimpleNamespace(filename=filename)
+        self.content = SimpleNamespace(iter_chunked=self.__iter_chunked)
+
+    async def json(self, content_type=None):
+        return self.body
+
+    async def __iter_chunked(self, size):
+        for i in range(0, len(self.body), size):
+            yield self.body[i:i + size]
+
+
+class StubSession:
+    """ An aiohttp ClientSession, with each request answered by the respond coroutine, instead of the server """
+    def __init__(self, respond, headers=None):
+        self.respond = respond
+        self.headers = dict(headers or {})
+        self.requests = list()
+        self.closed = False
+
+    @asynccontextmanager
+    async def request(self, method, url, headers=None, **params):
+        self.requests.append((method, url, params))
+        response = await self.respond(method, url, params)
+        yield response if isinstance(response, StubResponse) else StubResponse(url, response)
+
+    def get(self, url):
+        return self.request('GET', url)
+
+    async def close(self):
+        self.closed = True
+
+
+def stub_async_server(respond, page_size=100, connection_limit=2):
+    """ Returns: The attributes of a signed in AsyncTableauServer, with a StubSession answering its requests """
+    server = SimpleNamespace(
+        session=StubSession(respond), user=None, _pw=None, _personal_access_token_secret=None,
+        personal_access_token_name=None, host='https://tableau', site='site-id', api=3.18, _auth_token=None,
+        url='https://tableau/sites/site-id', page_size=page_size, connection_limit=connection_limit
+    )
+    server.get = AsyncGet(server)
+    return server
+
+
+# AsyncTableauServer().sign_in() / sign_out()
+def test_async_sign_in(monkeypatch):
+    aiohttp = pytest.importorskip('aiohttp')
+    sessions = list()
+
+    async def respond(method, url, params):
+        if url.endswith('/auth/signin'):
+            if params['json']['credentials']['password'] != 'secret':
+                return StubResponse(url, {'error': {'code': '401001', 'summary': 'Signin Error'}}, status=401)
+            return {'credentials': {'token': 'token', 'site': {'id': 'site-id'}}}
+        return {}
+
+    def client_session(connector, headers):
+        sessions.append(StubSession(respond, headers))
+        sessions[-1].connector = connector
+        return sessions[-1]
+
+    monkeypatch.setattr(aiohttp, 'ClientSession', client_session)
+    monkeypatch.setattr(aiohttp, 'TCPConnector', lambda limit: SimpleNamespace(limit=limit))
+
+    async def sign_in_and_out():
+        async with tu.AsyncTableauServer('https://tableau', 'site', 'user', 'secret', connection_limit=4) as ts:
+            assert ts.url == 'https://tableau/api/3.18/sites/site-id'
+            assert ts.session.headers['x-tableau-auth'] == 'token'
+            assert ts.get.session is ts.session and ts.publish.get is ts.get
+
+    asyncio.run(sign_in_and_out())
+    assert [(method, url) for method, url, _ in sessions[0].requests] == [
+        ('POST', 'https://tableau/api/3.18/auth/signin'), ('POST', 'https://tableau/api/3.18/auth/signout')
+    ]
+    assert sessions[0].requests[0][2]['json']['credentials']['site'] == {'contentUrl': 'site'}
+    assert sessions[0].connector.limit == 4 and sessions[0].closed
+    # The session is closed if signing in fails
+    with pytest.raises(tu.TableauConnectionError):
+        asyncio.run(tu.AsyncTableauServer('https://tableau', 'site', 'user', 'wrong').sign_in())
+    assert len(sessions) == 2 and sessions[1].closed
+    # Without credentials, no session is opened
+    with pytest.raises(tu.TableauConnectionError):
+        asyncio.run(tu.AsyncTableauServer('https://tableau', 'site').sign_in())
+    assert len(sessions) == 2
+
+
+# AsyncGet().datasource(datasource_name=..., datasource_project=...)
+def test_async_get_filter_fallback():
+    pytest.importorskip('aiohttp')
+
+    def respond(status):
+        async def _respond(method, url, params):
+            if 'filter=' in url and status:
+                return StubResponse(url, {'error': {'code': f'{status}065'}}, status=status)
+            return datasource_page(url)
+        return _respond
+
+    def find(server):
+        datasource = asyncio.run(server.get.datasource(datasource_name='Sales', datasource_project='Finance'))
+        return datasource, [url for _, url, _ in server.session.requests]
+
+    # Filtered on the server
+    datasource, urls = find(stub_async_server(respond(None)))
+    assert datasource.id == '0'
+    assert len(urls) == 1 and 'filter=name:eq:Sales,projectName:eq:Finance' in urls[0]
+    # A rejected filter is retried without it
+    datasource, urls = find(stub_async_server(respond(400)))
+    assert datasource.id == '0'
+    assert len(urls) == 2 and 'filter=' not in urls[1]
+    # Other errors are raised
+    for status in [401, 403]:
+        server = stub_async_server(respond(status))
+        with pytest.raises(tu.TableauConnectionError):
+            find(server)
+        assert len(server.session.requests) == 1
+
+
+# AsyncGet().datasources()
+def test_async_get_objects_pager():
+    pytest.importorskip('aiohttp')
+
+    def respond(total, failing_page=None):
+        async def _respond(method, url, params):
+            page = int(url.split('pageNumber=')[1])
+            # Later pages respond sooner, so pages complete out of order
+            await asyncio.sleep(0.001 * (10 - page % 10))
+            if page == failing_page:
+                return StubResponse(url, {'error': {'code': '503000'}}, status=503)
+            return datasource_page(url, total)
+        return _respond
+
+    def slow_after_second_page(completed):
+        async def _respond(method, url, params):
+            page = int(url.split('pageNumber=')[1])
+            await asyncio.sleep(0 if page <= 2 else 0.02)
+            response = datasource_page(url, 1000)
+            for d in response['datasources']['datasource']:
+                d['name'] = f"Sales {d['id']}"
+            completed.append(page)
+            return response
+        return _respond
+
+    async def ids(server, count=None):
+        datasources = server.get.datasources()
+        consumed = list()
+        try:
+            async for d in datasources:
+                consumed.append(d.id)
+                if len(consumed) == count:
+                    break
+        finally:
+            await datasources.aclose()
+        # Pages still being fetched would complete while sleeping
+        await asyncio.sleep(0.05)
+        return consumed
+
+    # Objects are yielded in order, as pages are fetched concurrently
+    server = stub_async_server(respond(250), page_size=10, connection_limit=4)
+    assert asyncio.run(ids(server)) == [str(i) for i in range(250)]
+    assert len(server.session.requests) == 25
+    # Without objects, only the first page is requested
+    server = stub_async_server(respond(0), page_size=10, connection_limit=4)
+    assert asyncio.run(ids(server)) == [] and len(server.session.requests) == 1
+    # An error fetching a page is raised, once the objects of the pages before it are yielded
+    server = stub_async_server(respond(250, failing_page=7), page_size=10, connection_limit=4)
+    consumed = list()
+
+    async def consume_until_error():
+        async for d in server.get.datasources():
+            consumed.append(d.id)
+
+    with pytest.raises(tu.TableauConnectionError):
+        asyncio.run(consume_until_error())
+    assert consumed == [str(i) for i in range(60)]
+    # Pages that aren't fetched yet are cancelled, when the objects stop being consumed
+    completed = list()
+    server = stub_async_server(slow_after_second_page(completed), page_size=10, connection_limit=4)
+    assert asyncio.run(ids(server, 15)) == [str(i) for i in range(15)]
+    assert completed == [1, 2] and len(server.session.requests) <= 1 + 4
+    # Or once an object being found matches
+    completed = list()
+    server = stub_async_server(slow_after_second_page(completed), page_size=10, connection_limit=4)
+
+    async def find():
+        datasource = await server.get.datasource(datasource_name='Sales 15', datasource_project='Finance')
+        # The pages are cancelled before the datasource is returned; Task.cancelling() is new in Python 3.11
+        if sys.version_info >= (3, 11):
+            pages = asyncio.all_tasks() - {asyncio.current_task()}
+            assert pages and all(page.cancelling() for page in pages)
+        await asyncio.sleep(0.05)
+        return datasource
+
+    assert asyncio.run(find()).id == '15'
+    assert completed == [1, 2] and len(server.session.requests) <= 1 + 4
+
+
+# AsyncPublish().datasource() / AsyncDownload().datasource()
+def test_async_upload_and_download():
+    pytest.importorskip('aiohttp')
+    mb = 1024 ** 2
+    data = os.urandom(int(2.5 * mb))
+    datasource = {'id': 'd1', 'name': 'Sales', 'project': {'id': 'p1', 'name': 'Finance'}}
+
+    async def respond(method, url, params):
+        if url.endswith('/fileUploads'):
+            return {'fileUpload': {'uploadSessionId': 'u1'}}
+        if '/content?' in url:
+            if '/d1/' not in url:
+                return StubResponse(url, b'', status=404)
+            return StubResponse(url, data, filename='Sales.tdsx')
+        if method == 'GET' or url.split('?')[0].endswith('/datasources'):
+            return {'datasource': dict(datasource)}
+        return {}
+
+    server = stub_async_server(respond)
+    publish, download = AsyncPublish(server), AsyncDownload(server)
+    with open('test_async_upload.tdsx', 'wb') as f:
+        f.write(data)
+    try:
+        # Files are uploaded in chunks, each in its own request
+        upload_session_id = asyncio.run(publish._AsyncPublish__upload_in_chunks('test_async_upload.tdsx', 1))
+        puts = [(url, params) for method, url, params in server.session.requests if method == 'PUT']
+        assert upload_session_id == 'u1' and len(puts) == 3
+        for i, (url, params) in enumerate(puts):
+            assert url.endswith('/fileUploads/u1') and data[i * mb:(i + 1) * mb] in params['data']
+        # Smaller files are published in one request
+        server.session.requests.clear()
+        published = asyncio.run(publish.datasource('test_async_upload.tdsx', datasource_id='d1'))
+        method, url, params = server.session.requests[-1]
+        assert len(server.session.requests) == 2 and published.id == 'd1'
+        assert method == 'POST' and 'datasourceType=tdsx' in url and data in params['data']
+        # Downloads are written in chunks
+        path = asyncio.run(download.datasource('d1', file_dir='test_async_download'))
+        with open(path, 'rb') as f:
+            assert path == os.path.abspath('test_async_download/Sales.tdsx') and f.read() == data
+        with pytest.raises(tu.TableauConnectionError):
+            asyncio.run(download.datasource('d2', file_dir='test_async_download'))
+    finally:
+        os.remove('test_async_upload.tdsx')
+        shutil.rmtree('test_async_download', ignore_errors=True)